@@ -1,10 +1,10 @@
 from django.contrib import admin
-from .models import Interview, InterviewFeedback, OfficeLocation
+from .models import Interview, InterviewFeedback, InterviewReminder, OfficeLocation
 
 
 @admin.register(OfficeLocation)
 class OfficeLocationAdmin(admin.ModelAdmin):
-    list_display = ['name', 'city', 'isActive', 'createdAt']
+    list_display = ['name', 'city', 'capacity', 'openingTime', 'closingTime', 'isActive', 'createdAt']
     list_filter = ['isActive', 'city', 'createdAt']
     search_fields = ['name', 'city', 'address']
     readonly_fields = ['createdAt']
@@ -19,6 +19,15 @@ class InterviewAdmin(admin.ModelAdmin):
     date_hierarchy = 'date'
 
 
+@admin.register(InterviewReminder)
+class InterviewReminderAdmin(admin.ModelAdmin):
+    list_display = ['interview', 'recipient', 'leadHours', 'scheduledFor', 'createdAt']
+    list_filter = ['leadHours', 'createdAt']
+    search_fields = ['recipient__fullName', 'recipient__email']
+    raw_id_fields = ['interview', 'recipient']
+    readonly_fields = ['runId', 'createdAt']
+
+
 @admin.register(InterviewFeedback)
 class InterviewFeedbackAdmin(admin.ModelAdmin):
     list_display = ['interview', 'rating', 'wouldHireAgain', 'createdAt']
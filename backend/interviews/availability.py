@@ -0,0 +1,147 @@
+"""
+Interview slot availability per office location
+Bookings for the whole requested range are read in one query on the
+(date, time) index, then each day is swept in memory: interview start and
+end times become +1/-1 events, and every slot is checked against the
+occupancy they produce
+"""
+
+from collections import defaultdict
+from datetime import timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .models import Interview
+
+
+# Interviews in these states occupy their slot
+BLOCKING_STATUSES = ('pending', 'confirmed', 'rescheduled')
+# Longest range one availability request may cover
+MAX_RANGE_DAYS = 62
+
+
+def parse_date_range(params, default_days=7):
+    """
+    Read the from/to query parameters, defaulting to a week from today
+
+    Raises:
+        ValueError: With a message for the client if the range is invalid
+    """
+    invalid = ValueError('from and to must be dates in YYYY-MM-DD format')
+    try:
+        start = parse_date(params['from']) if params.get('from') else timezone.localdate()
+        if start is None:
+            raise invalid
+        end = parse_date(params['to']) if params.get('to') else start + timedelta(days=default_days - 1)
+    except ValueError:
+        # parse_date also raises ValueError for well-formed but impossible dates
+        raise invalid
+    if end is None:
+        raise invalid
+    if end < start:
+        raise ValueError('to must not be before from')
+    if (end - start).days >= MAX_RANGE_DAYS:
+        raise ValueError(f'Ranges are limited to {MAX_RANGE_DAYS} days')
+    return start, end
+
+
+def to_minutes(value):
+    """Minutes since midnight of a time"""
+    return value.hour * 60 + value.minute
+
+
+def format_minutes(minutes):
+    return f'{minutes // 60:02d}:{minutes % 60:02d}'
+
+
+def occupancy_segments(starts, duration):
+    """
+    Sweep interview start times into segments of constant occupancy
+
+    Args:
+        starts: Start minutes of the day's interviews, in any order
+        duration: Length of each interview in minutes
+
+    Returns:
+        Sorted (from_minute, to_minute, count) tuples for every busy stretch
+    """
+    # Ends sort before starts at the same minute, so back-to-back interviews do not overlap
+    events = sorted([(start, 1) for start in starts] + [(start + duration, -1) for start in starts])
+    segments = []
+    count = 0
+    previous = None
+    for point, delta in events:
+        if count and point > previous:
+            segments.append((previous, point, count))
+        count += delta
+        previous = point
+    return segments
+
+
+def day_slots(office, starts, after=None):
+    """
+    Slots of one opening day with the number of places left in each
+
+    Args:
+        office: OfficeLocation
+        starts: Start minutes of the interviews booked at the office that day
+        after: Only return slots starting later than this minute
+    """
+    length = office.slotMinutes
+    opening = to_minutes(office.openingTime)
+    closing = to_minutes(office.closingTime)
+    segments = occupancy_segments(starts, length)
+
+    slots = []
+    index = 0
+    for start in range(opening, closing - length + 1, length):
+        end = start + length
+        # Slots and segments are both sorted, so segments ending before this slot are never needed again
+        while index < len(segments) and segments[index][1] <= start:
+            index += 1
+        busy = 0
+        probe = index
+        while probe < len(segments) and segments[probe][0] < end:
+            busy = max(busy, segments[probe][2])
+            probe += 1
+
+        if after is not None and start <= after:
+            continue
+        slots.append({
+            'time': format_minutes(start),
+            'available': max(office.capacity - busy, 0),
+        })
+    return slots
+
+
+def office_availability(office, start_date, end_date, now=None):
+    """
+    Availability of an office for every day from start_date to end_date
+
+    Returns:
+        A list of {'date', 'open', 'slots'} dicts, one per day; past slots
+        are left out
+    """
+    now = timezone.localtime(now)
+    bookings = defaultdict(list)
+    rows = Interview.objects.filter(
+        officeLocation=office,
+        date__gte=start_date,
+        date__lte=end_date,
+        status__in=BLOCKING_STATUSES
+    ).order_by().values_list('date', 'time')
+    for day, start in rows:
+        bookings[day].append(to_minutes(start))
+
+    days = []
+    day = start_date
+    while day <= end_date:
+        is_open = office.is_open_on(day)
+        slots = []
+        if is_open and day >= now.date():
+            after = to_minutes(now) if day == now.date() else None
+            slots = day_slots(office, bookings[day], after=after)
+        days.append({'date': day.isoformat(), 'open': is_open, 'slots': slots})
+        day += timedelta(days=1)
+    return days
@@ -0,0 +1,213 @@
+"""
+Double-booking prevention for interviews
+A booking locks the employer, provider and office rows before looking for
+overlapping interviews, so concurrent requests involving any of them are
+checked and inserted one after the other instead of both seeing a free slot
+"""
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Q
+
+from users.models import User
+from .availability import BLOCKING_STATUSES, occupancy_segments, to_minutes
+from .calendar import DEFAULT_INTERVIEW_MINUTES
+from .models import Interview, OfficeLocation
+
+
+# Most interviews one bulk booking request may create
+MAX_BULK_INTERVIEWS = 100
+
+
+class BookingConflict(Exception):
+    """The requested slot overlaps an existing booking"""
+
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+
+
+def check_office_hours(office, date, time):
+    """
+    Error message if an interview at office on date/time falls outside its
+    opening hours, else None
+    """
+    if not office.is_open_on(date):
+        return f'{office.name} is closed on {date.strftime("%A")}s'
+    start = to_minutes(time)
+    if start < to_minutes(office.openingTime) or start + office.slotMinutes > to_minutes(office.closingTime):
+        return (
+            f'{office.name} takes interviews between '
+            f'{office.openingTime.strftime("%H:%M")} and {office.closingTime.strftime("%H:%M")}'
+        )
+    return None
+
+
+def lock_rows(user_ids, office_ids):
+    """
+    Lock the user and office rows bookings of these participants go through
+
+    Must run inside a transaction. Users are locked in primary key order and
+    always before the offices, which are locked in primary key order too, so
+    two bookings can never wait on each other.
+
+    Returns:
+        ({user_id: userType}, {office_id: OfficeLocation}) of the rows that exist
+    """
+    users = dict(
+        User.objects.select_for_update()
+        .filter(pk__in=user_ids)
+        .order_by('pk')
+        .values_list('pk', 'userType')
+    )
+    offices = {
+        office.pk: office
+        for office in OfficeLocation.objects.select_for_update().filter(pk__in=office_ids).order_by('pk')
+    }
+    return users, offices
+
+
+def lock_participants(employer_id, provider_id, office_id):
+    """
+    Lock the rows every booking of these participants goes through
+
+    Returns:
+        The locked OfficeLocation, or None if it does not exist
+    """
+    return lock_rows({employer_id, provider_id}, {office_id})[1].get(office_id)
+
+
+def find_conflict(office, time, employer_id, provider_id, bookings):
+    """
+    Why a slot clashes with the bookings of its day, or None if it is free
+
+    Args:
+        office: OfficeLocation of the slot, or None to only check the participants
+        bookings: (employer_id, provider_id, office_id, start_minute, slot_minutes)
+            of the blocking interviews on the same date
+    """
+    length = office.slotMinutes if office else DEFAULT_INTERVIEW_MINUTES
+    start = to_minutes(time)
+    end = start + length
+
+    office_starts = []
+    for other_employer, other_provider, other_office, other_start, other_length in bookings:
+        other_end = other_start + (other_length or length)
+        if other_start >= end or other_end <= start:
+            continue
+        if other_provider == provider_id:
+            return 'The provider already has an interview at this time'
+        if other_employer == employer_id:
+            return 'The employer already has an interview at this time'
+        if office and other_office == office.id:
+            office_starts.append(other_start)
+
+    if office is None:
+        return None
+    for segment_start, segment_end, count in occupancy_segments(office_starts, office.slotMinutes):
+        if segment_start < end and segment_end > start and count >= office.capacity:
+            return f'{office.name} has no free interview rooms at {time.strftime("%H:%M")}'
+    return None
+
+
+def blocking_bookings(dates, employer_ids, provider_ids, office_ids):
+    """
+    Blocking interviews on dates involving any of the participants
+
+    Returns:
+        {date: [(interview_id, (employer_id, provider_id, office_id, start_minute, slot_minutes)), ...]}
+    """
+    bookings = defaultdict(list)
+    rows = Interview.objects.filter(date__in=dates, status__in=BLOCKING_STATUSES).filter(
+        Q(employer_id__in=employer_ids) | Q(provider_id__in=provider_ids) | Q(officeLocation_id__in=office_ids)
+    ).order_by().values_list(
+        'pk', 'date', 'employer_id', 'provider_id', 'officeLocation_id', 'time', 'officeLocation__slotMinutes'
+    )
+    for pk, date, employer_id, provider_id, office_id, time, length in rows:
+        bookings[date].append((pk, (employer_id, provider_id, office_id, to_minutes(time), length)))
+    return bookings
+
+
+def ensure_slot_available(office, date, time, employer_id, provider_id, exclude_id=None):
+    """
+    Raise BookingConflict if the slot clashes with another booking
+
+    The provider and the employer may only be in one interview at a time,
+    and the office (if any) may not hold more interviews at once than its
+    capacity. Call inside the transaction that saves the interview, after
+    lock_participants().
+    """
+    bookings = blocking_bookings([date], [employer_id], [provider_id], [office.id] if office else [])[date]
+    message = find_conflict(
+        office, time, employer_id, provider_id,
+        [booking for pk, booking in bookings if pk != exclude_id]
+    )
+    if message:
+        raise BookingConflict(message)
+
+
+def book_many(employer, items):
+    """
+    Book many interviews for one employer in a single transaction
+
+    All participants are locked at once and their existing bookings read in
+    one query; each item is then checked against those and the items
+    accepted before it, and the accepted ones are inserted with bulk_create.
+
+    Args:
+        items: (key, data) pairs, data holding provider_id, officeLocation_id,
+            date, time and optionally notes
+
+    Returns:
+        ({key: Interview} of created interviews, {key: (reason, errors)} of
+        rejected items, reason being 'invalid' or 'conflict' and errors a
+        serializer style {field: [message]} dict)
+    """
+    rejected = {}
+    accepted = []
+    with transaction.atomic():
+        users, offices = lock_rows(
+            {employer.id} | {data['provider_id'] for key, data in items},
+            {data['officeLocation_id'] for key, data in items}
+        )
+        bookings = blocking_bookings(
+            {data['date'] for key, data in items}, [employer.id],
+            [user_id for user_id, user_type in users.items() if user_type == 'provider'],
+            list(offices)
+        )
+
+        for key, data in items:
+            provider_id = data['provider_id']
+            office = offices.get(data['officeLocation_id'])
+            if users.get(provider_id) != 'provider':
+                rejected[key] = ('invalid', {'provider_id': ['Provider not found']})
+                continue
+            if office is None or not office.isActive:
+                rejected[key] = ('invalid', {'officeLocation_id': ['Office location not found']})
+                continue
+            hours_error = check_office_hours(office, data['date'], data['time'])
+            if hours_error:
+                rejected[key] = ('invalid', {'time': [hours_error]})
+                continue
+            day = bookings[data['date']]
+            message = find_conflict(
+                office, data['time'], employer.id, provider_id, [booking for pk, booking in day]
+            )
+            if message:
+                rejected[key] = ('conflict', {'non_field_errors': [message]})
+                continue
+
+            day.append((None, (employer.id, provider_id, office.id, to_minutes(data['time']), office.slotMinutes)))
+            accepted.append((key, Interview(
+                employer=employer,
+                provider_id=provider_id,
+                date=data['date'],
+                time=data['time'],
+                officeLocation=office,
+                notes=data.get('notes', ''),
+                status='pending'
+            )))
+
+        Interview.objects.bulk_create([interview for key, interview in accepted])
+    return dict(accepted), rejected
@@ -0,0 +1,116 @@
+"""
+Provider availability calendars
+Each provider's weekly working-hours template is laid over the requested
+dates and their booked interviews are cut out of it, giving free and busy
+intervals per day. All providers of a request share one settings query and
+one interview query
+"""
+
+from collections import defaultdict
+from datetime import timedelta
+
+from django.utils import timezone
+
+from users.working_hours import get_weekly_templates
+from .availability import BLOCKING_STATUSES, format_minutes, to_minutes
+from .models import Interview
+
+
+# Most providers shown by one bulk availability request
+MAX_BULK_PROVIDERS = 100
+# Length of an interview whose office is unknown (OfficeLocation.slotMinutes default)
+DEFAULT_INTERVIEW_MINUTES = 60
+
+
+def merge_intervals(intervals):
+    """Sorted, non-overlapping union of (start, end) intervals"""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_intervals(window, busy):
+    """Parts of the (start, end) window not covered by the merged busy intervals"""
+    start, end = window
+    free = []
+    cursor = start
+    for busy_start, busy_end in busy:
+        if busy_end <= cursor:
+            continue
+        if busy_start >= end:
+            break
+        if busy_start > cursor:
+            free.append((cursor, busy_start))
+        cursor = busy_end
+    if cursor < end:
+        free.append((cursor, end))
+    return free
+
+
+def is_free(day, start, end):
+    """Whether a calendar day has a free interval covering start to end (minutes)"""
+    return any(free_start <= start and end <= free_end for free_start, free_end in day['free'])
+
+
+def serialize_day(day):
+    """Calendar day with its intervals as HH:MM strings"""
+    return {
+        **day,
+        'free': [{'start': format_minutes(start), 'end': format_minutes(end)} for start, end in day['free']],
+        'busy': [{'start': format_minutes(start), 'end': format_minutes(end)} for start, end in day['busy']],
+    }
+
+
+def provider_calendars(user_ids, start_date, end_date, now=None):
+    """
+    Free and busy intervals of each provider for every day in a range
+
+    Args:
+        user_ids: User ids of the providers
+        start_date, end_date: First and last day, inclusive
+
+    Returns:
+        {user_id: [{'date', 'working', 'free', 'busy'}, ...]} with intervals
+        as (start_minute, end_minute) tuples; time already passed today is
+        never free
+    """
+    templates = get_weekly_templates(user_ids)
+
+    busy = defaultdict(list)
+    rows = Interview.objects.filter(
+        provider_id__in=user_ids,
+        date__gte=start_date,
+        date__lte=end_date,
+        status__in=BLOCKING_STATUSES
+    ).order_by().values_list('provider_id', 'date', 'time', 'officeLocation__slotMinutes')
+    for provider_id, day, start, length in rows:
+        begin = to_minutes(start)
+        busy[provider_id, day].append((begin, begin + (length or DEFAULT_INTERVIEW_MINUTES)))
+
+    now = timezone.localtime(now)
+    calendars = {}
+    for user_id in user_ids:
+        days = []
+        day = start_date
+        while day <= end_date:
+            window = templates[user_id][day.weekday()]
+            day_busy = merge_intervals(busy[user_id, day])
+            free = []
+            if window is not None and day >= now.date():
+                if day == now.date():
+                    window = (max(window[0], to_minutes(now)), window[1])
+                if window[0] < window[1]:
+                    free = subtract_intervals(window, day_busy)
+            days.append({
+                'date': day.isoformat(),
+                'working': window is not None,
+                'free': free,
+                'busy': day_busy,
+            })
+            day += timedelta(days=1)
+        calendars[user_id] = days
+    return calendars
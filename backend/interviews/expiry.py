@@ -0,0 +1,78 @@
+"""
+Expiry of past-due interviews
+Requests nobody confirmed before their start time become 'expired', and
+confirmed interviews the employer never marked completed become 'no_show'
+after a grace period. Rows move in chunks of set-based UPDATEs, so open
+interviews do not pile up in the (provider, status) and (employer, status)
+ranges every interview list reads
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from notifications.email_service import EmailService
+from .models import Interview
+
+
+logger = logging.getLogger('riderspool.interviews')
+
+
+def started_before(cutoff):
+    """Interviews starting no later than cutoff (a naive local datetime)"""
+    return Interview.objects.filter(Q(date__lt=cutoff.date()) | Q(date=cutoff.date(), time__lte=cutoff.time()))
+
+
+def transition_past_due(from_statuses, to_status, cutoff, chunk_size=1000, notify=True):
+    """
+    Move interviews in from_statuses that started before cutoff to to_status
+
+    Each chunk is one UPDATE that re-checks the status, so an interview
+    confirmed or cancelled meanwhile is left alone. Both parties of every
+    moved interview are emailed per chunk.
+
+    Returns:
+        Number of interviews moved
+    """
+    moved_total = 0
+    while True:
+        ids = list(
+            started_before(cutoff).filter(status__in=from_statuses)
+            .order_by().values_list('pk', flat=True)[:chunk_size]
+        )
+        if not ids:
+            return moved_total
+
+        stamp = timezone.now()
+        Interview.objects.filter(pk__in=ids, status__in=from_statuses).update(status=to_status, updatedAt=stamp)
+        moved = list(
+            Interview.objects.filter(pk__in=ids, status=to_status, updatedAt=stamp)
+            .select_related('employer', 'provider', 'officeLocation')
+        )
+        moved_total += len(moved)
+        if notify and moved:
+            try:
+                EmailService.send_interview_expired_emails(moved)
+            except Exception:
+                logger.exception('Failed to send interview expiry emails')
+
+
+def expire_interviews(now=None, chunk_size=1000, notify=True):
+    """
+    Expire unconfirmed requests and mark unfinished confirmed interviews as no-shows
+
+    Returns:
+        (expired_count, no_show_count)
+    """
+    now = timezone.localtime(now).replace(tzinfo=None)
+    expired = transition_past_due(
+        ('pending', 'rescheduled'), 'expired', now, chunk_size=chunk_size, notify=notify
+    )
+    no_show = transition_past_due(
+        ('confirmed',), 'no_show', now - timedelta(hours=settings.INTERVIEW_NO_SHOW_GRACE_HOURS),
+        chunk_size=chunk_size, notify=notify
+    )
+    return expired, no_show
@@ -0,0 +1,168 @@
+"""
+iCalendar feed of a user's interviews
+Calendar apps subscribe to a secret per-user URL and poll it with
+conditional GETs. The ETag and Last-Modified headers come from one
+aggregate over the user's interviews and the offices and participants the
+events show, so an unchanged calendar is answered
+with 304 without building the feed; otherwise events are streamed as the
+rows are read
+"""
+
+import hashlib
+import secrets
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db.models import Count, Max, Q
+from django.http import Http404, StreamingHttpResponse
+from django.utils import timezone
+from django.views.decorators.http import condition, require_safe
+
+from users.models import UserSettings
+from .models import Interview
+
+
+# Interviews older than this are left out of the feed
+FEED_HISTORY = timedelta(days=90)
+# Length of an interview whose office is unknown (OfficeLocation.slotMinutes default)
+DEFAULT_INTERVIEW_MINUTES = 60
+
+EVENT_STATUS = {
+    'pending': 'TENTATIVE',
+    'rescheduled': 'TENTATIVE',
+    'confirmed': 'CONFIRMED',
+    'completed': 'CONFIRMED',
+    'cancelled': 'CANCELLED',
+    'expired': 'CANCELLED',
+    'no_show': 'CANCELLED',
+}
+
+
+def get_calendar_token(user, reset=False):
+    """The user's feed token, created on first use; reset issues a new one"""
+    user_settings, _ = UserSettings.objects.get_or_create(user=user)
+    if reset or not user_settings.calendarToken:
+        user_settings.calendarToken = secrets.token_urlsafe(32)
+        user_settings.save(update_fields=['calendarToken', 'updatedAt'])
+    return user_settings.calendarToken
+
+
+def feed_interviews(user):
+    """Interviews of user shown in the feed"""
+    since = timezone.localdate() - FEED_HISTORY
+    return Interview.objects.filter(Q(employer=user) | Q(provider=user), date__gte=since)
+
+
+def _feed_state(request, token):
+    """(user, interview count, last update) of a feed, computed once per request"""
+    if not hasattr(request, '_calendar_feed_state'):
+        user_settings = UserSettings.objects.select_related('user').filter(calendarToken=token).first()
+        if user_settings is None or not user_settings.user.is_active:
+            raise Http404
+        user = user_settings.user
+        # The count changes when an interview is deleted, which max(updatedAt) would miss.
+        # Events also show office and participant details, so edits to those rows count
+        # too (User.lastActive is auto_now, so it moves whenever a user is saved)
+        state = feed_interviews(user).aggregate(
+            count=Count('id'),
+            interviews=Max('updatedAt'),
+            offices=Max('officeLocation__updatedAt'),
+            employers=Max('employer__lastActive'),
+            providers=Max('provider__lastActive'),
+        )
+        stamps = [state[key] for key in ('interviews', 'offices', 'employers', 'providers') if state[key]]
+        request._calendar_feed_state = (user, state['count'], max(stamps, default=None))
+    return request._calendar_feed_state
+
+
+def _etag(request, token):
+    user, count, last_modified = _feed_state(request, token)
+    stamp = last_modified.isoformat() if last_modified else ''
+    # The feed window moves every day, so the date is part of the version
+    raw = f'{user.pk}:{count}:{stamp}:{timezone.localdate().isoformat()}'
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _last_modified(request, token):
+    return _feed_state(request, token)[2]
+
+
+def _escape(value):
+    return (
+        str(value).replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+        .replace('\r\n', '\\n').replace('\n', '\\n')
+    )
+
+
+def _fold(line):
+    """Split a content line into 75-octet lines as RFC 5545 requires"""
+    data = line.encode()
+    if len(data) <= 75:
+        return line + '\r\n'
+    parts = []
+    while data:
+        limit = 75 if not parts else 74
+        cut = min(limit, len(data))
+        # Never split a UTF-8 sequence
+        while cut < len(data) and (data[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(data[:cut].decode())
+        data = data[cut:]
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def _utc(value):
+    return value.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def _event_lines(interview, user):
+    start = timezone.make_aware(datetime.combine(interview.date, interview.time))
+    office = interview.officeLocation
+    length = office.slotMinutes if office else DEFAULT_INTERVIEW_MINUTES
+    if interview.employer_id == user.pk:
+        other = interview.provider.fullName
+    else:
+        other = interview.employer.companyName or interview.employer.fullName
+
+    description = [f'Status: {interview.get_status_display()}']
+    if interview.notes:
+        description.append(interview.notes)
+
+    yield 'BEGIN:VEVENT'
+    yield f'UID:interview-{interview.pk}@riderspool'
+    yield f'DTSTAMP:{_utc(interview.updatedAt)}'
+    yield f'LAST-MODIFIED:{_utc(interview.updatedAt)}'
+    yield f'DTSTART:{_utc(start)}'
+    yield f'DTEND:{_utc(start + timedelta(minutes=length))}'
+    yield f'SUMMARY:{_escape(f"Interview with {other}")}'
+    if office:
+        yield f'LOCATION:{_escape(f"{office.name}, {office.address}, {office.city}")}'
+    yield f'DESCRIPTION:{_escape(chr(10).join(description))}'
+    yield f'STATUS:{EVENT_STATUS.get(interview.status, "TENTATIVE")}'
+    yield 'END:VEVENT'
+
+
+def _feed(user):
+    yield _fold('BEGIN:VCALENDAR')
+    yield _fold('VERSION:2.0')
+    yield _fold('PRODID:-//Riderspool//Interviews//EN')
+    yield _fold('CALSCALE:GREGORIAN')
+    yield _fold('METHOD:PUBLISH')
+    yield _fold('X-WR-CALNAME:Riderspool Interviews')
+
+    interviews = feed_interviews(user).select_related(
+        'employer', 'provider', 'officeLocation'
+    ).order_by('date', 'time')
+    for interview in interviews.iterator(chunk_size=500):
+        yield ''.join(_fold(line) for line in _event_lines(interview, user))
+    yield _fold('END:VCALENDAR')
+
+
+@require_safe
+@condition(etag_func=_etag, last_modified_func=_last_modified)
+def interview_calendar_feed(request, token):
+    """Public .ics feed of the interviews of the user owning token"""
+    user = _feed_state(request, token)[0]
+    response = StreamingHttpResponse(_feed(user), content_type='text/calendar; charset=utf-8')
+    response['Content-Disposition'] = 'inline; filename="riderspool-interviews.ics"'
+    response['Cache-Control'] = 'private, max-age=300'
+    return response
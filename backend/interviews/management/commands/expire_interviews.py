@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from interviews.expiry import expire_interviews
+
+
+class Command(BaseCommand):
+    help = 'Expire past-due pending interviews and mark unfinished confirmed ones as no-shows'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Interviews updated per UPDATE')
+        parser.add_argument('--no-notify', action='store_true', help='Do not email the employer and provider')
+
+    def handle(self, *args, **options):
+        expired, no_show = expire_interviews(chunk_size=options['chunk_size'], notify=not options['no_notify'])
+        self.stdout.write(self.style.SUCCESS(f'{expired} interview(s) expired, {no_show} marked as no-show'))
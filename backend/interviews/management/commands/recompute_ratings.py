@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from interviews.ratings import recompute_ratings
+
+
+class Command(BaseCommand):
+    help = 'Rebuild provider rating totals and averages from interview feedback'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Profiles written per UPDATE')
+
+    def handle(self, *args, **options):
+        changed = recompute_ratings(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Rating totals corrected for {changed} provider(s)'))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from interviews.ranking import refresh_rank_scores
+
+
+class Command(BaseCommand):
+    help = 'Recompute provider ranking scores from interview feedback'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows read and written per query')
+
+    def handle(self, *args, **options):
+        changed = refresh_rank_scores(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Ranking score updated for {changed} provider(s)'))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from interviews.reminders import send_due_reminders
+
+
+class Command(BaseCommand):
+    help = 'Email reminders for confirmed interviews coming up (run every few minutes)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100, help='Emails sent per SMTP batch')
+
+    def handle(self, *args, **options):
+        sent = send_due_reminders(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'{sent} reminder(s) sent'))
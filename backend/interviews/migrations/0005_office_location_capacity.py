@@ -0,0 +1,40 @@
+# Generated by Django 5.2.3 on 2026-10-19 18:15
+
+import datetime
+import interviews.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0004_interviewfeedback_improvements_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='officelocation',
+            name='capacity',
+            field=models.PositiveIntegerField(default=1, help_text='Interviews that can run at the same time'),
+        ),
+        migrations.AddField(
+            model_name='officelocation',
+            name='closingTime',
+            field=models.TimeField(default=datetime.time(17, 0)),
+        ),
+        migrations.AddField(
+            model_name='officelocation',
+            name='openDays',
+            field=models.JSONField(blank=True, default=interviews.models.default_open_days, help_text='Weekdays open, 0 = Monday'),
+        ),
+        migrations.AddField(
+            model_name='officelocation',
+            name='openingTime',
+            field=models.TimeField(default=datetime.time(9, 0)),
+        ),
+        migrations.AddField(
+            model_name='officelocation',
+            name='slotMinutes',
+            field=models.PositiveIntegerField(default=60, help_text='Length of one interview in minutes'),
+        ),
+    ]
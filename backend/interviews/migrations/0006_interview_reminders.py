@@ -0,0 +1,35 @@
+# Generated by Django 5.2.3 on 2026-10-19 18:24
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0005_office_location_capacity'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InterviewReminder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('leadHours', models.PositiveSmallIntegerField(help_text='Hours before the interview this reminder covers')),
+                ('scheduledFor', models.DateTimeField()),
+                ('runId', models.UUIDField(db_index=True)),
+                ('createdAt', models.DateTimeField(auto_now_add=True)),
+                ('interview', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reminders', to='interviews.interview')),
+                ('recipient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='interview_reminders', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Interview Reminder',
+                'verbose_name_plural': 'Interview Reminders',
+                'db_table': 'interview_reminders',
+                'indexes': [models.Index(fields=['scheduledFor'], name='interview_r_schedul_31e051_idx')],
+                'unique_together': {('interview', 'recipient', 'leadHours', 'scheduledFor')},
+            },
+        ),
+    ]
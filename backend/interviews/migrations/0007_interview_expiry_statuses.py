@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-19 18:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0006_interview_reminders'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='interview',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending Confirmation'), ('confirmed', 'Confirmed'), ('completed', 'Completed'), ('cancelled', 'Cancelled'), ('rescheduled', 'Rescheduled'), ('expired', 'Expired'), ('no_show', 'No Show')], default='pending', max_length=20),
+        ),
+    ]
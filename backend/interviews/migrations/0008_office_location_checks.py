@@ -0,0 +1,36 @@
+# Generated by Django 5.2.3 on 2026-10-19 18:49
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0007_interview_expiry_statuses'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='officelocation',
+            name='capacity',
+            field=models.PositiveIntegerField(default=1, help_text='Interviews that can run at the same time', validators=[django.core.validators.MinValueValidator(1)]),
+        ),
+        migrations.AlterField(
+            model_name='officelocation',
+            name='slotMinutes',
+            field=models.PositiveIntegerField(default=60, help_text='Length of one interview in minutes', validators=[django.core.validators.MinValueValidator(1)]),
+        ),
+        migrations.AddConstraint(
+            model_name='officelocation',
+            constraint=models.CheckConstraint(condition=models.Q(('capacity__gte', 1)), name='office_capacity_positive'),
+        ),
+        migrations.AddConstraint(
+            model_name='officelocation',
+            constraint=models.CheckConstraint(condition=models.Q(('slotMinutes__gte', 1)), name='office_slot_minutes_positive'),
+        ),
+        migrations.AddConstraint(
+            model_name='officelocation',
+            constraint=models.CheckConstraint(condition=models.Q(('openingTime__lt', models.F('closingTime'))), name='office_opens_before_closing'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-19 19:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0008_office_location_checks'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='officelocation',
+            name='updatedAt',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -1,7 +1,16 @@
+from datetime import time
+
+from django.core.exceptions import ValidationError
+from django.core.validators import MinValueValidator
 from django.db import models
 from django.conf import settings
 
 
+def default_open_days():
+    """Monday to Friday (0 = Monday, as in date.weekday())"""
+    return [0, 1, 2, 3, 4]
+
+
 class OfficeLocation(models.Model):
     """Office locations where interviews can be conducted"""
 
@@ -9,17 +18,55 @@ class OfficeLocation(models.Model):
     address = models.TextField()
     city = models.CharField(max_length=100)
     isActive = models.BooleanField(default=True)
+
+    # Booking capacity
+    capacity = models.PositiveIntegerField(
+        default=1, validators=[MinValueValidator(1)], help_text='Interviews that can run at the same time'
+    )
+    openingTime = models.TimeField(default=time(9, 0))
+    closingTime = models.TimeField(default=time(17, 0))
+    openDays = models.JSONField(default=default_open_days, blank=True, help_text='Weekdays open, 0 = Monday')
+    slotMinutes = models.PositiveIntegerField(
+        default=60, validators=[MinValueValidator(1)], help_text='Length of one interview in minutes'
+    )
+
     createdAt = models.DateTimeField(auto_now_add=True)
+    updatedAt = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'office_locations'
         verbose_name = 'Office Location'
         verbose_name_plural = 'Office Locations'
         ordering = ['city', 'name']
+        constraints = [
+            models.CheckConstraint(condition=models.Q(capacity__gte=1), name='office_capacity_positive'),
+            models.CheckConstraint(condition=models.Q(slotMinutes__gte=1), name='office_slot_minutes_positive'),
+            models.CheckConstraint(
+                condition=models.Q(openingTime__lt=models.F('closingTime')), name='office_opens_before_closing'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name}, {self.city}"
 
+    def clean(self):
+        """Validate opening hours and open days"""
+        errors = {}
+        if self.openingTime and self.closingTime and self.openingTime >= self.closingTime:
+            errors['closingTime'] = 'Closing time must be after opening time'
+        open_days = self.openDays or []
+        if not isinstance(open_days, list) or any(
+            not isinstance(day, int) or isinstance(day, bool) or not 0 <= day <= 6 for day in open_days
+        ):
+            errors['openDays'] = 'Open days must be a list of weekdays from 0 (Monday) to 6 (Sunday)'
+        elif len(set(open_days)) != len(open_days):
+            errors['openDays'] = 'Open days must not repeat'
+        if errors:
+            raise ValidationError(errors)
+
+    def is_open_on(self, day):
+        return day.weekday() in (self.openDays or [])
+
 
 class Interview(models.Model):
     """Interview booking model"""
@@ -30,6 +77,8 @@ class Interview(models.Model):
         ('completed', 'Completed'),
         ('cancelled', 'Cancelled'),
         ('rescheduled', 'Rescheduled'),
+        ('expired', 'Expired'),
+        ('no_show', 'No Show'),
     ]
 
     employer = models.ForeignKey(
@@ -77,6 +126,23 @@ class Interview(models.Model):
     def __str__(self):
         return f"Interview: {self.employer.companyName or self.employer.fullName} → {self.provider.fullName} on {self.date}"
 
+    def transition(self, from_statuses, changes, **conditions):
+        """
+        Apply changes only if the interview is still in one of from_statuses
+
+        Runs as a single UPDATE ... WHERE status IN (...), so of two
+        concurrent requests acting on the same state only one succeeds.
+        The instance is reloaded either way.
+
+        Returns:
+            Whether this call made the change
+        """
+        from django.utils import timezone
+        changes = {'updatedAt': timezone.now(), **changes}
+        updated = Interview.objects.filter(pk=self.pk, status__in=from_statuses, **conditions).update(**changes)
+        self.refresh_from_db()
+        return bool(updated)
+
     @property
     def is_past(self):
         from django.utils import timezone
@@ -85,6 +151,31 @@ class Interview(models.Model):
         return interview_datetime < timezone.now().replace(tzinfo=None)
 
 
+class InterviewReminder(models.Model):
+    """Log of reminder emails, so each one is sent once per interview slot"""
+
+    interview = models.ForeignKey(Interview, on_delete=models.CASCADE, related_name='reminders')
+    recipient = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='interview_reminders')
+    leadHours = models.PositiveSmallIntegerField(help_text='Hours before the interview this reminder covers')
+    # Interview start the reminder was sent for; rescheduling gets a new reminder
+    scheduledFor = models.DateTimeField()
+    # Dispatcher run that claimed the reminder
+    runId = models.UUIDField(db_index=True)
+    createdAt = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'interview_reminders'
+        verbose_name = 'Interview Reminder'
+        verbose_name_plural = 'Interview Reminders'
+        unique_together = ['interview', 'recipient', 'leadHours', 'scheduledFor']
+        indexes = [
+            models.Index(fields=['scheduledFor']),
+        ]
+
+    def __str__(self):
+        return f"{self.leadHours}h reminder for interview {self.interview_id} to {self.recipient_id}"
+
+
 class InterviewFeedback(models.Model):
     """Feedback from employer after interview"""
 
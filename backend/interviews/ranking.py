@@ -0,0 +1,137 @@
+"""
+Provider ranking score
+Each feedback counts as a score between 1 and 5 mixing its star rating
+with whether the employer would hire the provider again, weighted by its
+age with an exponential half-life. The weighted mean is shrunk towards a
+neutral prior worth a few reviews, so one 5-star review does not outrank
+hundreds of 4.8s. Scores are stored in the indexed rankScore column and
+providers are listed by it. Each profile also keeps its decayed score sum
+and weight as of rankTotalsAt, so new feedback decays them to the present
+and adds itself in one UPDATE without rereading older feedback;
+refresh_rank_scores rebuilds all of them nightly as reviews age
+"""
+
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Round
+from django.utils import timezone
+
+from riderspool_backend.cache import bump_version
+from users.models import ProviderProfile
+from .models import InterviewFeedback
+
+
+# Score of a provider without feedback, and what few reviews are pulled towards
+PRIOR_SCORE = 3.0
+# Share of a feedback's score given by wouldHireAgain rather than the rating
+HIRE_AGAIN_WEIGHT = 0.25
+
+
+def feedback_score(rating, would_hire_again):
+    """Score between 1 and 5 of one feedback"""
+    return (1 - HIRE_AGAIN_WEIGHT) * rating + HIRE_AGAIN_WEIGHT * (5 if would_hire_again else 1)
+
+
+def decay(since, now):
+    """Weight left to something dated since, at now"""
+    age = max((now - since).total_seconds(), 0)
+    return 0.5 ** (age / (settings.PROVIDER_RANK_HALF_LIFE_DAYS * 86400))
+
+
+def decayed_totals(feedback, now):
+    """
+    Sum of feedback scores and of their weights, decayed to now
+
+    Args:
+        feedback: (rating, wouldHireAgain, createdAt) of each feedback
+    """
+    weighted_sum = weight = 0.0
+    for rating, would_hire_again, created_at in feedback:
+        feedback_weight = decay(created_at, now)
+        weighted_sum += feedback_weight * feedback_score(rating, would_hire_again)
+        weight += feedback_weight
+    return weighted_sum, weight
+
+
+def score_from_totals(weighted_sum, weight):
+    """Ranking score from decayed totals, shrunk towards the prior (also accepts SQL expressions)"""
+    prior_weight = settings.PROVIDER_RANK_PRIOR_WEIGHT
+    return (PRIOR_SCORE * prior_weight + weighted_sum) / (prior_weight + weight)
+
+
+def rank_score(feedback, now):
+    """
+    Ranking score of a provider from their feedback
+
+    Args:
+        feedback: (rating, wouldHireAgain, createdAt) of each feedback
+    """
+    return round(score_from_totals(*decayed_totals(feedback, now)), 4)
+
+
+def record_rank_feedback(provider_id, rating, would_hire_again, now=None):
+    """Add one feedback to the provider's decayed totals and rankScore"""
+    now = now or timezone.now()
+    score = feedback_score(rating, would_hire_again)
+    profiles = ProviderProfile.objects.filter(user_id=provider_id)
+    while True:
+        found = list(profiles.values_list('rankTotalsAt', flat=True))
+        if not found:
+            return
+        totals_at = found[0]
+        factor = decay(totals_at, now) if totals_at else 1.0
+        weighted_sum = F('rankWeightedSum') * factor + score
+        weight = F('rankWeight') * factor + 1
+        # Only apply the decay to the totals it was computed for; a concurrent
+        # write moved rankTotalsAt, so read it again and retry
+        updated = profiles.filter(rankTotalsAt=totals_at).update(
+            rankWeightedSum=weighted_sum,
+            rankWeight=weight,
+            rankTotalsAt=now,
+            rankScore=Round(score_from_totals(weighted_sum, weight), 4)
+        )
+        if updated:
+            break
+    # update() sends no post_save, so invalidate cached provider responses here
+    transaction.on_commit(lambda: bump_version(ProviderProfile))
+
+
+def refresh_rank_scores(now=None, batch_size=1000):
+    """
+    Recompute every provider's rankScore, letting older reviews count less
+
+    Feedback is read in one pass; only profiles whose score changed are
+    written back, with their decayed totals, using bulk_update.
+
+    Returns:
+        Number of profiles whose score changed
+    """
+    now = now or timezone.now()
+    feedback = defaultdict(list)
+    for provider_id, rating, would_hire_again, created_at in InterviewFeedback.objects.order_by().values_list(
+        'interview__provider_id', 'rating', 'wouldHireAgain', 'createdAt'
+    ).iterator(chunk_size=batch_size):
+        feedback[provider_id].append((rating, would_hire_again, created_at))
+
+    changed = []
+    for profile in ProviderProfile.objects.only('id', 'user_id', 'rankScore').iterator(chunk_size=batch_size):
+        provider_feedback = feedback.get(profile.user_id, ())
+        weighted_sum, weight = decayed_totals(provider_feedback, now)
+        score = round(score_from_totals(weighted_sum, weight), 4)
+        if profile.rankScore != score:
+            profile.rankScore = score
+            profile.rankWeightedSum = weighted_sum
+            profile.rankWeight = weight
+            profile.rankTotalsAt = now if provider_feedback else None
+            changed.append(profile)
+
+    with transaction.atomic():
+        ProviderProfile.objects.bulk_update(
+            changed, ['rankScore', 'rankWeightedSum', 'rankWeight', 'rankTotalsAt'], batch_size=batch_size
+        )
+        if changed:
+            transaction.on_commit(lambda: bump_version(ProviderProfile))
+    return len(changed)
@@ -0,0 +1,67 @@
+"""
+Provider rating aggregation
+Each profile keeps the sum and number of its feedback ratings. New
+feedback adds to them in a single UPDATE with F() expressions, so
+concurrent submissions cannot lose each other's ratings, and the rating
+column is rewritten in the same statement as ratingSum / ratingCount
+"""
+
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, FloatField, Sum
+from django.db.models.functions import Cast
+
+from riderspool_backend.cache import bump_version
+from users.models import ProviderProfile
+from .models import InterviewFeedback
+
+
+def average_rating(total, count):
+    """SQL expression for total / count as a rating (count must not be zero)"""
+    # Divide as floating point, since SQLite keeps integer division for NUMERIC casts
+    return Cast(Cast(total, FloatField()) / count, DecimalField(max_digits=3, decimal_places=2))
+
+
+def record_rating(provider_id, rating):
+    """Add one feedback rating to the provider's totals and average"""
+    # Column references on the right of SET read the row's values before the update
+    ProviderProfile.objects.filter(user_id=provider_id).update(
+        ratingSum=F('ratingSum') + rating,
+        ratingCount=F('ratingCount') + 1,
+        rating=average_rating(F('ratingSum') + rating, F('ratingCount') + 1)
+    )
+    # update() sends no post_save, so invalidate cached provider responses here
+    transaction.on_commit(lambda: bump_version(ProviderProfile))
+
+
+def recompute_ratings(batch_size=1000):
+    """
+    Rebuild every provider's rating totals from their feedback
+
+    Totals come from one grouped aggregate over InterviewFeedback and are
+    only written to profiles whose stored totals differ; every rating is
+    then derived again from the totals in one UPDATE.
+
+    Returns:
+        Number of profiles whose totals changed
+    """
+    totals = {
+        row['interview__provider']: (row['total'], row['count'])
+        for row in InterviewFeedback.objects.order_by().values('interview__provider').annotate(
+            total=Sum('rating'), count=Count('id')
+        )
+    }
+
+    changed = []
+    for profile in ProviderProfile.objects.only('id', 'user_id', 'ratingSum', 'ratingCount').iterator(chunk_size=batch_size):
+        total, count = totals.get(profile.user_id, (0, 0))
+        if (profile.ratingSum, profile.ratingCount) != (total, count):
+            profile.ratingSum = total
+            profile.ratingCount = count
+            changed.append(profile)
+
+    with transaction.atomic():
+        ProviderProfile.objects.bulk_update(changed, ['ratingSum', 'ratingCount'], batch_size=batch_size)
+        ProviderProfile.objects.filter(ratingCount__gt=0).update(rating=average_rating(F('ratingSum'), F('ratingCount')))
+        ProviderProfile.objects.filter(ratingCount=0).exclude(rating=0).update(rating=0)
+        transaction.on_commit(lambda: bump_version(ProviderProfile))
+    return len(changed)
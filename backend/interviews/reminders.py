@@ -0,0 +1,99 @@
+"""
+Interview reminder dispatcher
+Each run looks only at confirmed interviews starting within the reminder
+windows, found through the (date, time) index, so its cost does not grow
+with the interview history. Reminders are claimed by inserting rows into
+the reminder log under a unique constraint before anything is sent, so
+overlapping runs never email the same person twice. Claims whose email
+could not be sent are released again, so the next run retries them while
+the interview is still ahead
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from notifications.email_service import EmailService
+from .models import Interview, InterviewReminder
+
+
+# Log rows for interviews further in the past than this are deleted
+REMINDER_LOG_RETENTION = timedelta(days=7)
+
+
+def interviews_starting_between(window_start, window_end):
+    """Confirmed interviews starting after window_start and no later than window_end (naive local times)"""
+    return Interview.objects.filter(
+        status='confirmed',
+        date__gte=window_start.date(),
+        date__lte=window_end.date()
+    ).exclude(
+        date=window_start.date(), time__lte=window_start.time()
+    ).exclude(
+        date=window_end.date(), time__gt=window_end.time()
+    )
+
+
+def claim_reminders(run_id, now):
+    """
+    Log a reminder for each participant of every interview due one
+
+    Each interview only falls in the window of its nearest lead time, so
+    an interview booked two hours ahead is not sent the 24 hour reminder
+    as well. Rows already in the log are skipped by the unique constraint.
+    """
+    window_start = now
+    for lead in sorted(set(settings.INTERVIEW_REMINDER_LEAD_HOURS)):
+        window_end = now + timedelta(hours=lead)
+        rows = []
+        for interview_id, employer_id, provider_id, date, time in interviews_starting_between(
+            window_start, window_end
+        ).order_by().values_list('id', 'employer_id', 'provider_id', 'date', 'time'):
+            scheduled_for = timezone.make_aware(datetime.combine(date, time))
+            rows.extend(
+                InterviewReminder(
+                    interview_id=interview_id,
+                    recipient_id=recipient_id,
+                    leadHours=lead,
+                    scheduledFor=scheduled_for,
+                    runId=run_id
+                )
+                for recipient_id in (employer_id, provider_id)
+            )
+        InterviewReminder.objects.bulk_create(rows, batch_size=500, ignore_conflicts=True)
+        window_start = window_end
+
+
+def send_due_reminders(now=None, batch_size=100):
+    """
+    Send every reminder that has come due since the last run
+
+    Returns:
+        Number of reminder emails sent
+    """
+    run_id = uuid.uuid4()
+    now = timezone.localtime(now)
+    claim_reminders(run_id, now.replace(tzinfo=None))
+
+    reminders = InterviewReminder.objects.filter(runId=run_id).exclude(
+        recipient__settings__interviewAlerts=False
+    ).exclude(
+        recipient__settings__emailNotifications=False
+    ).select_related(
+        'recipient', 'interview__employer', 'interview__provider', 'interview__officeLocation'
+    ).order_by('scheduledFor')
+    failed = []
+    sent = EmailService.send_interview_reminder_emails(
+        reminders, today=now.date(), batch_size=batch_size, failed=failed
+    )
+    if failed:
+        undelivered = Q()
+        for recipient, context in failed:
+            undelivered |= Q(recipient=recipient, interview_id=context['interview_id'])
+        InterviewReminder.objects.filter(undelivered, runId=run_id).delete()
+
+    InterviewReminder.objects.filter(scheduledFor__lt=now - REMINDER_LOG_RETENTION).delete()
+    return sent
@@ -1,4 +1,7 @@
+from django.db import transaction
 from rest_framework import serializers
+
+from .booking import MAX_BULK_INTERVIEWS, check_office_hours, ensure_slot_available, lock_participants
 from .models import Interview, InterviewFeedback, OfficeLocation
 from users.serializers import UserSerializer
 
@@ -8,7 +11,10 @@ class OfficeLocationSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = OfficeLocation
-        fields = ['id', 'name', 'address', 'city', 'isActive', 'createdAt']
+        fields = [
+            'id', 'name', 'address', 'city', 'isActive', 'capacity',
+            'openingTime', 'closingTime', 'openDays', 'slotMinutes', 'createdAt'
+        ]
         read_only_fields = ['id', 'createdAt']
 
 
@@ -20,6 +26,7 @@ class InterviewProviderSerializer(serializers.Serializer):
     phone = serializers.CharField(source='user.phone')
     category = serializers.CharField()
     profilePhoto = serializers.ImageField(read_only=True)
+    profilePhotoThumb = serializers.ImageField(read_only=True)
     rating = serializers.DecimalField(max_digits=3, decimal_places=2)
     totalInterviews = serializers.IntegerField()
     experience = serializers.IntegerField()
@@ -49,6 +56,7 @@ class InterviewSerializer(serializers.ModelSerializer):
                 'phone': obj.provider.phone,
                 'category': obj.provider.category,
                 'profilePhoto': None,
+                'profilePhotoThumb': None,
                 'rating': 0,
                 'totalInterviews': 0,
                 'experience': obj.provider.experience or 0,
@@ -96,12 +104,11 @@ class InterviewCreateSerializer(serializers.ModelSerializer):
         model = Interview
         fields = ['provider_id', 'date', 'time', 'officeLocation_id', 'notes']
 
-    def validate(self, attrs):
-        """Validate interview data"""
+    def check_date(self, attrs):
+        """Validate date is not in the past (lenient for testing)"""
         from django.utils import timezone
         from datetime import datetime, timedelta
 
-        # Validate date is not in the past (lenient for testing)
         interview_date = attrs.get('date')
         interview_time = attrs.get('time')
 
@@ -113,24 +120,62 @@ class InterviewCreateSerializer(serializers.ModelSerializer):
             if interview_datetime < min_datetime:
                 raise serializers.ValidationError({"date": "Cannot book interviews more than 30 days in the past"})
 
+    def validate(self, attrs):
+        """Validate interview data"""
+        self.check_date(attrs)
+        interview_date = attrs.get('date')
+        interview_time = attrs.get('time')
+
+        office = OfficeLocation.objects.filter(pk=attrs.get('officeLocation_id'), isActive=True).first()
+        if office is None:
+            raise serializers.ValidationError({"officeLocation_id": "Office location not found"})
+        hours_error = check_office_hours(office, interview_date, interview_time)
+        if hours_error:
+            raise serializers.ValidationError({"time": hours_error})
+
         return attrs
 
     def create(self, validated_data):
-        """Create interview with employer from context"""
+        """
+        Create interview with employer from context
+
+        Raises:
+            BookingConflict: If the provider, the employer or the office is already booked
+        """
         employer = self.context['request'].user
 
-        interview = Interview.objects.create(
-            employer=employer,
-            provider_id=validated_data['provider_id'],
-            date=validated_data['date'],
-            time=validated_data['time'],
-            officeLocation_id=validated_data['officeLocation_id'],
-            notes=validated_data.get('notes', ''),
-            status='pending'
-        )
+        with transaction.atomic():
+            office = lock_participants(employer.id, validated_data['provider_id'], validated_data['officeLocation_id'])
+            ensure_slot_available(
+                office, validated_data['date'], validated_data['time'], employer.id, validated_data['provider_id']
+            )
+            interview = Interview.objects.create(
+                employer=employer,
+                provider_id=validated_data['provider_id'],
+                date=validated_data['date'],
+                time=validated_data['time'],
+                officeLocation=office,
+                notes=validated_data.get('notes', ''),
+                status='pending'
+            )
         return interview
 
 
+class InterviewBulkItemSerializer(InterviewCreateSerializer):
+    """One interview of a bulk request; offices and slots are checked by book_many()"""
+
+    def validate(self, attrs):
+        self.check_date(attrs)
+        return attrs
+
+
+class InterviewBulkCreateSerializer(serializers.Serializer):
+    """Serializer for booking many interviews at once (items are validated one by one)"""
+    interviews = serializers.ListField(
+        child=serializers.DictField(), allow_empty=False, max_length=MAX_BULK_INTERVIEWS
+    )
+
+
 class InterviewListSerializer(serializers.ModelSerializer):
     """Serializer for interview list with full details"""
     employer = UserSerializer(read_only=True)
@@ -168,6 +213,7 @@ class InterviewListSerializer(serializers.ModelSerializer):
                 'phone': obj.provider.phone,
                 'category': obj.provider.category,
                 'profilePhoto': None,
+                'profilePhotoThumb': None,
                 'rating': 0,
                 'totalInterviews': 0,
                 'experience': obj.provider.experience or 0,
@@ -0,0 +1,14 @@
+"""
+Background tasks for interviews
+"""
+
+from notifications.email_service import EmailService
+from .models import Interview
+
+
+def send_request_emails(interview_ids):
+    """Email providers about newly booked interviews, batching the emails"""
+    interviews = Interview.objects.filter(id__in=interview_ids).select_related(
+        'employer', 'provider', 'officeLocation'
+    ).order_by('date', 'time')
+    EmailService.send_interview_request_emails(interviews)
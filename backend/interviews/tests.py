@@ -1,3 +1,225 @@
-from django.test import TestCase
+import threading
+from datetime import time, timedelta
 
-# Create your tests here.
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings, skipUnlessDBFeature
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import ProviderProfile, User
+from .models import Interview, OfficeLocation
+from .ranking import rank_score, record_rank_feedback
+
+
+def create_employer(index):
+    return User.objects.create_user(
+        email=f'employer{index}@riderspool.test', password='password123',
+        fullName=f'Employer {index}', userType='employer'
+    )
+
+
+def create_provider(index):
+    return User.objects.create_user(
+        email=f'rider{index}@riderspool.test', password='password123',
+        fullName=f'Rider {index}', userType='provider', category='motorbike-rider'
+    )
+
+
+def create_provider_profile(provider):
+    return ProviderProfile.objects.create(
+        user=provider, registeredName=provider.fullName, category=provider.category,
+        experience=2, idNumber='12345678', licenseNumber='DL-12345'
+    )
+
+
+def run_in_threads(target, args_list):
+    """Call target once per args tuple, all threads released together"""
+    barrier = threading.Barrier(len(args_list))
+
+    def run(*args):
+        try:
+            barrier.wait()
+            target(*args)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=run, args=args) for args in args_list]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def next_open_day(office):
+    day = timezone.localdate() + timedelta(days=1)
+    while not office.is_open_on(day):
+        day += timedelta(days=1)
+    return day
+
+
+def book(user, provider, office, day, start):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client.post('/api/interviews/', {
+        'provider_id': provider.id,
+        'officeLocation_id': office.id,
+        'date': day.isoformat(),
+        'time': start.strftime('%H:%M:%S'),
+    }, format='json')
+
+
+@override_settings(RESPONSE_CACHE_TIMEOUT=0)
+class BookingConflictTests(TestCase):
+    """Bookings may not overlap for the provider, the employer or a full office"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employers = [create_employer(index) for index in range(3)]
+        cls.providers = [create_provider(index) for index in range(3)]
+        cls.office = OfficeLocation.objects.create(
+            name='Nairobi Office', address='123 Main Street', city='Nairobi', capacity=2
+        )
+        cls.day = next_open_day(cls.office)
+
+    def test_provider_cannot_be_double_booked(self):
+        self.assertEqual(book(self.employers[0], self.providers[0], self.office, self.day, time(10)).status_code, 201)
+        response = book(self.employers[1], self.providers[0], self.office, self.day, time(10, 30))
+        self.assertEqual(response.status_code, 409)
+
+    def test_employer_cannot_be_double_booked(self):
+        self.assertEqual(book(self.employers[0], self.providers[0], self.office, self.day, time(10)).status_code, 201)
+        response = book(self.employers[0], self.providers[1], self.office, self.day, time(10))
+        self.assertEqual(response.status_code, 409)
+
+    def test_office_capacity(self):
+        for index in range(2):
+            response = book(self.employers[index], self.providers[index], self.office, self.day, time(10))
+            self.assertEqual(response.status_code, 201)
+        response = book(self.employers[2], self.providers[2], self.office, self.day, time(10, 30))
+        self.assertEqual(response.status_code, 409)
+        # Back-to-back slots do not overlap
+        response = book(self.employers[2], self.providers[2], self.office, self.day, time(11))
+        self.assertEqual(response.status_code, 201)
+
+    def test_cancelled_interviews_free_the_slot(self):
+        self.assertEqual(book(self.employers[0], self.providers[0], self.office, self.day, time(10)).status_code, 201)
+        Interview.objects.update(status='cancelled')
+        response = book(self.employers[1], self.providers[0], self.office, self.day, time(10))
+        self.assertEqual(response.status_code, 201)
+
+    def test_outside_opening_hours(self):
+        response = book(self.employers[0], self.providers[0], self.office, self.day, time(16, 30))
+        self.assertEqual(response.status_code, 400)
+
+    def test_reschedule_without_office_checks_participants(self):
+        self.assertEqual(book(self.employers[0], self.providers[0], self.office, self.day, time(10)).status_code, 201)
+        interview = Interview.objects.create(
+            employer=self.employers[1], provider=self.providers[0], date=self.day, time=time(14), status='pending'
+        )
+        client = APIClient()
+        client.force_authenticate(self.employers[1])
+        response = client.post(f'/api/interviews/{interview.id}/reschedule/', {
+            'date': self.day.isoformat(), 'time': '10:30:00'
+        }, format='json')
+        self.assertEqual(response.status_code, 409)
+
+
+class RankScoreTests(TestCase):
+    """Feedback added one at a time must give the score of a full recompute"""
+
+    def test_incremental_score_matches_recompute(self):
+        provider = create_provider(0)
+        create_provider_profile(provider)
+        start = timezone.now() - timedelta(days=400)
+        feedback = [(5, True, start), (2, False, start + timedelta(days=200)), (4, True, start + timedelta(days=390))]
+
+        for rating, would_hire_again, created_at in feedback:
+            record_rank_feedback(provider.id, rating, would_hire_again, now=created_at)
+
+        profile = ProviderProfile.objects.get(user=provider)
+        self.assertAlmostEqual(profile.rankScore, rank_score(feedback, feedback[-1][2]), places=3)
+        self.assertEqual(profile.rankTotalsAt, feedback[-1][2])
+
+
+@override_settings(RESPONSE_CACHE_TIMEOUT=0)
+@skipUnlessDBFeature('has_select_for_update', 'test_db_allows_multiple_connections')
+class ConcurrentBookingTests(TransactionTestCase):
+    """
+    Parallel requests for the same provider and slot must produce one interview
+
+    Needs row locks, so it runs against PostgreSQL (DATABASE_URL) and is
+    skipped on SQLite, where select_for_update does nothing and a pass would
+    only show that the database serializes every write.
+    """
+
+    WORKERS = 8
+
+    def test_parallel_bookings_of_one_provider(self):
+        employers = [create_employer(index) for index in range(self.WORKERS)]
+        provider = create_provider(0)
+        office = OfficeLocation.objects.create(
+            name='Nairobi Office', address='123 Main Street', city='Nairobi', capacity=self.WORKERS
+        )
+        day = next_open_day(office)
+
+        statuses = []
+
+        def request(employer):
+            statuses.append(book(employer, provider, office, day, time(10)).status_code)
+
+        run_in_threads(request, [(employer,) for employer in employers])
+
+        self.assertEqual(sorted(statuses), [201] + [409] * (self.WORKERS - 1))
+        self.assertEqual(Interview.objects.filter(provider=provider).count(), 1)
+
+
+@override_settings(RESPONSE_CACHE_TIMEOUT=0)
+@skipUnlessDBFeature('test_db_allows_multiple_connections')
+class ConcurrentTransitionTests(TransactionTestCase):
+    """
+    Parallel status changes must neither lose counter updates nor apply twice
+
+    The in-memory SQLite test database cannot take writes from several
+    connections, so this is skipped there.
+    """
+
+    WORKERS = 8
+
+    def setUp(self):
+        self.employer = create_employer(0)
+        self.provider = create_provider(0)
+        create_provider_profile(self.provider)
+        self.office = OfficeLocation.objects.create(
+            name='Nairobi Office', address='123 Main Street', city='Nairobi', capacity=self.WORKERS
+        )
+        self.day = next_open_day(self.office)
+
+    def create_interview(self, start=time(10)):
+        return Interview.objects.create(
+            employer=self.employer, provider=self.provider, officeLocation=self.office,
+            date=self.day, time=start, status='confirmed'
+        )
+
+    def complete(self, interview, statuses):
+        client = APIClient()
+        client.force_authenticate(self.employer)
+        statuses.append(client.post(f'/api/interviews/{interview.id}/complete/').status_code)
+
+    def test_parallel_completions_are_all_counted(self):
+        interviews = [self.create_interview(time(9 + index % 8)) for index in range(self.WORKERS)]
+        statuses = []
+        run_in_threads(self.complete, [(interview, statuses) for interview in interviews])
+
+        self.assertEqual(statuses, [200] * self.WORKERS)
+        profile = ProviderProfile.objects.get(user=self.provider)
+        self.assertEqual(profile.totalInterviews, self.WORKERS)
+
+    def test_interview_is_completed_once(self):
+        interview = self.create_interview()
+        statuses = []
+        run_in_threads(self.complete, [(interview, statuses)] * self.WORKERS)
+
+        self.assertEqual(statuses.count(200), 1)
+        self.assertTrue(all(code in (400, 409) for code in statuses if code != 200))
+        profile = ProviderProfile.objects.get(user=self.provider)
+        self.assertEqual(profile.totalInterviews, 1)
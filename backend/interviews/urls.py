@@ -1,6 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
+from .ical import interview_calendar_feed
 from .views import (
     InterviewViewSet, InterviewFeedbackViewSet, OfficeLocationViewSet
 )
@@ -12,5 +13,6 @@ router.register(r'feedback', InterviewFeedbackViewSet, basename='interview-feedb
 router.register(r'office-locations', OfficeLocationViewSet, basename='office-location')
 
 urlpatterns = [
+    path('interviews/calendar/<str:token>.ics', interview_calendar_feed, name='interview-calendar-feed'),
     path('', include(router.urls)),
 ]
@@ -4,19 +4,48 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.urls import reverse
 from django.utils import timezone
 
+from .availability import office_availability, parse_date_range
+from .booking import BookingConflict, book_many, check_office_hours, ensure_slot_available, lock_participants
+from .ical import get_calendar_token
 from .models import Interview, InterviewFeedback, OfficeLocation
+from .ranking import record_rank_feedback
+from .ratings import record_rating
 from .serializers import (
     InterviewSerializer, InterviewCreateSerializer, InterviewListSerializer,
+    InterviewBulkCreateSerializer, InterviewBulkItemSerializer,
     InterviewUpdateSerializer, InterviewFeedbackSerializer,
     InterviewFeedbackCreateSerializer, OfficeLocationSerializer
 )
+from .tasks import send_request_emails
 from notifications.email_service import EmailService
+from riderspool_backend.cache import CachedResponseMixin, bump_version
+from riderspool_backend.tasks import run_in_background
+from users.models import ProviderProfile
 
 
-class OfficeLocationViewSet(viewsets.ReadOnlyModelViewSet):
+# Statuses each action may move an interview out of
+CANCELLABLE_STATUSES = ['pending', 'confirmed', 'rescheduled']
+RESCHEDULABLE_STATUSES = ['pending', 'confirmed', 'rescheduled', 'expired']
+# No-shows are confirmed interviews the employer did not complete in time
+COMPLETABLE_STATUSES = ['confirmed', 'no_show']
+
+
+def transition_conflict(interview):
+    """409 for a request that lost a race to change the interview"""
+    return Response(
+        {'error': f'This interview was just changed and is now {interview.get_status_display().lower()}'},
+        status=status.HTTP_409_CONFLICT
+    )
+
+
+class OfficeLocationViewSet(CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet for OfficeLocation model (read-only)"""
+    cache_models = (OfficeLocation,)
     queryset = OfficeLocation.objects.filter(isActive=True)
     serializer_class = OfficeLocationSerializer
     permission_classes = [IsAuthenticated]
@@ -24,6 +53,24 @@ class OfficeLocationViewSet(viewsets.ReadOnlyModelViewSet):
     search_fields = ['name', 'city', 'address']
     ordering = ['city', 'name']
 
+    @action(detail=True, methods=['get'])
+    def availability(self, request, pk=None):
+        """Bookable slots of the office per day between ?from= and ?to="""
+        office = self.get_object()
+        try:
+            start, end = parse_date_range(request.query_params)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            'officeLocation': office.id,
+            'capacity': office.capacity,
+            'slotMinutes': office.slotMinutes,
+            'from': start.isoformat(),
+            'to': end.isoformat(),
+            'days': office_availability(office, start, end),
+        })
+
 
 class InterviewViewSet(viewsets.ModelViewSet):
     """ViewSet for Interview model"""
@@ -37,6 +84,8 @@ class InterviewViewSet(viewsets.ModelViewSet):
         """Return appropriate serializer based on action"""
         if self.action == 'create':
             return InterviewCreateSerializer
+        if self.action == 'bulk':
+            return InterviewBulkCreateSerializer
         if self.action == 'list':
             return InterviewListSerializer
         if self.action in ['update', 'partial_update', 'confirm', 'cancel', 'reschedule']:
@@ -56,6 +105,13 @@ class InterviewViewSet(viewsets.ModelViewSet):
             return queryset
         return queryset.none()
 
+    def create(self, request, *args, **kwargs):
+        """Create interview, answering 409 if the slot is already taken"""
+        try:
+            return super().create(request, *args, **kwargs)
+        except BookingConflict as e:
+            return Response({'error': e.message}, status=status.HTTP_409_CONFLICT)
+
     def perform_create(self, serializer):
         """Create interview with employer as current user"""
         interview = serializer.save()
@@ -66,6 +122,55 @@ class InterviewViewSet(viewsets.ModelViewSet):
         except Exception as e:
             print(f"Failed to send interview request email: {e}")
 
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """Book many interviews at once (employer only), reporting the outcome of each"""
+        if not request.user.is_employer:
+            return Response(
+                {'error': 'Only employers can book interviews in bulk'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = InterviewBulkCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = {}
+        items = []
+        for index, item in enumerate(serializer.validated_data['interviews']):
+            item_serializer = InterviewBulkItemSerializer(data=item)
+            if item_serializer.is_valid():
+                items.append((index, item_serializer.validated_data))
+            else:
+                results[index] = {'index': index, 'status': 'invalid', 'errors': item_serializer.errors}
+
+        created, rejected = book_many(request.user, items)
+        for index, interview in created.items():
+            results[index] = {'index': index, 'status': 'created', 'id': interview.id}
+        for index, (reason, errors) in rejected.items():
+            results[index] = {'index': index, 'status': reason, 'errors': errors}
+
+        # Emailed in batches after the response instead of once per interview
+        if created:
+            run_in_background(send_request_emails, [interview.id for interview in created.values()])
+
+        return Response({
+            'created': len(created),
+            'failed': len(results) - len(created),
+            'results': [results[index] for index in sorted(results)],
+        }, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get', 'post'])
+    def calendar(self, request):
+        """
+        URL of the user's iCalendar feed of interviews
+
+        POST issues a new URL, so the old one stops working.
+        """
+        token = get_calendar_token(request.user, reset=request.method == 'POST')
+        return Response({
+            'url': request.build_absolute_uri(reverse('interview-calendar-feed', kwargs={'token': token}))
+        })
+
     @action(detail=True, methods=['post'])
     def confirm(self, request, pk=None):
         """Confirm interview (provider only)"""
@@ -84,9 +189,8 @@ class InterviewViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        interview.status = 'confirmed'
-        interview.confirmedAt = timezone.now()
-        interview.save()
+        if not interview.transition(['pending'], {'status': 'confirmed', 'confirmedAt': timezone.now()}):
+            return transition_conflict(interview)
 
         # Send email notification to employer
         try:
@@ -111,9 +215,9 @@ class InterviewViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        if interview.status in ['cancelled', 'completed']:
+        if interview.status not in CANCELLABLE_STATUSES:
             return Response(
-                {'error': f'Cannot cancel {interview.status} interview'},
+                {'error': f'Cannot cancel {interview.get_status_display().lower()} interview'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
@@ -124,9 +228,10 @@ class InterviewViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        interview.status = 'cancelled'
-        interview.cancellationReason = cancellation_reason
-        interview.save()
+        if not interview.transition(
+            CANCELLABLE_STATUSES, {'status': 'cancelled', 'cancellationReason': cancellation_reason}
+        ):
+            return transition_conflict(interview)
 
         # Send email notification to other party
         try:
@@ -151,22 +256,42 @@ class InterviewViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        if interview.status in ['cancelled', 'completed']:
+        if interview.status not in RESCHEDULABLE_STATUSES:
             return Response(
-                {'error': f'Cannot reschedule {interview.status} interview'},
+                {'error': f'Cannot reschedule {interview.get_status_display().lower()} interview'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
         serializer = InterviewUpdateSerializer(interview, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
 
-        # Update fields
-        interview.date = serializer.validated_data.get('date', interview.date)
-        interview.time = serializer.validated_data.get('time', interview.time)
-        interview.rescheduleReason = serializer.validated_data.get('rescheduleReason')
-        interview.status = 'pending'  # Reset to pending after reschedule
-        interview.confirmedAt = None
-        interview.save()
+        new_date = serializer.validated_data.get('date', interview.date)
+        new_time = serializer.validated_data.get('time', interview.time)
+        if interview.officeLocation:
+            hours_error = check_office_hours(interview.officeLocation, new_date, new_time)
+            if hours_error:
+                return Response({'error': hours_error}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            with transaction.atomic():
+                office = lock_participants(interview.employer_id, interview.provider_id, interview.officeLocation_id)
+                # Without an office only the participants' other interviews can clash
+                ensure_slot_available(
+                    office, new_date, new_time, interview.employer_id, interview.provider_id,
+                    exclude_id=interview.id
+                )
+
+                rescheduled = interview.transition(RESCHEDULABLE_STATUSES, {
+                    'date': new_date,
+                    'time': new_time,
+                    'rescheduleReason': serializer.validated_data.get('rescheduleReason'),
+                    'status': 'pending',  # Reset to pending after reschedule
+                    'confirmedAt': None,
+                })
+            if not rescheduled:
+                return transition_conflict(interview)
+        except BookingConflict as e:
+            return Response({'error': e.message}, status=status.HTTP_409_CONFLICT)
 
         # Send email notification to other party
         try:
@@ -191,20 +316,21 @@ class InterviewViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        if interview.status != 'confirmed':
+        if interview.status not in COMPLETABLE_STATUSES:
             return Response(
                 {'error': 'Only confirmed interviews can be marked as completed'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        interview.status = 'completed'
-        interview.completedAt = timezone.now()
-        interview.save()
+        with transaction.atomic():
+            if not interview.transition(COMPLETABLE_STATUSES, {'status': 'completed', 'completedAt': timezone.now()}):
+                return transition_conflict(interview)
 
-        # Update provider stats
-        provider_profile = interview.provider.provider_profile
-        provider_profile.totalInterviews += 1
-        provider_profile.save()
+            # Update provider stats
+            ProviderProfile.objects.filter(user_id=interview.provider_id).update(
+                totalInterviews=F('totalInterviews') + 1
+            )
+            transaction.on_commit(lambda: bump_version(ProviderProfile))
 
         return Response(
             InterviewSerializer(interview).data,
@@ -229,8 +355,13 @@ class InterviewViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        interview.isHired = True
-        interview.save()
+        if not interview.transition(['completed'], {'isHired': True}, isHired=False):
+            if interview.isHired:
+                return Response(
+                    {'error': 'Provider is already marked as hired for this interview'},
+                    status=status.HTTP_409_CONFLICT
+                )
+            return transition_conflict(interview)
 
         # Send hired notification email to provider
         try:
@@ -271,19 +402,21 @@ class InterviewViewSet(viewsets.ModelViewSet):
         serializer = InterviewFeedbackCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        feedback = InterviewFeedback.objects.create(
-            interview=interview,
-            **serializer.validated_data
-        )
-
-        # Update provider rating
-        provider_profile = interview.provider.provider_profile
-        all_feedbacks = InterviewFeedback.objects.filter(
-            interview__provider=interview.provider
-        )
-        avg_rating = sum([f.rating for f in all_feedbacks]) / all_feedbacks.count()
-        provider_profile.rating = round(avg_rating, 2)
-        provider_profile.save()
+        try:
+            with transaction.atomic():
+                feedback = InterviewFeedback.objects.create(
+                    interview=interview,
+                    **serializer.validated_data
+                )
+                # Update provider rating and ranking
+                record_rating(interview.provider_id, feedback.rating)
+                record_rank_feedback(interview.provider_id, feedback.rating, feedback.wouldHireAgain)
+        except IntegrityError:
+            # Another request saved feedback for this interview first
+            return Response(
+                {'error': 'Feedback already submitted for this interview'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
         return Response(
             InterviewFeedbackSerializer(feedback).data,
@@ -14,10 +14,15 @@ from .serializers import (
     JobApplicationCreateSerializer, JobApplicationUpdateSerializer
 )
 from notifications.email_service import EmailService
+from riderspool_backend.cache import CachedResponseMixin
+from users.models import User, EmployerProfile
 
 
-class JobViewSet(viewsets.ModelViewSet):
+class JobViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """ViewSet for Job model"""
+    # Providers share one cache of active jobs; employers only see their own
+    cache_models = (Job, JobApplication, User, EmployerProfile)
+    cache_per_user_roles = ('employer',)
     queryset = Job.objects.select_related('employer').prefetch_related('applications').all()
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -3,7 +3,8 @@ Email notification service for Riderspool
 Handles all email sending operations with templates
 """
 
-from django.core.mail import send_mail, EmailMultiAlternatives
+from django.core.mail import send_mail, EmailMultiAlternatives, get_connection
+from django.db.models import F
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 from django.conf import settings
@@ -86,6 +87,91 @@ class EmailService:
             print(f"Email sending failed: {str(e)}")
             return notification
 
+    @staticmethod
+    def send_bulk_email(recipients, subject, template_name, category='general', batch_size=100, failed=None):
+        """
+        Send the same templated email to many users over one SMTP connection
+
+        Notification rows are created and updated per batch with bulk
+        queries instead of one save() per state change.
+
+        Args:
+            recipients: Iterable of (user, context) pairs
+            subject: Email subject
+            template_name: Name of the template file (without extension)
+            category: Notification category for tracking
+            batch_size: Emails rendered and sent per batch
+            failed: Optional list that the (user, context) pairs of undelivered emails are appended to
+
+        Returns:
+            Number of emails sent
+        """
+        recipients = list(recipients)
+        sent = 0
+        connection = get_connection(fail_silently=False)
+
+        try:
+            for start in range(0, len(recipients), batch_size):
+                notifications = []
+                messages = []
+                batch = recipients[start:start + batch_size]
+                for user, context in batch:
+                    context = dict(context, user=user, frontend_url=settings.FRONTEND_URL, current_year=timezone.now().year)
+                    html_content = render_to_string(f'emails/{template_name}.html', context)
+                    text_content = strip_tags(html_content)
+
+                    notifications.append(Notification(
+                        user=user,
+                        type='email',
+                        category=category,
+                        subject=subject,
+                        message=text_content,
+                        toEmail=user.email,
+                        status='pending'
+                    ))
+                    email = EmailMultiAlternatives(
+                        subject=subject,
+                        body=text_content,
+                        from_email=settings.DEFAULT_FROM_EMAIL,
+                        to=[user.email],
+                        connection=connection
+                    )
+                    email.attach_alternative(html_content, "text/html")
+                    messages.append(email)
+
+                notifications = Notification.objects.bulk_create(notifications)
+
+                # Sent one at a time over the open connection, so a failure partway
+                # through only marks the messages that were not delivered
+                sent_ids = []
+                errors = {}
+                for recipient, notification, email in zip(batch, notifications, messages):
+                    try:
+                        connection.open()
+                        if connection.send_messages([email]):
+                            sent_ids.append(notification.pk)
+                            continue
+                        error = 'Message was not sent'
+                    except Exception as e:
+                        error = str(e)
+                        print(f"Bulk email sending failed: {error}")
+                        # Start the next message on a fresh connection
+                        connection.close()
+                    errors.setdefault(error, []).append(notification.pk)
+                    if failed is not None:
+                        failed.append(recipient)
+
+                now = timezone.now()
+                Notification.objects.filter(pk__in=sent_ids).update(status='sent', sentAt=now, updatedAt=now)
+                for error, notification_ids in errors.items():
+                    Notification.objects.filter(pk__in=notification_ids).update(
+                        status='failed', errorMessage=error, retryCount=F('retryCount') + 1, updatedAt=now
+                    )
+                sent += len(sent_ids)
+        finally:
+            connection.close()
+        return sent
+
     @staticmethod
     def send_welcome_email(user):
         """Send welcome email after registration"""
@@ -103,13 +189,11 @@ class EmailService:
         )
 
     @staticmethod
-    def send_interview_request_email(interview):
-        """Send email to provider when interview is requested"""
-        provider = interview.provider
+    def interview_request_context(interview):
+        """Template context of the interview request email"""
         employer = interview.employer
-
-        context = {
-            'name': provider.fullName or 'Provider',
+        return {
+            'name': interview.provider.fullName or 'Provider',
             'employer_name': employer.companyName or employer.fullName,
             'interview_date': interview.date.strftime('%B %d, %Y'),
             'interview_time': interview.time.strftime('%I:%M %p') if hasattr(interview.time, 'strftime') else interview.time,
@@ -119,14 +203,41 @@ class EmailService:
             'interview_id': interview.id,
         }
 
+    @staticmethod
+    def send_interview_request_email(interview):
+        """Send email to provider when interview is requested"""
+        context = EmailService.interview_request_context(interview)
+
         return EmailService.send_email(
-            user=provider,
+            user=interview.provider,
             subject=f'New Interview Request from {context["employer_name"]}',
             template_name='interview_request',
             context=context,
             category='interview_request'
         )
 
+    @staticmethod
+    def send_interview_request_emails(interviews, batch_size=100):
+        """Send the request emails of many interviews, in batches per employer"""
+        by_employer = {}
+        for interview in interviews:
+            by_employer.setdefault(interview.employer_id, []).append(interview)
+
+        sent = 0
+        for employer_interviews in by_employer.values():
+            employer = employer_interviews[0].employer
+            sent += EmailService.send_bulk_email(
+                [
+                    (interview.provider, EmailService.interview_request_context(interview))
+                    for interview in employer_interviews
+                ],
+                subject=f'New Interview Request from {employer.companyName or employer.fullName}',
+                template_name='interview_request',
+                category='interview_request',
+                batch_size=batch_size
+            )
+        return sent
+
     @staticmethod
     def send_interview_confirmation_email(interview):
         """Send email to employer when provider confirms interview"""
@@ -208,6 +319,75 @@ class EmailService:
             category='interview_reschedule'
         )
 
+    @staticmethod
+    def send_interview_reminder_emails(reminders, today=None, batch_size=100, failed=None):
+        """Send upcoming interview reminders in batches (InterviewReminder rows with interview and recipient loaded)"""
+        today = today or timezone.localdate()
+        recipients = []
+        for reminder in reminders:
+            interview = reminder.interview
+            recipient = reminder.recipient
+            days_ahead = (interview.date - today).days
+            if days_ahead == 0:
+                interview_day = 'today'
+            elif days_ahead == 1:
+                interview_day = 'tomorrow'
+            else:
+                interview_day = f"on {interview.date.strftime('%A, %B %d')}"
+            if recipient.id == interview.employer_id:
+                other_party = interview.provider.fullName or 'Provider'
+            else:
+                other_party = interview.employer.companyName or interview.employer.fullName
+            recipients.append((recipient, {
+                'name': recipient.fullName or recipient.companyName or 'User',
+                'other_party': other_party,
+                'interview_day': interview_day,
+                'interview_date': interview.date.strftime('%B %d, %Y'),
+                'interview_time': interview.time.strftime('%I:%M %p'),
+                'office_location': interview.officeLocation.name if interview.officeLocation else 'TBD',
+                'office_address': f"{interview.officeLocation.address}, {interview.officeLocation.city}" if interview.officeLocation else '',
+                'interview_id': interview.id,
+            }))
+
+        return EmailService.send_bulk_email(
+            recipients,
+            subject='Interview Reminder',
+            template_name='interview_reminder',
+            category='interview_reminder',
+            batch_size=batch_size,
+            failed=failed
+        )
+
+    @staticmethod
+    def send_interview_expired_emails(interviews, batch_size=100):
+        """Tell both parties of expired or no-show interviews, in batches"""
+        recipients = []
+        for interview in interviews:
+            employer = interview.employer
+            provider = interview.provider
+            details = {
+                'no_show': interview.status == 'no_show',
+                'interview_date': interview.date.strftime('%B %d, %Y'),
+                'interview_time': interview.time.strftime('%I:%M %p'),
+                'interview_id': interview.id,
+            }
+            recipients.append((employer, dict(
+                details, name=employer.companyName or employer.fullName or 'Employer',
+                other_party=provider.fullName or 'Provider'
+            )))
+            recipients.append((provider, dict(
+                details, name=provider.fullName or 'Provider',
+                other_party=employer.companyName or employer.fullName
+            )))
+
+        return EmailService.send_bulk_email(
+            recipients,
+            subject='Interview Status Update',
+            template_name='interview_expired',
+            category='interview_expired',
+            batch_size=batch_size
+        )
+
     @staticmethod
     def send_hired_notification_email(interview):
         """Send email to provider when they are marked as hired"""
@@ -259,6 +439,29 @@ class EmailService:
             category='verification_rejected'
         )
 
+    @staticmethod
+    def send_verification_approved_emails(users):
+        """Send verification approved emails to many users in batches"""
+        return EmailService.send_bulk_email(
+            [(user, {'name': user.fullName or user.companyName or 'User'}) for user in users],
+            subject='Your Documents Have Been Verified!',
+            template_name='verification_approved',
+            category='verification_approved'
+        )
+
+    @staticmethod
+    def send_verification_rejected_emails(users, rejection_reason):
+        """Send verification rejected emails to many users in batches"""
+        return EmailService.send_bulk_email(
+            [
+                (user, {'name': user.fullName or user.companyName or 'User', 'rejection_reason': rejection_reason})
+                for user in users
+            ],
+            subject='Document Verification Update',
+            template_name='verification_rejected',
+            category='verification_rejected'
+        )
+
     @staticmethod
     def send_password_reset_email(user, reset_token):
         """Send password reset email"""
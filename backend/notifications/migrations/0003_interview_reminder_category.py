@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-19 18:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='category',
+            field=models.CharField(choices=[('interview_request', 'Interview Request'), ('interview_confirmation', 'Interview Confirmation'), ('interview_reschedule', 'Interview Reschedule'), ('interview_cancellation', 'Interview Cancellation'), ('interview_reminder', 'Interview Reminder'), ('verification_approved', 'Verification Approved'), ('verification_rejected', 'Verification Rejected'), ('general', 'General')], default='general', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='notificationtemplate',
+            name='category',
+            field=models.CharField(choices=[('interview_request', 'Interview Request'), ('interview_confirmation', 'Interview Confirmation'), ('interview_reschedule', 'Interview Reschedule'), ('interview_cancellation', 'Interview Cancellation'), ('interview_reminder', 'Interview Reminder'), ('verification_approved', 'Verification Approved'), ('verification_rejected', 'Verification Rejected'), ('general', 'General')], max_length=50),
+        ),
+    ]
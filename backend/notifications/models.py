@@ -21,6 +21,8 @@ class Notification(models.Model):
         ('interview_confirmation', 'Interview Confirmation'),
         ('interview_reschedule', 'Interview Reschedule'),
         ('interview_cancellation', 'Interview Cancellation'),
+        ('interview_reminder', 'Interview Reminder'),
+        ('interview_expired', 'Interview Expired'),
         ('verification_approved', 'Verification Approved'),
         ('verification_rejected', 'Verification Rejected'),
         ('general', 'General'),
@@ -0,0 +1,131 @@
+"""
+Response caching for read-heavy API views
+Cached responses are keyed on the URL, query parameters, the caller's role
+and a version number per model the view reads. Saving or deleting a row
+bumps its model's version, so the next read builds a fresh response
+instead of serving stale data
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from rest_framework.response import Response
+
+
+KEY_PREFIX = 'response-cache'
+
+# Saves that only touch these fields do not change any cached representation
+IGNORED_UPDATE_FIELDS = {'last_login', 'lastActive'}
+
+
+def version_key(model):
+    return f'{KEY_PREFIX}:version:{model._meta.label_lower}'
+
+
+def _new_version():
+    # Milliseconds rather than 1, so a version lost from the cache never
+    # comes back with a value that older cached responses were keyed on
+    return int(time.time() * 1000)
+
+
+def get_versions(models):
+    """Current version of each model, initializing missing ones"""
+    keys = [version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, _new_version(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_version(model):
+    """Invalidate every cached response that depends on model"""
+    try:
+        cache.incr(version_key(model))
+    except ValueError:
+        cache.set(version_key(model), _new_version(), timeout=None)
+
+
+def bump_version_on_change(sender, update_fields=None, raw=False, **kwargs):
+    """post_save/post_delete receiver for every model"""
+    if raw or not settings.RESPONSE_CACHE_TIMEOUT:
+        return
+    if update_fields and set(update_fields) <= IGNORED_UPDATE_FIELDS:
+        return
+    # After commit, so a concurrent read cannot cache the old rows under the new version
+    transaction.on_commit(lambda: bump_version(sender))
+
+
+def connect_signals():
+    """Bump model versions on every save and delete; called from UsersConfig.ready()"""
+    post_save.connect(bump_version_on_change, dispatch_uid='response-cache-post-save')
+    post_delete.connect(bump_version_on_change, dispatch_uid='response-cache-post-delete')
+
+
+class CachedResponseMixin:
+    """
+    Cache list and retrieve responses of a DRF viewset
+
+    Set cache_models to every model the serialized output reads from. The
+    cache is shared by all callers with the same role; roles listed in
+    cache_per_user_roles (because their queryset is filtered to their own
+    rows) get a cache per user instead. Bulk .update() calls do not send
+    signals, so code that changes cached models that way should call
+    bump_version() itself.
+    """
+
+    cache_models = ()
+    cache_actions = ('list', 'retrieve')
+    cache_per_user_roles = ()
+    cache_timeout = None
+
+    def get_cache_scope(self, request):
+        user = request.user
+        if not user.is_authenticated:
+            return 'anonymous'
+        role = 'admin' if user.is_staff else user.userType
+        if role in self.cache_per_user_roles:
+            return f'{role}:{user.pk}'
+        return role
+
+    def get_cache_key(self, request):
+        query = '&'.join(
+            f'{name}={value}'
+            for name in sorted(request.query_params)
+            for value in request.query_params.getlist(name)
+        )
+        versions = '.'.join(str(version) for version in get_versions(self.cache_models))
+        raw = f'{request.path}?{query}|{self.get_cache_scope(request)}|{versions}'
+        return f'{KEY_PREFIX}:{hashlib.sha1(raw.encode()).hexdigest()}'
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        timeout = self.cache_timeout if self.cache_timeout is not None else settings.RESPONSE_CACHE_TIMEOUT
+        if not timeout or self.action not in self.cache_actions:
+            return handler(request, *args, **kwargs)
+        # Responses can embed signed document URLs; a cached copy must expire while
+        # its signatures still have at least half their lifetime left
+        timeout = min(timeout, settings.MEDIA_SIGNED_URL_MAX_AGE // 2)
+
+        key = self.get_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            response = Response(data)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, timeout)
+            response['X-Cache'] = 'MISS'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
@@ -0,0 +1,157 @@
+"""
+Per-request database and timing instrumentation
+Counts SQL queries, measures SQL and view time, flags repeated statements
+(N+1 patterns) and reports them via Server-Timing headers and log lines
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+
+logger = logging.getLogger('riderspool.instrumentation')
+
+
+class QueryCollector:
+    """execute_wrapper that records every query run during a request"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            # Parameters are left out so the same statement run in a loop is grouped together
+            self.statements[sql] += 1
+
+    def duplicates(self, threshold):
+        """Statements executed at least `threshold` times, most repeated first"""
+        return [(sql, count) for sql, count in self.statements.most_common() if count >= threshold]
+
+
+class RequestStats:
+    """Thread-safe running totals per URL name for the current process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, url_name, queries, sql_ms, total_ms, duplicated):
+        with self._lock:
+            entry = self._stats.setdefault(url_name, {
+                'requests': 0, 'queries': 0, 'sqlMs': 0.0, 'totalMs': 0.0,
+                'maxQueries': 0, 'maxMs': 0.0, 'requestsWithDuplicates': 0,
+            })
+            entry['requests'] += 1
+            entry['queries'] += queries
+            entry['sqlMs'] += sql_ms
+            entry['totalMs'] += total_ms
+            entry['maxQueries'] = max(entry['maxQueries'], queries)
+            entry['maxMs'] = max(entry['maxMs'], total_ms)
+            if duplicated:
+                entry['requestsWithDuplicates'] += 1
+            return dict(entry)
+
+    def snapshot(self):
+        """Per URL name averages, busiest first"""
+        with self._lock:
+            items = [(name, dict(entry)) for name, entry in self._stats.items()]
+
+        summary = []
+        for name, entry in items:
+            requests = entry['requests']
+            summary.append({
+                'urlName': name,
+                'requests': requests,
+                'avgQueries': round(entry['queries'] / requests, 2),
+                'avgSqlMs': round(entry['sqlMs'] / requests, 2),
+                'avgMs': round(entry['totalMs'] / requests, 2),
+                'maxQueries': entry['maxQueries'],
+                'maxMs': round(entry['maxMs'], 2),
+                'requestsWithDuplicates': entry['requestsWithDuplicates'],
+            })
+        return sorted(summary, key=lambda item: item['requests'] * item['avgSqlMs'], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+request_stats = RequestStats()
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Records query counts, SQL time and view time for every request
+
+    Enabled with the REQUEST_INSTRUMENTATION setting. Adds a Server-Timing
+    header and logs one JSON line per request to 'riderspool.instrumentation'.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'REQUEST_INSTRUMENTATION', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.duplicate_threshold = getattr(settings, 'REQUEST_INSTRUMENTATION_DUPLICATE_THRESHOLD', 3)
+
+    def __call__(self, request):
+        collector = QueryCollector()
+        start = time.perf_counter()
+
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(collector))
+            response = self.get_response(request)
+
+        total_ms = (time.perf_counter() - start) * 1000
+        sql_ms = collector.duration * 1000
+        duplicates = collector.duplicates(self.duplicate_threshold)
+        url_name = self._url_name(request)
+
+        response['Server-Timing'] = ', '.join(filter(None, [
+            f'db;desc="{collector.count} queries";dur={sql_ms:.2f}',
+            f'dup;desc="{sum(count for _, count in duplicates)} repeated queries"' if duplicates else '',
+            f'app;dur={total_ms - sql_ms:.2f}',
+            f'total;dur={total_ms:.2f}',
+        ]))
+
+        totals = request_stats.record(url_name, collector.count, sql_ms, total_ms, bool(duplicates))
+
+        log_line = {
+            'urlName': url_name,
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'queries': collector.count,
+            'sqlMs': round(sql_ms, 2),
+            'totalMs': round(total_ms, 2),
+            'duplicates': [{'sql': sql[:300], 'count': count} for sql, count in duplicates[:5]],
+            'urlTotals': {
+                'requests': totals['requests'],
+                'avgQueries': round(totals['queries'] / totals['requests'], 2),
+                'avgMs': round(totals['totalMs'] / totals['requests'], 2),
+            },
+        }
+        logger.log(logging.WARNING if duplicates else logging.INFO, json.dumps(log_line))
+
+        return response
+
+    @staticmethod
+    def _url_name(request):
+        match = getattr(request, 'resolver_match', None)
+        if match and match.view_name:
+            return match.view_name
+        return 'unresolved'
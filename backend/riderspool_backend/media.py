@@ -0,0 +1,157 @@
+"""
+Media file serving with access checks
+ID scans and verification documents are only returned to their owner or
+an admin, or to anyone holding a short-lived signed URL issued by the API
+to such a user (so plain links and <img> tags keep working). Once a
+request is authorized the transfer is handed to the
+front proxy (X-Accel-Redirect for nginx, X-Sendfile for Apache/lighttpd);
+without one, FileResponse streams the file with the server's sendfile
+support, so no Python worker reads file contents itself
+"""
+
+import mimetypes
+import os
+import posixpath
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import SuspiciousFileOperation
+from django.db.models import Q
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse
+from django.utils._os import safe_join
+from django.views.decorators.http import require_safe
+from rest_framework import serializers
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+
+from users.image_pipeline import is_derivative_name
+from users.models import ProviderProfile
+from users.storage import is_blob_name
+from verifications.models import VerificationDocument
+
+
+# Prefixes that hold identity documents
+PROTECTED_PREFIXES = ('documents/', 'verifications/', 'uploads/')
+
+_signer = signing.TimestampSigner(salt='riderspool.media')
+
+
+def sign_media_name(name):
+    """Signature token granting temporary access to one media file"""
+    return _signer.sign(name)[len(name) + 1:]
+
+
+def has_valid_signature(name, token):
+    try:
+        _signer.unsign(f'{name}:{token}', max_age=settings.MEDIA_SIGNED_URL_MAX_AGE)
+    except signing.BadSignature:
+        return False
+    return True
+
+
+def protected_media_url(name):
+    """MEDIA_URL path of a protected file with a signature attached"""
+    return f'{settings.MEDIA_URL}{quote(name)}?signature={sign_media_name(name)}'
+
+
+class ProtectedFileField(serializers.FileField):
+    """
+    FileField for documents served with access checks
+
+    Viewers allowed to open the file get a signed URL; others (e.g. an
+    employer viewing a provider profile) get the plain URL, which
+    serve_media refuses. Without a request in the context (emails, tasks)
+    there is nobody to check, so the plain URL is returned too.
+    """
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        request = self.context.get('request')
+        if request is None:
+            return value.url
+        if can_access(request.user, value.name):
+            return request.build_absolute_uri(protected_media_url(value.name))
+        return request.build_absolute_uri(value.url)
+
+
+def _authenticate(request):
+    """User from a JWT Authorization header, falling back to the admin session"""
+    try:
+        result = JWTAuthentication().authenticate(request)
+    except (InvalidToken, AuthenticationFailed):
+        return None
+    if result is not None:
+        return result[0]
+    return request.user if request.user.is_authenticated else None
+
+
+def _is_public(name):
+    """Profile photos and their thumbnails can be viewed by anyone"""
+    if name.startswith(PROTECTED_PREFIXES):
+        return False
+    if is_blob_name(name):
+        # Blobs hold documents as well as photos; thumbnails are only made for photos
+        return is_derivative_name(name) or ProviderProfile.objects.filter(profilePhoto=name).exists()
+    return True
+
+
+def can_access(user, name):
+    """Whether user may read the protected media file name"""
+    if name.startswith('uploads/') or not user.is_authenticated:
+        # Partial chunked uploads are never served
+        return False
+    if user.is_admin or user.is_staff:
+        return True
+    if name.startswith('verifications/'):
+        return VerificationDocument.objects.filter(
+            Q(document=name) | Q(preview=name), verification__provider=user
+        ).exists()
+    return ProviderProfile.objects.filter(Q(idDocument=name) | Q(licenseDocument=name), user=user).exists()
+
+
+def send_file(name, full_path, cache_control):
+    backend = getattr(settings, 'MEDIA_SENDFILE_BACKEND', '')
+    content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+
+    if backend == 'nginx':
+        response = HttpResponse(content_type=content_type)
+        prefix = settings.MEDIA_ACCEL_REDIRECT_PREFIX.rstrip('/')
+        response['X-Accel-Redirect'] = quote(f'{prefix}/{name}')
+    elif backend == 'xsendfile':
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = full_path
+    else:
+        # Served through wsgi.file_wrapper, which gunicorn implements with os.sendfile
+        response = FileResponse(open(full_path, 'rb'), content_type=content_type)
+
+    response['Cache-Control'] = cache_control
+    response['X-Content-Type-Options'] = 'nosniff'
+    return response
+
+
+@require_safe
+def serve_media(request, path):
+    """Serve a file from MEDIA_ROOT, checking access to identity documents"""
+    name = posixpath.normpath(path).lstrip('/')
+    if name.startswith('..') or name == '.':
+        raise Http404
+
+    public = _is_public(name)
+    if not public and not has_valid_signature(name, request.GET.get('signature', '')):
+        user = _authenticate(request)
+        if user is None:
+            return JsonResponse({'error': 'Authentication required'}, status=401)
+        if not can_access(user, name):
+            # Same answer as a missing file, so document names cannot be probed
+            raise Http404
+
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, name)
+    except SuspiciousFileOperation:
+        raise Http404
+    if not os.path.isfile(full_path):
+        raise Http404
+
+    return send_file(name, full_path, 'public, max-age=86400' if public else 'private, max-age=300')
@@ -62,6 +62,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'riderspool_backend.instrumentation.QueryInstrumentationMiddleware',  # Enabled by REQUEST_INSTRUMENTATION
+    'riderspool_backend.slow_queries.SlowQueryMiddleware',  # Enabled by SLOW_QUERY_THRESHOLD_MS
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Serve static files in production
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -166,6 +168,18 @@ AUTH_USER_MODEL = 'users.User'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# How protected media is transferred after the access check: 'nginx' (X-Accel-Redirect),
+# 'xsendfile' (X-Sendfile) or empty to stream with FileResponse
+MEDIA_SENDFILE_BACKEND = os.getenv('MEDIA_SENDFILE_BACKEND', '')
+# Internal nginx location that maps to MEDIA_ROOT
+MEDIA_ACCEL_REDIRECT_PREFIX = os.getenv('MEDIA_ACCEL_REDIRECT_PREFIX', '/protected-media/')
+
+# Lifetime in seconds of the signed URLs the API returns for protected documents
+MEDIA_SIGNED_URL_MAX_AGE = int(os.getenv('MEDIA_SIGNED_URL_MAX_AGE', '3600'))
+
+# Part files of resumable document uploads (defaults to MEDIA_ROOT/uploads/partial)
+CHUNKED_UPLOAD_DIR = os.getenv('CHUNKED_UPLOAD_DIR', '')
+
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
@@ -224,6 +238,8 @@ CORS_ALLOW_HEADERS = [
     'user-agent',
     'x-csrftoken',
     'x-requested-with',
+    # Byte offset of resumable document upload chunks
+    'upload-offset',
 ]
 
 # # Email Configuration
@@ -241,3 +257,87 @@ CORS_ALLOW_HEADERS = [
 
 # Frontend URL for email links
 FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:5173')
+
+# Cache (shared Redis when REDIS_URL is set; per-process memory otherwise)
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Seconds a cached API response is kept (0 disables response caching). Writes
+# invalidate cached responses through the cache itself, so with the per-process
+# memory cache other workers, management commands and background threads would
+# keep serving stale data; caching is therefore off unless Redis is configured
+RESPONSE_CACHE_TIMEOUT = int(os.getenv('RESPONSE_CACHE_TIMEOUT', '300' if os.getenv('REDIS_URL') else '0'))
+
+# Seconds a provider's weekly working-hours template is cached (0 disables);
+# saving their settings drops it, which only reaches other workers through Redis
+WORKING_HOURS_CACHE_TIMEOUT = int(os.getenv('WORKING_HOURS_CACHE_TIMEOUT', '86400' if os.getenv('REDIS_URL') else '0'))
+
+# How long an admin keeps verifications claimed from the review queue
+VERIFICATION_CLAIM_LEASE_MINUTES = int(os.getenv('VERIFICATION_CLAIM_LEASE_MINUTES', '15'))
+
+# Hours before a confirmed interview that reminders are emailed (send_interview_reminders)
+INTERVIEW_REMINDER_LEAD_HOURS = [
+    int(hours) for hours in os.getenv('INTERVIEW_REMINDER_LEAD_HOURS', '24,2').split(',') if hours.strip()
+]
+
+# Confirmed interviews not marked completed this long after their start become no-shows (expire_interviews)
+INTERVIEW_NO_SHOW_GRACE_HOURS = int(os.getenv('INTERVIEW_NO_SHOW_GRACE_HOURS', '48'))
+
+# Provider ranking (refresh_rank_scores): feedback loses half its weight every
+# PROVIDER_RANK_HALF_LIFE_DAYS, and scores are pulled towards neutral as if
+# every provider had PROVIDER_RANK_PRIOR_WEIGHT extra average reviews
+PROVIDER_RANK_HALF_LIFE_DAYS = float(os.getenv('PROVIDER_RANK_HALF_LIFE_DAYS', '180'))
+PROVIDER_RANK_PRIOR_WEIGHT = float(os.getenv('PROVIDER_RANK_PRIOR_WEIGHT', '5'))
+
+# Background tasks (thumbnails, document processing, batched emails)
+BACKGROUND_TASK_WORKERS = int(os.getenv('BACKGROUND_TASK_WORKERS', '4'))
+# Run background tasks inline instead of on the thread pool
+BACKGROUND_TASKS_EAGER = os.getenv('BACKGROUND_TASKS_EAGER', 'False').lower() == 'true'
+
+# Request instrumentation (query counts, SQL time and Server-Timing headers per request)
+REQUEST_INSTRUMENTATION = os.getenv('REQUEST_INSTRUMENTATION', 'False').lower() == 'true'
+# Same SQL statement repeated this many times in one request is reported as a duplicate (N+1)
+REQUEST_INSTRUMENTATION_DUPLICATE_THRESHOLD = int(os.getenv('REQUEST_INSTRUMENTATION_DUPLICATE_THRESHOLD', '3'))
+
+# Slow query logging (0 disables it)
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv('SLOW_QUERY_THRESHOLD_MS', '0'))
+# Capture EXPLAIN output for slow SELECTs (PostgreSQL only)
+SLOW_QUERY_EXPLAIN = os.getenv('SLOW_QUERY_EXPLAIN', 'False').lower() == 'true'
+# Number of distinct slow statements kept for the admin slow query report
+SLOW_QUERY_TOP_N = int(os.getenv('SLOW_QUERY_TOP_N', '50'))
+
+# Logging
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'simple': {
+            'format': '{asctime} {levelname} {name} {message}',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'simple',
+        },
+    },
+    'loggers': {
+        'riderspool': {
+            'handlers': ['console'],
+            'level': os.getenv('RIDERSPOOL_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
+}
@@ -0,0 +1,160 @@
+"""
+Slow query logging
+Times every query made while serving a request, logs the ones above
+SLOW_QUERY_THRESHOLD_MS with the view and source line that issued them,
+optionally captures EXPLAIN output on PostgreSQL and keeps the slowest
+statements in a rolling in-process table
+"""
+
+import logging
+import os
+import threading
+import time
+import traceback
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.utils import timezone
+
+
+logger = logging.getLogger('riderspool.slow_queries')
+
+# Entry points and middleware are on every stack, so they never explain a query
+_PROJECT_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def find_calling_frame():
+    """Return 'path:line in function' for the innermost app frame on the stack"""
+    base_dir = str(settings.BASE_DIR)
+    for frame in reversed(traceback.extract_stack()):
+        filename = os.path.abspath(frame.filename)
+        if not filename.startswith(base_dir) or filename.startswith(_PROJECT_PACKAGE_DIR):
+            continue
+        if 'site-packages' in filename or f'{os.sep}venv{os.sep}' in filename:
+            continue
+        if not os.path.isfile(filename) or os.path.basename(filename) == 'manage.py':
+            continue
+        return f'{os.path.relpath(filename, base_dir)}:{frame.lineno} in {frame.name}'
+    return None
+
+
+def explain(connection, sql, params):
+    """Run EXPLAIN for a SELECT on PostgreSQL, bypassing the execute wrappers"""
+    if connection.vendor != 'postgresql' or not sql.lstrip().upper().startswith('SELECT'):
+        return None
+    try:
+        with connection.connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN {sql}', params)
+            return '\n'.join(row[0] for row in cursor.fetchall())
+    except Exception as e:
+        return f'EXPLAIN failed: {e}'
+
+
+class SlowQueryLog:
+    """Rolling table of the slowest distinct statements seen by this process"""
+
+    def __init__(self, size=50):
+        self.size = size
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def record(self, sql, duration_ms, view, frame, plan):
+        with self._lock:
+            entry = self._entries.get(sql)
+            if entry is None:
+                entry = self._entries[sql] = {
+                    'sql': sql,
+                    'occurrences': 0,
+                    'maxMs': 0.0,
+                    'totalMs': 0.0,
+                }
+            entry['occurrences'] += 1
+            entry['totalMs'] += duration_ms
+            entry['lastSeen'] = timezone.now()
+            if duration_ms >= entry['maxMs']:
+                entry.update({'maxMs': duration_ms, 'view': view, 'frame': frame})
+                if plan:
+                    entry['explain'] = plan
+
+            if len(self._entries) > self.size:
+                fastest = min(self._entries.values(), key=lambda item: item['maxMs'])
+                del self._entries[fastest['sql']]
+
+    def snapshot(self):
+        """Entries ordered slowest first"""
+        with self._lock:
+            entries = [dict(entry) for entry in self._entries.values()]
+        for entry in entries:
+            entry['maxMs'] = round(entry['maxMs'], 2)
+            entry['avgMs'] = round(entry.pop('totalMs') / entry['occurrences'], 2)
+        return sorted(entries, key=lambda item: item['maxMs'], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
+
+
+slow_query_log = SlowQueryLog(size=getattr(settings, 'SLOW_QUERY_TOP_N', 50))
+
+
+class SlowQueryWrapper:
+    """execute_wrapper that reports queries slower than the threshold"""
+
+    def __init__(self, request, threshold_ms, capture_explain):
+        self.request = request
+        self.threshold_ms = threshold_ms
+        self.capture_explain = capture_explain
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            if duration_ms >= self.threshold_ms:
+                self.report(sql, params, many, context, duration_ms)
+
+    def report(self, sql, params, many, context, duration_ms):
+        view = self._view_name()
+        frame = find_calling_frame()
+        plan = None
+        if self.capture_explain and not many:
+            plan = explain(context['connection'], sql, params)
+
+        logger.warning(
+            'Slow query (%.1f ms) in %s at %s: %s%s',
+            duration_ms, view, frame or 'unknown', sql[:1000],
+            f'\n{plan}' if plan else ''
+        )
+        slow_query_log.record(sql, duration_ms, view, frame, plan)
+
+    def _view_name(self):
+        match = getattr(self.request, 'resolver_match', None)
+        if match:
+            return f'{match.view_name} ({match._func_path})'
+        return self.request.path
+
+
+class SlowQueryMiddleware:
+    """
+    Logs queries slower than SLOW_QUERY_THRESHOLD_MS
+
+    Disabled when the threshold is 0. Set SLOW_QUERY_EXPLAIN to also store
+    the PostgreSQL query plan of each slow SELECT.
+    """
+
+    def __init__(self, get_response):
+        self.threshold_ms = getattr(settings, 'SLOW_QUERY_THRESHOLD_MS', 0)
+        if not self.threshold_ms:
+            raise MiddlewareNotUsed
+        self.capture_explain = getattr(settings, 'SLOW_QUERY_EXPLAIN', False)
+        self.get_response = get_response
+
+    def __call__(self, request):
+        wrapper = SlowQueryWrapper(request, self.threshold_ms, self.capture_explain)
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(wrapper))
+            return self.get_response(request)
@@ -0,0 +1,58 @@
+"""
+Lightweight background task runner
+Runs slow work (image processing, email batches) on a process-wide thread
+pool after the current database transaction commits, so requests return
+without waiting for it
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection, transaction
+
+
+logger = logging.getLogger('riderspool.tasks')
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'BACKGROUND_TASK_WORKERS', 4),
+                thread_name_prefix='riderspool-task',
+            )
+        return _executor
+
+
+def _run(func, args, kwargs):
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logger.exception('Background task %s failed', getattr(func, '__qualname__', func))
+    finally:
+        # Each worker thread has its own connection; don't leave it open between tasks
+        if not getattr(settings, 'BACKGROUND_TASKS_EAGER', False):
+            connection.close()
+
+
+def run_in_background(func, *args, **kwargs):
+    """
+    Schedule func(*args, **kwargs) on the background pool
+
+    The task is submitted once the current transaction commits (immediately
+    outside a transaction). With BACKGROUND_TASKS_EAGER it runs inline instead,
+    which is what tests and management commands use.
+    """
+    def submit():
+        if getattr(settings, 'BACKGROUND_TASKS_EAGER', False):
+            _run(func, args, kwargs)
+        else:
+            _get_executor().submit(_run, func, args, kwargs)
+
+    transaction.on_commit(submit)
@@ -2,9 +2,10 @@
 URL configuration for riderspool_backend project.
 """
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.conf import settings
-from django.conf.urls.static import static
+
+from .media import serve_media
 
 urlpatterns = [
     # Django Admin
@@ -18,6 +19,7 @@ urlpatterns = [
     path('api/', include('jobs.urls')),
 ]
 
-# Serve media files in development
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# Media files, with owner/admin checks for identity documents
+urlpatterns += [
+    re_path(rf'^{settings.MEDIA_URL.strip("/")}/(?P<path>.*)$', serve_media, name='media'),
+]
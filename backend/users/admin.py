@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from .models import User, ProviderProfile, EmployerProfile, SavedProvider, UserSettings
+from .models import User, ProviderProfile, EmployerProfile, SavedProvider, UserSettings, StoredBlob
 
 
 @admin.register(User)
@@ -31,10 +31,14 @@ class UserAdmin(BaseUserAdmin):
 
 @admin.register(ProviderProfile)
 class ProviderProfileAdmin(admin.ModelAdmin):
-    list_display = ['user', 'category', 'experience', 'availability', 'rating', 'totalInterviews']
+    list_display = ['user', 'category', 'experience', 'availability', 'rating', 'ratingCount', 'totalInterviews']
     list_filter = ['category', 'availability', 'createdAt']
     search_fields = ['user__fullName', 'user__email', 'registeredName', 'idNumber', 'licenseNumber']
-    readonly_fields = ['createdAt', 'updatedAt']
+    # Maintained from interview feedback
+    readonly_fields = [
+        'rating', 'ratingSum', 'ratingCount', 'rankScore', 'rankWeightedSum', 'rankWeight', 'rankTotalsAt',
+        'createdAt', 'updatedAt'
+    ]
 
 
 @admin.register(EmployerProfile)
@@ -59,3 +63,11 @@ class UserSettingsAdmin(admin.ModelAdmin):
     list_filter = ['emailNotifications', 'smsNotifications', 'availableWeekends', 'availableHolidays']
     search_fields = ['user__fullName', 'user__email']
     readonly_fields = ['createdAt', 'updatedAt']
+
+
+@admin.register(StoredBlob)
+class StoredBlobAdmin(admin.ModelAdmin):
+    list_display = ['name', 'size', 'originalSize', 'refCount', 'createdAt', 'updatedAt']
+    list_filter = ['createdAt']
+    search_fields = ['name', 'digest']
+    readonly_fields = ['name', 'digest', 'size', 'originalSize', 'refCount', 'createdAt', 'updatedAt']
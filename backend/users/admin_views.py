@@ -1,12 +1,19 @@
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, parser_classes
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from rest_framework.permissions import IsAdminUser
 from django.db.models import Count, Q, Avg
+from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
+import csv
+import io
 
 from .models import User, ProviderProfile
+from .importers import ProviderImporter, detect_format, iter_rows, SUPPORTED_FORMATS
+from riderspool_backend.instrumentation import request_stats
+from riderspool_backend.slow_queries import slow_query_log
 from interviews.models import Interview
 from verifications.models import Verification
 from notifications.models import Notification
@@ -51,6 +58,8 @@ def admin_dashboard_stats(request):
     confirmed_interviews = Interview.objects.filter(status='confirmed').count()
     completed_interviews = Interview.objects.filter(status='completed').count()
     cancelled_interviews = Interview.objects.filter(status='cancelled').count()
+    expired_interviews = Interview.objects.filter(status='expired').count()
+    no_show_interviews = Interview.objects.filter(status='no_show').count()
 
     # Interviews in last 30 days
     recent_interviews = Interview.objects.filter(createdAt__gte=thirty_days_ago).count()
@@ -121,6 +130,8 @@ def admin_dashboard_stats(request):
             'confirmed': confirmed_interviews,
             'completed': completed_interviews,
             'cancelled': cancelled_interviews,
+            'expired': expired_interviews,
+            'no_show': no_show_interviews,
             'recent_30_days': recent_interviews,
             'upcoming_7_days': upcoming_interviews,
         },
@@ -195,3 +206,70 @@ def admin_interview_analytics(request):
             'days': days,
         },
     }, status=status.HTTP_200_OK)
+
+
+@api_view(['GET', 'DELETE'])
+@permission_classes([IsAdminUser])
+def admin_slow_queries(request):
+    """
+    Get the slowest queries and per-endpoint query stats recorded by this server process
+
+    Returns:
+    - Slowest distinct SQL statements with the view and source line that issued them
+    - Per URL name request/query averages (when REQUEST_INSTRUMENTATION is on)
+
+    DELETE clears both tables.
+    """
+    if request.method == 'DELETE':
+        slow_query_log.reset()
+        request_stats.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    return Response({
+        'thresholdMs': settings.SLOW_QUERY_THRESHOLD_MS,
+        'explainEnabled': settings.SLOW_QUERY_EXPLAIN,
+        'slowQueries': slow_query_log.snapshot(),
+        'endpoints': request_stats.snapshot(),
+    }, status=status.HTTP_200_OK)
+
+
+@api_view(['POST'])
+@permission_classes([IsAdminUser])
+@parser_classes([MultiPartParser])
+def admin_import_providers(request):
+    """
+    Bulk import providers from an uploaded CSV or JSONL file
+
+    Form fields:
+    - file: The CSV/JSONL file
+    - format: Optional, 'csv' or 'jsonl' (detected from the file name by default)
+    - dry_run: Optional, validate without creating rows
+
+    Returns:
+    - Row counts and per-row validation errors
+    """
+    upload = request.FILES.get('file')
+    if not upload:
+        return Response({'error': 'file is required'}, status=status.HTTP_400_BAD_REQUEST)
+
+    fmt = request.data.get('format') or detect_format(upload.name)
+    if fmt not in SUPPORTED_FORMATS:
+        return Response(
+            {'error': f'format must be one of: {", ".join(SUPPORTED_FORMATS)}'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    dry_run = str(request.data.get('dry_run', '')).lower() in ('1', 'true', 'yes')
+    # Validate in this process; worker pools are for the import_providers command
+    importer = ProviderImporter(workers=1, dry_run=dry_run)
+
+    stream = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+    try:
+        report = importer.run(iter_rows(stream, fmt))
+    except (UnicodeDecodeError, csv.Error) as e:
+        return Response(
+            {'error': f'Could not read the file (it must be UTF-8 {fmt.upper()}): {e}'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    return Response(report.to_dict(), status=status.HTTP_200_OK)
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self):
+        from . import signals
+        signals.connect_blob_receivers()
+        from riderspool_backend.cache import connect_signals
+        connect_signals()
@@ -0,0 +1,143 @@
+"""
+Reference counting and garbage collection for content-addressed blobs
+"""
+
+import os
+from collections import Counter
+from datetime import timedelta
+
+from django.apps import apps
+from django.db import IntegrityError, transaction
+from django.db.models import F, FileField
+from django.utils import timezone
+
+from .models import StoredBlob
+from .storage import document_storage, is_blob_name, BLOB_PREFIX
+
+
+_blob_fields_cache = {}
+
+
+def blob_fields(model):
+    """Names of the model's file fields backed by content-addressed storage"""
+    if model not in _blob_fields_cache:
+        _blob_fields_cache[model] = [
+            field.name for field in model._meta.concrete_fields
+            if isinstance(field, FileField) and field.storage is document_storage
+        ]
+    return _blob_fields_cache[model]
+
+
+def models_with_blob_fields():
+    return [(model, blob_fields(model)) for model in apps.get_models() if blob_fields(model)]
+
+
+def retain(name):
+    """Add a reference to a blob, registering it on first use"""
+    if not is_blob_name(name):
+        return
+    now = timezone.now()
+    if StoredBlob.objects.filter(name=name).update(refCount=F('refCount') + 1, updatedAt=now):
+        return
+    try:
+        with transaction.atomic():
+            StoredBlob.objects.create(
+                name=name,
+                digest=os.path.splitext(os.path.basename(name))[0],
+                size=document_storage.size(name) if document_storage.exists(name) else 0,
+                refCount=1,
+            )
+    except IntegrityError:
+        # Registered concurrently by another request
+        StoredBlob.objects.filter(name=name).update(refCount=F('refCount') + 1, updatedAt=now)
+
+
+def release(name):
+    """Drop a reference to a blob; the file is removed later by collect_garbage()"""
+    if not is_blob_name(name):
+        return
+    StoredBlob.objects.filter(name=name, refCount__gt=0).update(
+        refCount=F('refCount') - 1, updatedAt=timezone.now()
+    )
+
+
+def count_references():
+    """Count how many model fields point at each blob, one query per field"""
+    counts = Counter()
+    for model, fields in models_with_blob_fields():
+        for field in fields:
+            names = model._base_manager.filter(**{f'{field}__startswith': f'{BLOB_PREFIX}/'}).values_list(field, flat=True)
+            counts.update(names.iterator())
+    return counts
+
+
+def recount():
+    """Rebuild every StoredBlob.refCount from the model fields"""
+    counts = count_references()
+    now = timezone.now()
+    with transaction.atomic():
+        for blob in StoredBlob.objects.select_for_update().only('id', 'name', 'refCount'):
+            expected = counts.pop(blob.name, 0)
+            if blob.refCount != expected:
+                StoredBlob.objects.filter(pk=blob.pk).update(refCount=expected, updatedAt=now)
+        StoredBlob.objects.bulk_create([
+            StoredBlob(
+                name=name,
+                digest=os.path.splitext(os.path.basename(name))[0],
+                size=document_storage.size(name) if document_storage.exists(name) else 0,
+                refCount=count,
+            )
+            for name, count in counts.items()
+        ])
+
+
+def collect_garbage(grace=timedelta(hours=1), dry_run=False):
+    """
+    Delete unreferenced blobs and orphaned files older than the grace period
+
+    The grace period protects uploads that are stored but whose model row
+    has not been saved yet.
+
+    Returns:
+        List of deleted storage names
+    """
+    cutoff = timezone.now() - grace
+    deleted = []
+
+    for blob in StoredBlob.objects.filter(refCount__lte=0, updatedAt__lt=cutoff).only('id', 'name'):
+        if not dry_run:
+            with transaction.atomic():
+                # Re-checked under the row lock that ContentAddressedStorage._save() and
+                # retain() also take, so a blob saved or retained meanwhile is kept
+                locked = StoredBlob.objects.select_for_update().filter(
+                    pk=blob.pk, refCount__lte=0, updatedAt__lt=cutoff
+                ).first()
+                if locked is None:
+                    continue
+                document_storage.delete(blob.name)
+                locked.delete()
+        deleted.append(blob.name)
+
+    # Files on disk without a StoredBlob row (e.g. a request that failed after storing)
+    root = document_storage.path(BLOB_PREFIX)
+    if not os.path.isdir(root):
+        return deleted
+
+    known = set(StoredBlob.objects.values_list('name', flat=True).iterator())
+    known.update(count_references())
+    # Derivatives (thumbnails) are named <digest>.<size>.<ext> and live as long as their blob
+    known_digests = {os.path.basename(name).split('.')[0] for name in known}
+    cutoff_timestamp = cutoff.timestamp()
+    for directory, _, filenames in os.walk(root):
+        for filename in filenames:
+            full_path = os.path.join(directory, filename)
+            name = os.path.relpath(full_path, document_storage.location).replace(os.sep, '/')
+            if name in known or filename.split('.')[0] in known_digests:
+                continue
+            if os.path.getmtime(full_path) >= cutoff_timestamp:
+                continue
+            if not dry_run:
+                os.unlink(full_path)
+            deleted.append(name)
+
+    return deleted
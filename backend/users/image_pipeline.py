@@ -0,0 +1,194 @@
+"""
+Image processing for uploaded photos and documents
+Generates fixed-size WebP and JPEG thumbnails of profile photos, and
+recompresses ID and license scans with their EXIF metadata removed
+"""
+
+import io
+import logging
+import os
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+
+from riderspool_backend.cache import bump_version
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+from .storage import document_storage
+
+
+logger = logging.getLogger('riderspool.images')
+
+# Longest edge in pixels of each generated thumbnail
+THUMBNAIL_SIZES = (160, 320, 640)
+# Size exposed to list endpoints as profilePhotoThumb
+LIST_THUMBNAIL_SIZE = 320
+
+WEBP_SUPPORTED = features.check('webp')
+
+# Longest edge of a processed document scan; still legible for ID numbers
+DOCUMENT_MAX_DIMENSION = 2400
+DOCUMENT_JPEG_QUALITY = 85
+DOCUMENT_IMAGE_FORMATS = ('JPEG', 'MPO', 'PNG', 'WEBP')
+
+# Thumbnails have fixed names next to their blob (collect_blobs keeps them by
+# digest), so a concurrent or repeated run must overwrite rather than save
+# under a new suffixed name
+derivative_storage = FileSystemStorage(allow_overwrite=True)
+
+
+def derivative_name(name, size, extension):
+    """Storage name of a derivative, e.g. blobs/ab/<digest>.320.webp"""
+    base, _ = os.path.splitext(name)
+    return f'{base}.{size}.{extension}'
+
+
+def is_derivative_name(name):
+    """Whether a storage name is a thumbnail produced by derivative_name()"""
+    parts = os.path.basename(name).split('.')
+    return len(parts) == 3 and parts[1].isdigit() and int(parts[1]) in THUMBNAIL_SIZES
+
+
+def list_thumbnail_name(photo_name):
+    """Name of the thumbnail shown in provider lists for a profile photo"""
+    return derivative_name(photo_name, LIST_THUMBNAIL_SIZE, 'webp' if WEBP_SUPPORTED else 'jpg')
+
+
+def _encode(image, image_format):
+    buffer = io.BytesIO()
+    if image_format == 'WEBP':
+        image.save(buffer, 'WEBP', quality=80, method=4)
+    else:
+        image.save(buffer, 'JPEG', quality=82, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def generate_thumbnails(photo_name):
+    """
+    Create every thumbnail size for a stored photo
+
+    Derivatives that already exist are skipped, so this is safe to re-run.
+
+    Returns:
+        Name of the list thumbnail, or None if the photo could not be decoded
+    """
+    targets = []
+    for size in THUMBNAIL_SIZES:
+        if WEBP_SUPPORTED:
+            targets.append((size, 'WEBP', derivative_name(photo_name, size, 'webp')))
+        targets.append((size, 'JPEG', derivative_name(photo_name, size, 'jpg')))
+
+    missing = [target for target in targets if not derivative_storage.exists(target[2])]
+    if not missing:
+        return list_thumbnail_name(photo_name)
+
+    try:
+        with document_storage.open(photo_name, 'rb') as photo:
+            with Image.open(photo) as original:
+                original.draft('RGB', (max(THUMBNAIL_SIZES), max(THUMBNAIL_SIZES)))
+                image = ImageOps.exif_transpose(original).convert('RGB')
+    except (OSError, UnidentifiedImageError) as e:
+        logger.warning('Could not create thumbnails for %s: %s', photo_name, e)
+        return None
+
+    # Resize from the largest size down so each step works on a smaller image
+    resized = {}
+    current = image
+    for size in sorted(THUMBNAIL_SIZES, reverse=True):
+        current = current.copy()
+        current.thumbnail((size, size), Image.Resampling.LANCZOS)
+        resized[size] = current
+
+    for size, image_format, name in missing:
+        derivative_storage.save(name, ContentFile(_encode(resized[size], image_format)))
+
+    return list_thumbnail_name(photo_name)
+
+
+def generate_profile_photo_thumbnails(profile_id):
+    """Background task: build thumbnails for a profile photo and record the list thumbnail"""
+    from .models import ProviderProfile
+
+    photo_name = ProviderProfile.objects.filter(pk=profile_id).values_list('profilePhoto', flat=True).first()
+    if not photo_name:
+        return
+
+    thumbnail = generate_thumbnails(photo_name)
+    if thumbnail:
+        # Only record it if the photo was not replaced while we were working
+        if ProviderProfile.objects.filter(pk=profile_id, profilePhoto=photo_name).update(profilePhotoThumb=thumbnail):
+            bump_version(ProviderProfile)
+
+
+def recompress_document(file, original_size):
+    """
+    Re-encode a document scan: apply the EXIF orientation, downsample to
+    DOCUMENT_MAX_DIMENSION, and save without EXIF or other metadata
+
+    Scans with an alpha channel stay PNG; everything else becomes JPEG.
+
+    Returns:
+        (bytes, extension), or None if the file is not an image or the
+        original is already smaller and carries no metadata
+    """
+    try:
+        with Image.open(file) as original:
+            if original.format not in DOCUMENT_IMAGE_FORMATS:
+                return None
+            has_metadata = bool(original.getexif()) or any(
+                key in original.info for key in ('exif', 'icc_profile', 'xmp', 'comment')
+            )
+            original.draft('RGB', (DOCUMENT_MAX_DIMENSION, DOCUMENT_MAX_DIMENSION))
+            image = ImageOps.exif_transpose(original)
+            image.thumbnail((DOCUMENT_MAX_DIMENSION, DOCUMENT_MAX_DIMENSION), Image.Resampling.LANCZOS)
+
+            buffer = io.BytesIO()
+            if image.mode in ('RGBA', 'LA', 'PA') or (image.mode == 'P' and 'transparency' in image.info):
+                image.save(buffer, 'PNG', optimize=True)
+                extension = '.png'
+            else:
+                image.convert('RGB').save(
+                    buffer, 'JPEG', quality=DOCUMENT_JPEG_QUALITY, optimize=True, progressive=True
+                )
+                extension = '.jpg'
+    except UnidentifiedImageError:
+        # PDFs and other non-image documents are stored as uploaded
+        return None
+    except (OSError, Image.DecompressionBombError) as e:
+        logger.warning('Could not recompress document: %s', e)
+        return None
+
+    data = buffer.getvalue()
+    if len(data) >= original_size and not has_metadata:
+        return None
+    return data, extension
+
+
+def process_provider_document(profile_id, field):
+    """Background task: recompress a provider's ID or license scan in place"""
+    from .blobs import retain, release
+    from .models import ProviderProfile, StoredBlob
+
+    name = ProviderProfile.objects.filter(pk=profile_id).values_list(field, flat=True).first()
+    if not name or StoredBlob.objects.filter(name=name, originalSize__isnull=False).exists():
+        return
+
+    original_size = document_storage.size(name)
+    with document_storage.open(name, 'rb') as document:
+        result = recompress_document(document, original_size)
+
+    if result is None:
+        StoredBlob.objects.filter(name=name).update(originalSize=original_size)
+        return
+
+    data, extension = result
+    new_name = document_storage.save(os.path.splitext(name)[0] + extension, ContentFile(data))
+    with transaction.atomic():
+        # Only swap the file if the provider has not uploaded another one meanwhile;
+        # otherwise the new blob stays unreferenced and collect_blobs removes it
+        if ProviderProfile.objects.filter(pk=profile_id, **{field: name}).update(**{field: new_name}):
+            retain(new_name)
+            release(name)
+            transaction.on_commit(lambda: bump_version(ProviderProfile))
+        StoredBlob.objects.filter(name=new_name).update(originalSize=original_size)
@@ -0,0 +1,215 @@
+"""
+Bulk provider import for onboarding fleets of riders
+Streams CSV/JSONL rows, validates them, hashes passwords in a process pool
+and bulk inserts User + ProviderProfile rows in batches
+"""
+
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.db import transaction, DatabaseError
+
+from .models import User, ProviderProfile
+from .serializers import ProviderImportRowSerializer
+
+
+SUPPORTED_FORMATS = ('csv', 'jsonl')
+
+
+def _hash_password(raw_password):
+    """Hash a single password (runs inside the worker processes)"""
+    return make_password(raw_password or None)
+
+
+def detect_format(filename, default='csv'):
+    """Guess the import format from a file name"""
+    name = (filename or '').lower()
+    if name.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    if name.endswith('.csv'):
+        return 'csv'
+    return default
+
+
+def iter_rows(stream, fmt):
+    """
+    Lazily read rows from a text stream
+
+    Yields:
+        (line_number, row, error) tuples - row is None when the line could not be parsed
+    """
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(f'Unsupported import format: {fmt}')
+
+    if fmt == 'jsonl':
+        for line_number, line in enumerate(stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield line_number, None, f'Invalid JSON: {e}'
+                continue
+            if not isinstance(row, dict):
+                yield line_number, None, 'Each line must be a JSON object'
+                continue
+            yield line_number, row, None
+        return
+
+    reader = csv.DictReader(stream)
+    for row in reader:
+        # Drop empty cells and overflow columns so optional fields fall back to defaults
+        cleaned = {
+            key.strip(): value.strip()
+            for key, value in row.items()
+            if key is not None and isinstance(value, str) and value.strip() != ''
+        }
+        if cleaned:
+            yield reader.line_num, cleaned, None
+
+
+class ImportReport:
+    """Outcome of a bulk import run"""
+
+    def __init__(self):
+        self.total = 0
+        self.created = 0
+        self.valid = 0
+        self.errors = []
+
+    def add_error(self, line, email, errors):
+        self.errors.append({'line': line, 'email': email, 'errors': errors})
+
+    def to_dict(self):
+        return {
+            'total': self.total,
+            'valid': self.valid,
+            'created': self.created,
+            'failed': len(self.errors),
+            'errors': self.errors,
+        }
+
+
+class ProviderImporter:
+    """Validates and bulk creates provider accounts with their profiles"""
+
+    def __init__(self, batch_size=500, workers=None, dry_run=False):
+        self.batch_size = max(1, batch_size)
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.dry_run = dry_run
+
+    def run(self, rows):
+        """
+        Import rows produced by iter_rows()
+
+        Returns:
+            ImportReport
+        """
+        report = ImportReport()
+        seen_emails = set()
+        batch = []
+
+        executor = None
+        if self.workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers, initializer=django.setup)
+
+        try:
+            for line_number, row, error in rows:
+                report.total += 1
+
+                if error:
+                    report.add_error(line_number, None, error)
+                    continue
+
+                serializer = ProviderImportRowSerializer(data=row)
+                if not serializer.is_valid():
+                    report.add_error(line_number, row.get('email'), serializer.errors)
+                    continue
+
+                data = serializer.validated_data
+                if data['email'] in seen_emails:
+                    report.add_error(line_number, data['email'], {'email': ['Duplicate email in import file']})
+                    continue
+                seen_emails.add(data['email'])
+
+                batch.append((line_number, data))
+                if len(batch) >= self.batch_size:
+                    self._flush(batch, executor, report)
+                    batch = []
+
+            if batch:
+                self._flush(batch, executor, report)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return report
+
+    def _flush(self, batch, executor, report):
+        """Insert one batch of validated rows inside a transaction"""
+        emails = [data['email'] for _, data in batch]
+        existing = set(User.objects.filter(email__in=emails).values_list('email', flat=True))
+
+        pending = []
+        for line_number, data in batch:
+            if data['email'] in existing:
+                report.add_error(line_number, data['email'], {'email': ['A user with this email already exists']})
+            else:
+                pending.append((line_number, data))
+
+        report.valid += len(pending)
+        if not pending or self.dry_run:
+            return
+
+        passwords = [data.get('password') for _, data in pending]
+        if executor is not None:
+            chunksize = max(1, len(passwords) // (self.workers * 4))
+            hashes = list(executor.map(_hash_password, passwords, chunksize=chunksize))
+        else:
+            hashes = [_hash_password(password) for password in passwords]
+
+        users = [
+            User(
+                email=data['email'],
+                password=password_hash,
+                fullName=data['fullName'],
+                phone=data.get('phone') or None,
+                userType='provider',
+                category=data['category'],
+                experience=data['experience'],
+            )
+            for (_, data), password_hash in zip(pending, hashes)
+        ]
+
+        try:
+            with transaction.atomic():
+                users = User.objects.bulk_create(users)
+                ProviderProfile.objects.bulk_create([
+                    ProviderProfile(
+                        user=user,
+                        registeredName=data.get('registeredName') or data['fullName'],
+                        category=data['category'],
+                        experience=data['experience'],
+                        bio=data.get('bio'),
+                        idNumber=data.get('idNumber') or 'PENDING',
+                        licenseNumber=data.get('licenseNumber') or 'PENDING',
+                        skills=data.get('skills'),
+                        availability=data.get('availability', True),
+                        willingToRelocate=data.get('willingToRelocate', False),
+                        preferredLocations=data.get('preferredLocations'),
+                    )
+                    for user, (_, data) in zip(users, pending)
+                ])
+        except DatabaseError as e:
+            # The whole batch is rolled back, so every row in it is reported
+            report.valid -= len(pending)
+            for line_number, data in pending:
+                report.add_error(line_number, data['email'], f'Batch insert failed: {e}')
+            return
+
+        report.created += len(users)
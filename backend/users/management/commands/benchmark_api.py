@@ -0,0 +1,192 @@
+import io
+import json
+import platform
+import statistics
+import time
+
+import django
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import (
+    CaptureQueriesContext, override_settings, setup_test_environment, teardown_test_environment
+)
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import User
+
+
+# (name, path, actor) - actor is the user type the request is made as
+HOT_ENDPOINTS = [
+    ('providers-list', '/api/providers/', 'employer'),
+    ('jobs-list-employer', '/api/jobs/', 'employer'),
+    ('jobs-list-provider', '/api/jobs/', 'provider'),
+    ('interviews-list-employer', '/api/interviews/', 'employer'),
+    ('interviews-list-provider', '/api/interviews/', 'provider'),
+    ('notifications-unread', '/api/notifications/unread/', 'provider'),
+    ('admin-dashboard-stats', '/api/admin/dashboard/stats/', 'admin'),
+]
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(sorted_values, pct):
+    """Linear-interpolated percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark hot API endpoints against a seeded test database and record a JSON baseline'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=float, default=0.01, help='seed_data --scale used for the test database')
+        parser.add_argument('--seed', type=int, default=42, help='seed_data --seed used for the test database')
+        parser.add_argument('--iterations', type=int, default=30, help='Measured requests per endpoint')
+        parser.add_argument('--warmup', type=int, default=3, help='Unmeasured requests per endpoint')
+        parser.add_argument('--endpoint', action='append', help='Only run the named endpoint (repeatable)')
+        parser.add_argument('--output', help='Write results to this JSON file')
+        parser.add_argument('--compare', help='Baseline JSON file to compare results against')
+        parser.add_argument('--threshold', type=float, default=0.2, help='Allowed p95 latency increase before flagging (0.2 = 20%%)')
+        parser.add_argument('--fail-on-regression', action='store_true', help='Exit with an error if any endpoint regressed')
+        parser.add_argument('--keepdb', action='store_true', help='Reuse the test database between runs')
+
+    def handle(self, *args, **options):
+        endpoints = HOT_ENDPOINTS
+        if options['endpoint']:
+            endpoints = [e for e in HOT_ENDPOINTS if e[0] in options['endpoint']]
+            unknown = set(options['endpoint']) - {e[0] for e in endpoints}
+            if unknown:
+                raise CommandError(f'Unknown endpoint(s): {", ".join(sorted(unknown))}')
+
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options['keepdb'])
+        try:
+            self.stdout.write(self.style.WARNING(f'Seeding test database (scale {options["scale"]}, seed {options["seed"]})...'))
+            call_command(
+                'seed_data', scale=options['scale'], seed=options['seed'], flush=True,
+                stdout=io.StringIO(),
+            )
+            actors = self._get_actors()
+            # Measure the database work, not response cache hits
+            with override_settings(RESPONSE_CACHE_TIMEOUT=0):
+                results = {
+                    name: self._measure(path, actors[actor], options['iterations'], options['warmup'])
+                    for name, path, actor in endpoints
+                }
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options['keepdb'])
+            teardown_test_environment()
+
+        report = {
+            'meta': {
+                'createdAt': timezone.now().isoformat(),
+                'database': connection.vendor,
+                'django': django.get_version(),
+                'python': platform.python_version(),
+                'scale': options['scale'],
+                'seed': options['seed'],
+                'iterations': options['iterations'],
+            },
+            'endpoints': results,
+        }
+
+        self._print_results(results)
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as output_file:
+                json.dump(report, output_file, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'Results written to {options["output"]}'))
+
+        if options['compare']:
+            regressions = self._compare(results, options['compare'], options['threshold'])
+            if regressions and options['fail_on_regression']:
+                raise CommandError(f'{len(regressions)} endpoint(s) regressed: {", ".join(regressions)}')
+
+    def _get_actors(self):
+        """Pick the employer and provider with the most interviews plus an admin to make requests as"""
+        admin = User.objects.filter(is_staff=True).first() or User.objects.create_superuser(
+            email='benchmark-admin@riderspool.test', password=None, fullName='Benchmark Admin'
+        )
+        # Most interviews means the largest lists on the interview endpoints
+        employer = User.objects.filter(userType='employer').annotate(
+            interview_count=Count('employer_interviews')
+        ).order_by('-interview_count', 'id').first()
+        provider = User.objects.filter(userType='provider').annotate(
+            interview_count=Count('provider_interviews')
+        ).order_by('-interview_count', 'id').first()
+        if not employer or not provider:
+            raise CommandError('Seeded data has no employers or providers; increase --scale')
+        return {'admin': admin, 'employer': employer, 'provider': provider}
+
+    def _measure(self, path, user, iterations, warmup):
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        for _ in range(warmup):
+            client.get(path)
+
+        latencies, query_counts = [], []
+        status_code = None
+        for _ in range(iterations):
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                response = client.get(path)
+                latencies.append((time.perf_counter() - start) * 1000)
+            query_counts.append(len(queries))
+            status_code = response.status_code
+
+        latencies.sort()
+        result = {
+            'path': path,
+            'userType': user.userType,
+            'status': status_code,
+            'queries': max(query_counts) if query_counts else 0,
+            'meanMs': round(statistics.fmean(latencies), 3) if latencies else 0.0,
+            'minMs': round(latencies[0], 3) if latencies else 0.0,
+            'maxMs': round(latencies[-1], 3) if latencies else 0.0,
+        }
+        for pct in PERCENTILES:
+            result[f'p{pct}Ms'] = round(percentile(latencies, pct), 3)
+        return result
+
+    def _print_results(self, results):
+        self.stdout.write(f'\n{"endpoint":<28}{"status":>7}{"queries":>9}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}')
+        for name, result in results.items():
+            self.stdout.write(
+                f'{name:<28}{result["status"]:>7}{result["queries"]:>9}'
+                f'{result["p50Ms"]:>10.2f}{result["p95Ms"]:>10.2f}{result["p99Ms"]:>10.2f}'
+            )
+
+    def _compare(self, results, baseline_path, threshold):
+        """Print deltas against a baseline file and return the names of regressed endpoints"""
+        try:
+            with open(baseline_path, encoding='utf-8') as baseline_file:
+                baseline = json.load(baseline_file)['endpoints']
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f'Could not read baseline {baseline_path}: {e}')
+
+        regressions = []
+        self.stdout.write(f'\nCompared with {baseline_path}:')
+        for name, result in results.items():
+            previous = baseline.get(name)
+            if not previous:
+                self.stdout.write(f'  {name}: no baseline')
+                continue
+
+            p95_change = (result['p95Ms'] - previous['p95Ms']) / previous['p95Ms'] if previous['p95Ms'] else 0.0
+            query_change = result['queries'] - previous['queries']
+            line = f'  {name}: p95 {previous["p95Ms"]:.2f} -> {result["p95Ms"]:.2f} ms ({p95_change:+.0%}), queries {previous["queries"]} -> {result["queries"]}'
+
+            if p95_change > threshold or query_change > 0:
+                regressions.append(name)
+                self.stdout.write(self.style.ERROR(line + '  REGRESSION'))
+            else:
+                self.stdout.write(self.style.SUCCESS(line))
+        return regressions
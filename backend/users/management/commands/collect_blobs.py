@@ -0,0 +1,63 @@
+from datetime import timedelta
+
+from django.core.files import File
+from django.core.management.base import BaseCommand
+
+from users.blobs import collect_garbage, count_references, models_with_blob_fields, recount, retain
+from users.storage import document_storage, is_blob_name, BLOB_PREFIX
+
+
+class Command(BaseCommand):
+    help = 'Garbage-collect unreferenced document blobs from content-addressed storage'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace-minutes', type=int, default=60, help='Only delete blobs unreferenced for at least this long')
+        parser.add_argument('--recount', action='store_true', help='Rebuild reference counts from the model fields first')
+        parser.add_argument('--adopt-legacy', action='store_true', help='Move files stored before content addressing into blob storage')
+        parser.add_argument('--dry-run', action='store_true', help='Report what would be deleted without deleting anything')
+
+    def handle(self, *args, **options):
+        if options['adopt_legacy']:
+            self.adopt_legacy_files(options['dry_run'])
+
+        if options['recount'] and not options['dry_run']:
+            recount()
+            self.stdout.write(self.style.SUCCESS('Reference counts rebuilt'))
+
+        deleted = collect_garbage(grace=timedelta(minutes=options['grace_minutes']), dry_run=options['dry_run'])
+        for name in deleted:
+            self.stdout.write(f'  {"Would delete" if options["dry_run"] else "Deleted"} {name}')
+        self.stdout.write(self.style.SUCCESS(f'{len(deleted)} unreferenced blob(s) {"found" if options["dry_run"] else "removed"}'))
+
+    def adopt_legacy_files(self, dry_run):
+        """Re-store files saved under their upload_to path so duplicates collapse into one blob"""
+        adopted = 0
+        legacy_names = set()
+
+        for model, fields in models_with_blob_fields():
+            for field in fields:
+                rows = model._base_manager.exclude(**{f'{field}__startswith': f'{BLOB_PREFIX}/'}).exclude(
+                    **{field: ''}
+                ).exclude(**{f'{field}__isnull': True}).values_list('pk', field)
+
+                for pk, name in rows.iterator():
+                    if not document_storage.exists(name):
+                        self.stderr.write(f'  Missing file for {model.__name__} {pk}.{field}: {name}')
+                        continue
+                    adopted += 1
+                    legacy_names.add(name)
+                    if dry_run:
+                        continue
+
+                    with document_storage.open(name, 'rb') as legacy_file:
+                        blob_name = document_storage.save(name, File(legacy_file))
+                    if model._base_manager.filter(pk=pk, **{field: name}).update(**{field: blob_name}):
+                        retain(blob_name)
+
+        if not dry_run:
+            still_referenced = set(count_references())
+            for name in legacy_names:
+                if not is_blob_name(name) and name not in still_referenced:
+                    document_storage.delete(name)
+
+        self.stdout.write(self.style.SUCCESS(f'{adopted} legacy file reference(s) {"to adopt" if dry_run else "adopted"}'))
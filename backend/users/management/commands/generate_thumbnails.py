@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from users.image_pipeline import generate_profile_photo_thumbnails, list_thumbnail_name
+from users.models import ProviderProfile
+
+
+class Command(BaseCommand):
+    help = 'Generate missing profile photo thumbnails for existing providers'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Regenerate for every provider with a photo')
+
+    def handle(self, *args, **options):
+        profiles = ProviderProfile.objects.exclude(profilePhoto='').exclude(profilePhoto__isnull=True).values_list(
+            'pk', 'profilePhoto', 'profilePhotoThumb'
+        )
+
+        generated = 0
+        for pk, photo_name, thumb_name in profiles.iterator():
+            if not options['force'] and thumb_name == list_thumbnail_name(photo_name):
+                continue
+            generate_profile_photo_thumbnails(pk)
+            generated += 1
+
+        self.stdout.write(self.style.SUCCESS(f'Thumbnails generated for {generated} provider(s)'))
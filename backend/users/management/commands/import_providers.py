@@ -0,0 +1,47 @@
+import csv
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from users.importers import ProviderImporter, detect_format, iter_rows, SUPPORTED_FORMATS
+
+
+class Command(BaseCommand):
+    help = 'Bulk import provider accounts and profiles from a CSV or JSONL file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Path to the CSV/JSONL file to import')
+        parser.add_argument('--format', choices=SUPPORTED_FORMATS, help='File format (detected from the extension by default)')
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows inserted per transaction')
+        parser.add_argument('--workers', type=int, default=None, help='Password hashing processes (defaults to CPU count)')
+        parser.add_argument('--dry-run', action='store_true', help='Validate the file without creating any rows')
+        parser.add_argument('--report', help='Write the full JSON report (including per-row errors) to this path')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or detect_format(path)
+
+        importer = ProviderImporter(
+            batch_size=options['batch_size'],
+            workers=options['workers'],
+            dry_run=options['dry_run'],
+        )
+
+        try:
+            with open(path, newline='', encoding='utf-8-sig') as stream:
+                report = importer.run(iter_rows(stream, fmt))
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            raise CommandError(f'Could not read {path}: {e}')
+
+        for error in report.errors:
+            self.stderr.write(f'Line {error["line"]} ({error["email"] or "unknown"}): {json.dumps(error["errors"])}')
+
+        if options['report']:
+            with open(options['report'], 'w', encoding='utf-8') as report_file:
+                json.dump(report.to_dict(), report_file, indent=2)
+
+        summary = f'{report.total} rows read, {report.valid} valid, {len(report.errors)} failed'
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'Dry run: {summary}'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Imported {report.created} providers ({summary})'))
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from users.image_pipeline import process_provider_document
+from users.models import ProviderProfile
+from verifications.models import VerificationDocument
+from verifications.processing import process_verification_document
+
+
+class Command(BaseCommand):
+    help = 'Recompress, strip metadata from and build previews for documents uploaded before processing existed'
+
+    def handle(self, *args, **options):
+        provider_documents = 0
+        for field in ('idDocument', 'licenseDocument'):
+            profiles = ProviderProfile.objects.exclude(**{field: ''}).exclude(**{f'{field}__isnull': True})
+            for pk in profiles.values_list('pk', flat=True).iterator():
+                # Skips documents that were already processed
+                process_provider_document(pk, field)
+                provider_documents += 1
+
+        verification_documents = 0
+        pending = VerificationDocument.objects.filter(Q(originalFileSize__isnull=True) | Q(pageCount__isnull=True))
+        for pk in pending.values_list('pk', flat=True).iterator():
+            process_verification_document(pk)
+            verification_documents += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Checked {provider_documents} provider document(s) and processed {verification_documents} verification document(s)'
+        ))
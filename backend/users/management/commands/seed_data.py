@@ -1,13 +1,67 @@
-from django.core.management.base import BaseCommand
+import random
+from datetime import time, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
-from users.models import User, ProviderProfile
-from interviews.models import OfficeLocation
+from django.utils import timezone
+from users.models import User, ProviderProfile, EmployerProfile
+from interviews.models import OfficeLocation, Interview, InterviewFeedback
+from interviews.ranking import refresh_rank_scores
+from interviews.ratings import recompute_ratings
+from jobs.models import Job
+from notifications.models import Notification
+
+
+# Production-sized row counts generated by --scale 1
+SCALE_BASE_COUNTS = {
+    'providers': 100_000,
+    'employers': 10_000,
+    'jobs': 20_000,
+    'interviews': 500_000,
+    'notifications': 1_000_000,
+}
+
+SCALE_EMAIL_DOMAIN = 'scale.riderspool.test'
+SCALE_PASSWORD = 'testpass123'
+
+FIRST_NAMES = [
+    'John', 'Mary', 'Peter', 'Grace', 'Susan', 'David', 'James', 'Faith', 'Brian', 'Mercy',
+    'Kevin', 'Esther', 'Dennis', 'Ann', 'Collins', 'Joyce', 'Samuel', 'Lucy', 'Daniel', 'Ruth',
+]
+LAST_NAMES = [
+    'Kamau', 'Wanjiku', 'Omondi', 'Achieng', 'Njeri', 'Kipchoge', 'Mwangi', 'Otieno', 'Wambui', 'Kiprono',
+    'Mutua', 'Chebet', 'Odhiambo', 'Nyambura', 'Kariuki', 'Atieno', 'Mohamed', 'Wekesa', 'Cherono', 'Maina',
+]
+REGIONS = ['Nairobi', 'Mombasa', 'Kisumu', 'Nakuru', 'Eldoret', 'Thika', 'Malindi', 'Kitale']
+INDUSTRIES = ['Logistics', 'Construction', 'Retail', 'Technology', 'Hospitality', 'Manufacturing', 'Agriculture']
+SKILLS = [
+    'First Aid', 'Navigation Expert', 'Customer Service', 'Vehicle Maintenance',
+    'Multiple Languages', 'Safety Training', 'Logistics', 'Professional Etiquette',
+]
+CATEGORIES = [choice for choice, _ in User.CATEGORY_CHOICES]
 
 
 class Command(BaseCommand):
     help = 'Seed the database with sample data for testing'
 
-    def handle(self, *args, **kwargs):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scale', type=float,
+            help='Generate synthetic load-testing data; 1 produces 100k providers, 10k employers, '
+                 '20k jobs, 500k interviews and 1M notifications'
+        )
+        parser.add_argument('--seed', type=int, default=42, help='Random seed for --scale data')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per bulk insert for --scale data')
+        parser.add_argument('--flush', action='store_true', help='Delete previously generated --scale data first')
+        for name in SCALE_BASE_COUNTS:
+            parser.add_argument(f'--{name}', type=int, help=f'Override the number of {name} generated by --scale')
+
+    def handle(self, *args, **options):
+        if options['scale'] is not None:
+            self.seed_at_scale(options)
+            return
+
         self.stdout.write(self.style.WARNING('Seeding database with test data...'))
 
         with transaction.atomic():
@@ -197,37 +251,7 @@ class Command(BaseCommand):
                     self.stdout.write(self.style.SUCCESS(f'Created provider: {user_data["email"]}'))
 
             # Create office locations
-            offices = [
-                {
-                    'name': 'Nairobi Westlands Office',
-                    'address': 'Westlands Square, Ring Road Parklands',
-                    'city': 'Nairobi',
-                    'isActive': True,
-                },
-                {
-                    'name': 'Nairobi CBD Office',
-                    'address': 'Kimathi Street, Opposite Hilton Hotel',
-                    'city': 'Nairobi',
-                    'isActive': True,
-                },
-                {
-                    'name': 'Mombasa Office',
-                    'address': 'Moi Avenue, Near Kenya Ferry',
-                    'city': 'Mombasa',
-                    'isActive': True,
-                },
-                {
-                    'name': 'Kisumu Office',
-                    'address': 'Oginga Odinga Street, Downtown',
-                    'city': 'Kisumu',
-                    'isActive': True,
-                },
-            ]
-
-            for office_data in offices:
-                if not OfficeLocation.objects.filter(name=office_data['name']).exists():
-                    OfficeLocation.objects.create(**office_data)
-                    self.stdout.write(self.style.SUCCESS(f'Created office: {office_data["name"]}'))
+            self.create_offices()
 
         self.stdout.write(self.style.SUCCESS('\n✅ Database seeding completed successfully!'))
         self.stdout.write(self.style.SUCCESS('\nTest Accounts Created:'))
@@ -244,3 +268,275 @@ class Command(BaseCommand):
         self.stdout.write('  - david.kipchoge@example.com / testpass123 (Truck Driver)')
         self.stdout.write(self.style.SUCCESS('\nAdmin:'))
         self.stdout.write('  - admin@riderspool.com / admin123')
+
+    def create_offices(self):
+        """Create the default interview office locations"""
+        offices = [
+            {
+                'name': 'Nairobi Westlands Office',
+                'address': 'Westlands Square, Ring Road Parklands',
+                'city': 'Nairobi',
+                'isActive': True,
+            },
+            {
+                'name': 'Nairobi CBD Office',
+                'address': 'Kimathi Street, Opposite Hilton Hotel',
+                'city': 'Nairobi',
+                'isActive': True,
+            },
+            {
+                'name': 'Mombasa Office',
+                'address': 'Moi Avenue, Near Kenya Ferry',
+                'city': 'Mombasa',
+                'isActive': True,
+            },
+            {
+                'name': 'Kisumu Office',
+                'address': 'Oginga Odinga Street, Downtown',
+                'city': 'Kisumu',
+                'isActive': True,
+            },
+        ]
+
+        for office_data in offices:
+            if not OfficeLocation.objects.filter(name=office_data['name']).exists():
+                OfficeLocation.objects.create(**office_data)
+                self.stdout.write(self.style.SUCCESS(f'Created office: {office_data["name"]}'))
+
+    def seed_at_scale(self, options):
+        """Generate a deterministic, production-sized synthetic dataset using batched bulk inserts"""
+        if options['scale'] <= 0:
+            raise CommandError('--scale must be greater than 0')
+
+        counts = {
+            name: options[name] if options[name] is not None else int(base * options['scale'])
+            for name, base in SCALE_BASE_COUNTS.items()
+        }
+        batch_size = max(1, options['batch_size'])
+        rng = random.Random(options['seed'])
+
+        scale_users = User.objects.filter(email__endswith=f'@{SCALE_EMAIL_DOMAIN}')
+        if scale_users.exists():
+            if not options['flush']:
+                raise CommandError('Scale data already exists. Re-run with --flush to replace it.')
+            self.stdout.write(self.style.WARNING('Deleting previously generated scale data...'))
+            scale_users.delete()
+
+        self.stdout.write(self.style.WARNING(
+            'Generating scale data (seed {seed}): {summary}'.format(
+                seed=options['seed'],
+                summary=', '.join(f'{count:,} {name}' for name, count in counts.items()),
+            )
+        ))
+
+        self.create_offices()
+        office_ids = list(OfficeLocation.objects.filter(isActive=True).values_list('id', flat=True))
+
+        # Hash once - PBKDF2 per row would dominate the run time
+        password_hash = make_password(SCALE_PASSWORD)
+        today = timezone.localdate()
+
+        employer_ids = self._seed_scale_employers(rng, counts['employers'], password_hash, batch_size)
+        provider_ids = self._seed_scale_providers(rng, counts['providers'], password_hash, batch_size)
+
+        if employer_ids:
+            self._seed_scale_jobs(rng, counts['jobs'], employer_ids, today, batch_size)
+        if employer_ids and provider_ids:
+            self._seed_scale_interviews(rng, counts['interviews'], employer_ids, provider_ids, office_ids, today, batch_size)
+            # Ratings come from the generated feedback, as they would in production
+            self.stdout.write('  Ratings: aggregating feedback...')
+            recompute_ratings(batch_size=batch_size)
+            refresh_rank_scores(batch_size=batch_size)
+        if employer_ids or provider_ids:
+            self._seed_scale_notifications(rng, counts['notifications'], employer_ids + provider_ids, batch_size)
+
+        self.stdout.write(self.style.SUCCESS('\n✅ Scale data generated successfully!'))
+        self.stdout.write(f'  Accounts: employerNNNNNN@{SCALE_EMAIL_DOMAIN} / providerNNNNNN@{SCALE_EMAIL_DOMAIN}')
+        self.stdout.write(f'  Password: {SCALE_PASSWORD}')
+
+    def _batches(self, count, batch_size):
+        """Yield (start, stop) index ranges covering count rows"""
+        for start in range(0, count, batch_size):
+            yield start, min(start + batch_size, count)
+
+    def _report_progress(self, label, done, total):
+        self.stdout.write(f'  {label}: {done:,}/{total:,}', ending='\r' if done < total else '\n')
+
+    def _seed_scale_employers(self, rng, count, password_hash, batch_size):
+        employer_ids = []
+        for start, stop in self._batches(count, batch_size):
+            users, profiles = [], []
+            for i in range(start, stop):
+                first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+                industry = rng.choice(INDUSTRIES)
+                region = rng.choice(REGIONS)
+                is_company = rng.random() < 0.7
+                company_name = f'{last} {industry} Ltd' if is_company else None
+                phone = f'+2547{20000000 + i:08d}'
+
+                users.append(User(
+                    email=f'employer{i:06d}@{SCALE_EMAIL_DOMAIN}',
+                    password=password_hash,
+                    fullName=f'{first} {last}',
+                    phone=phone,
+                    userType='employer',
+                    employerType='company' if is_company else 'individual',
+                    companyName=company_name,
+                    industry=industry,
+                    contactPerson=f'{first} {last}',
+                    isVerified=rng.random() < 0.6,
+                ))
+                profiles.append({
+                    'companyName': company_name,
+                    'industry': industry,
+                    'contactPerson': f'{first} {last}',
+                    'phone': phone,
+                    'companySize': rng.choice(EmployerProfile.COMPANY_SIZE_CHOICES)[0] if is_company else None,
+                    'registrationNumber': f'CPR/{2000 + i % 25}/{i:06d}' if is_company else None,
+                    'officeAddress': f'{rng.randint(1, 400)} {rng.choice(LAST_NAMES)} Road',
+                    'region': region,
+                    'city': region,
+                })
+
+            with transaction.atomic():
+                users = User.objects.bulk_create(users)
+                EmployerProfile.objects.bulk_create([
+                    EmployerProfile(user=user, **profile) for user, profile in zip(users, profiles)
+                ])
+            employer_ids.extend(user.id for user in users)
+            self._report_progress('Employers', stop, count)
+        return employer_ids
+
+    def _seed_scale_providers(self, rng, count, password_hash, batch_size):
+        provider_ids = []
+        for start, stop in self._batches(count, batch_size):
+            users, profiles = [], []
+            for i in range(start, stop):
+                first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+                category = rng.choice(CATEGORIES)
+                experience = rng.randint(0, 25)
+
+                users.append(User(
+                    email=f'provider{i:06d}@{SCALE_EMAIL_DOMAIN}',
+                    password=password_hash,
+                    fullName=f'{first} {last}',
+                    phone=f'+2541{10000000 + i:08d}',
+                    userType='provider',
+                    category=category,
+                    experience=experience,
+                    isVerified=rng.random() < 0.5,
+                ))
+                profiles.append({
+                    'registeredName': f'{first} {last}',
+                    'category': category,
+                    'experience': experience,
+                    'bio': f'{dict(User.CATEGORY_CHOICES)[category]} with {experience} years of experience.',
+                    'idNumber': f'ID{30000000 + i}',
+                    'licenseNumber': f'LIC{i:07d}',
+                    'skills': ', '.join(rng.sample(SKILLS, rng.randint(1, 4))),
+                    'availability': rng.random() < 0.8,
+                    'willingToRelocate': rng.random() < 0.3,
+                    'preferredLocations': ', '.join(rng.sample(REGIONS, rng.randint(1, 3))),
+                })
+
+            with transaction.atomic():
+                users = User.objects.bulk_create(users)
+                ProviderProfile.objects.bulk_create([
+                    ProviderProfile(user=user, **profile) for user, profile in zip(users, profiles)
+                ])
+            provider_ids.extend(user.id for user in users)
+            self._report_progress('Providers', stop, count)
+        return provider_ids
+
+    def _seed_scale_jobs(self, rng, count, employer_ids, today, batch_size):
+        statuses = ['active', 'closed', 'filled']
+        employment_types = [choice for choice, _ in Job.EMPLOYMENT_TYPE_CHOICES]
+
+        for start, stop in self._batches(count, batch_size):
+            jobs = []
+            for i in range(start, stop):
+                category = rng.choice(CATEGORIES)
+                region = rng.choice(REGIONS)
+                salary_min = rng.randrange(15000, 60000, 1000)
+                jobs.append(Job(
+                    employer_id=rng.choice(employer_ids),
+                    title=f'{dict(User.CATEGORY_CHOICES)[category]} needed in {region}',
+                    category=category,
+                    description='Synthetic job posting generated for load testing.',
+                    requirements='Valid license, good knowledge of local routes.',
+                    employmentType=rng.choice(employment_types),
+                    experienceRequired=rng.randint(0, 10),
+                    salaryMin=salary_min,
+                    salaryMax=salary_min + rng.randrange(5000, 40000, 1000),
+                    region=region,
+                    city=region,
+                    numberOfPositions=rng.randint(1, 50),
+                    status=rng.choices(statuses, weights=[60, 25, 15])[0],
+                    applicationDeadline=today + timedelta(days=rng.randint(-30, 90)),
+                ))
+            Job.objects.bulk_create(jobs)
+            self._report_progress('Jobs', stop, count)
+
+    def _seed_scale_interviews(self, rng, count, employer_ids, provider_ids, office_ids, today, batch_size):
+        past_statuses = ['completed', 'cancelled', 'pending', 'confirmed']
+        future_statuses = ['pending', 'confirmed', 'cancelled']
+        now = timezone.now()
+
+        for start, stop in self._batches(count, batch_size):
+            interviews = []
+            for _ in range(start, stop):
+                interview_date = today + timedelta(days=rng.randint(-180, 60))
+                if interview_date < today:
+                    interview_status = rng.choices(past_statuses, weights=[55, 25, 10, 10])[0]
+                else:
+                    interview_status = rng.choices(future_statuses, weights=[60, 35, 5])[0]
+
+                interviews.append(Interview(
+                    employer_id=rng.choice(employer_ids),
+                    provider_id=rng.choice(provider_ids),
+                    date=interview_date,
+                    time=time(rng.randint(8, 16), rng.choice((0, 30))),
+                    officeLocation_id=rng.choice(office_ids) if office_ids else None,
+                    status=interview_status,
+                    cancellationReason='Schedule conflict' if interview_status == 'cancelled' else None,
+                    isHired=interview_status == 'completed' and rng.random() < 0.3,
+                    confirmedAt=now if interview_status in ('confirmed', 'completed') else None,
+                    completedAt=now if interview_status == 'completed' else None,
+                ))
+
+            with transaction.atomic():
+                interviews = Interview.objects.bulk_create(interviews)
+                InterviewFeedback.objects.bulk_create([
+                    InterviewFeedback(
+                        interview=interview,
+                        rating=rng.choices([1, 2, 3, 4, 5], weights=[5, 10, 20, 35, 30])[0],
+                        comments='Synthetic feedback generated for load testing.',
+                        wouldHireAgain=rng.random() < 0.6,
+                    )
+                    for interview in interviews
+                    if interview.status == 'completed' and rng.random() < 0.6
+                ])
+            self._report_progress('Interviews', stop, count)
+
+    def _seed_scale_notifications(self, rng, count, user_ids, batch_size):
+        categories = [choice for choice, _ in Notification.CATEGORY_CHOICES]
+        statuses = ['sent', 'pending', 'failed']
+        now = timezone.now()
+
+        for start, stop in self._batches(count, batch_size):
+            notifications = []
+            for _ in range(start, stop):
+                notification_status = rng.choices(statuses, weights=[70, 20, 10])[0]
+                category = rng.choice(categories)
+                notifications.append(Notification(
+                    user_id=rng.choice(user_ids),
+                    type='email' if rng.random() < 0.9 else 'sms',
+                    category=category,
+                    status=notification_status,
+                    subject=dict(Notification.CATEGORY_CHOICES)[category],
+                    message='Synthetic notification generated for load testing.',
+                    errorMessage='SMTP timeout' if notification_status == 'failed' else None,
+                    sentAt=now if notification_status == 'sent' else None,
+                ))
+            Notification.objects.bulk_create(notifications)
+            self._report_progress('Notifications', stop, count)
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.3 on 2026-10-19 17:57
+
+import users.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0007_add_employer_type_field'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='providerprofile',
+            name='idDocument',
+            field=models.FileField(blank=True, null=True, storage=users.storage.ContentAddressedStorage(), upload_to='documents/ids/'),
+        ),
+        migrations.AlterField(
+            model_name='providerprofile',
+            name='licenseDocument',
+            field=models.FileField(blank=True, null=True, storage=users.storage.ContentAddressedStorage(), upload_to='documents/licenses/'),
+        ),
+        migrations.AlterField(
+            model_name='providerprofile',
+            name='profilePhoto',
+            field=models.ImageField(blank=True, null=True, storage=users.storage.ContentAddressedStorage(), upload_to='profiles/'),
+        ),
+        migrations.CreateModel(
+            name='StoredBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Storage name (blobs/<xx>/<sha256><ext>)', max_length=255, unique=True)),
+                ('digest', models.CharField(db_index=True, max_length=64)),
+                ('size', models.BigIntegerField(default=0, help_text='File size in bytes')),
+                ('refCount', models.IntegerField(default=0, help_text='Number of model fields pointing at this blob')),
+                ('createdAt', models.DateTimeField(auto_now_add=True)),
+                ('updatedAt', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Stored Blob',
+                'verbose_name_plural': 'Stored Blobs',
+                'db_table': 'stored_blobs',
+                'indexes': [models.Index(fields=['refCount', 'updatedAt'], name='stored_blob_refCoun_9b7232_idx')],
+            },
+        ),
+    ]
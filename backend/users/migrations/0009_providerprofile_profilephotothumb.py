@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-19 17:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_stored_blobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='providerprofile',
+            name='profilePhotoThumb',
+            field=models.ImageField(blank=True, editable=False, help_text='Resized copy of profilePhoto for lists', null=True, upload_to='profiles/thumbs/'),
+        ),
+    ]
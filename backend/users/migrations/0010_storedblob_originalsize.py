@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-19 18:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0009_providerprofile_profilephotothumb'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='storedblob',
+            name='originalSize',
+            field=models.BigIntegerField(blank=True, help_text='Size of the upload before recompression; set once processed', null=True),
+        ),
+    ]
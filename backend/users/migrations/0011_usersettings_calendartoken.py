@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-19 18:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0010_storedblob_originalsize'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usersettings',
+            name='calendarToken',
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-19 18:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0011_usersettings_calendartoken'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='providerprofile',
+            name='ratingCount',
+            field=models.PositiveIntegerField(default=0, help_text='Number of feedback ratings'),
+        ),
+        migrations.AddField(
+            model_name='providerprofile',
+            name='ratingSum',
+            field=models.PositiveIntegerField(default=0, help_text='Sum of all feedback ratings'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-19 18:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0012_providerprofile_rating_totals'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='providerprofile',
+            name='rankScore',
+            field=models.FloatField(db_index=True, default=3.0, help_text='Review score weighted by count and recency'),
+        ),
+    ]
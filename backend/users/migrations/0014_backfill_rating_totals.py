@@ -0,0 +1,42 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import migrations
+from django.db.models import Count, Sum
+
+
+def backfill_rating_totals(apps, schema_editor):
+    """Fill ratingSum / ratingCount from existing feedback and derive rating from them"""
+    ProviderProfile = apps.get_model('users', 'ProviderProfile')
+    InterviewFeedback = apps.get_model('interviews', 'InterviewFeedback')
+
+    totals = {
+        row['interview__provider']: (row['total'], row['count'])
+        for row in InterviewFeedback.objects.order_by().values('interview__provider').annotate(
+            total=Sum('rating'), count=Count('id')
+        )
+    }
+
+    profiles = []
+    for profile in ProviderProfile.objects.only('id', 'user_id').iterator(chunk_size=1000):
+        if profile.user_id not in totals:
+            continue
+        total, count = totals[profile.user_id]
+        profile.ratingSum = total
+        profile.ratingCount = count
+        profile.rating = (Decimal(total) / count).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        profiles.append(profile)
+
+    ProviderProfile.objects.bulk_update(profiles, ['ratingSum', 'ratingCount', 'rating'], batch_size=1000)
+    ProviderProfile.objects.filter(ratingCount=0).exclude(rating=0).update(rating=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0013_providerprofile_rank_score'),
+        ('interviews', '0004_interviewfeedback_improvements_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_rating_totals, migrations.RunPython.noop),
+    ]
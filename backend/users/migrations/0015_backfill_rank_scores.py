@@ -0,0 +1,55 @@
+from collections import defaultdict
+
+from django.db import migrations
+from django.utils import timezone
+
+
+# Frozen copy of the interviews.ranking formula and default settings at the
+# time of this migration, so later changes to them do not change its result
+PRIOR_SCORE = 3.0
+PRIOR_WEIGHT = 5.0
+HIRE_AGAIN_WEIGHT = 0.25
+HALF_LIFE_SECONDS = 180 * 86400
+
+
+def rank_score(feedback, now):
+    total = PRIOR_SCORE * PRIOR_WEIGHT
+    weight = PRIOR_WEIGHT
+    for rating, would_hire_again, created_at in feedback:
+        decay = 0.5 ** (max((now - created_at).total_seconds(), 0) / HALF_LIFE_SECONDS)
+        total += decay * ((1 - HIRE_AGAIN_WEIGHT) * rating + HIRE_AGAIN_WEIGHT * (5 if would_hire_again else 1))
+        weight += decay
+    return round(total / weight, 4)
+
+
+def backfill_rank_scores(apps, schema_editor):
+    """Score every provider with feedback, as refresh_rank_scores did when this was written"""
+    ProviderProfile = apps.get_model('users', 'ProviderProfile')
+    InterviewFeedback = apps.get_model('interviews', 'InterviewFeedback')
+
+    now = timezone.now()
+    feedback = defaultdict(list)
+    for provider_id, rating, would_hire_again, created_at in InterviewFeedback.objects.order_by().values_list(
+        'interview__provider_id', 'rating', 'wouldHireAgain', 'createdAt'
+    ).iterator(chunk_size=1000):
+        feedback[provider_id].append((rating, would_hire_again, created_at))
+
+    profiles = []
+    for profile in ProviderProfile.objects.only('id', 'user_id').iterator(chunk_size=1000):
+        if profile.user_id in feedback:
+            profile.rankScore = rank_score(feedback[profile.user_id], now)
+            profiles.append(profile)
+
+    ProviderProfile.objects.bulk_update(profiles, ['rankScore'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0014_backfill_rating_totals'),
+        ('interviews', '0004_interviewfeedback_improvements_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_rank_scores, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.3 on 2026-10-19 19:04
+
+from collections import defaultdict
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+# Frozen copy of the interviews.ranking formula and default settings at the
+# time of this migration, so later changes to them do not change its result
+PRIOR_SCORE = 3.0
+PRIOR_WEIGHT = 5.0
+HIRE_AGAIN_WEIGHT = 0.25
+HALF_LIFE_SECONDS = 180 * 86400
+
+
+def backfill_rank_totals(apps, schema_editor):
+    """Store each provider's decayed feedback totals as of now, and the score they give"""
+    ProviderProfile = apps.get_model('users', 'ProviderProfile')
+    InterviewFeedback = apps.get_model('interviews', 'InterviewFeedback')
+
+    now = timezone.now()
+    totals = defaultdict(lambda: [0.0, 0.0])
+    for provider_id, rating, would_hire_again, created_at in InterviewFeedback.objects.order_by().values_list(
+        'interview__provider_id', 'rating', 'wouldHireAgain', 'createdAt'
+    ).iterator(chunk_size=1000):
+        decay = 0.5 ** (max((now - created_at).total_seconds(), 0) / HALF_LIFE_SECONDS)
+        score = (1 - HIRE_AGAIN_WEIGHT) * rating + HIRE_AGAIN_WEIGHT * (5 if would_hire_again else 1)
+        totals[provider_id][0] += decay * score
+        totals[provider_id][1] += decay
+
+    profiles = []
+    for profile in ProviderProfile.objects.only('id', 'user_id').iterator(chunk_size=1000):
+        if profile.user_id in totals:
+            weighted_sum, weight = totals[profile.user_id]
+            profile.rankWeightedSum = weighted_sum
+            profile.rankWeight = weight
+            profile.rankTotalsAt = now
+            profile.rankScore = round((PRIOR_SCORE * PRIOR_WEIGHT + weighted_sum) / (PRIOR_WEIGHT + weight), 4)
+            profiles.append(profile)
+
+    ProviderProfile.objects.bulk_update(
+        profiles, ['rankWeightedSum', 'rankWeight', 'rankTotalsAt', 'rankScore'], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0015_backfill_rank_scores'),
+        ('interviews', '0004_interviewfeedback_improvements_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='providerprofile',
+            name='rankTotalsAt',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='providerprofile',
+            name='rankWeight',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='providerprofile',
+            name='rankWeightedSum',
+            field=models.FloatField(default=0),
+        ),
+        migrations.RunPython(backfill_rank_totals, migrations.RunPython.noop),
+    ]
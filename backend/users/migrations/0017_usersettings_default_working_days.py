@@ -0,0 +1,19 @@
+# Generated by Django 5.2.3 on 2026-10-19 19:06
+
+import users.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0016_providerprofile_rank_totals'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='usersettings',
+            name='workingDays',
+            field=models.JSONField(blank=True, default=users.models.default_working_days, help_text='List of working days'),
+        ),
+    ]
@@ -5,6 +5,8 @@ import uuid
 from datetime import timedelta
 from django.utils import timezone
 
+from .storage import document_storage
+
 
 class UserManager(BaseUserManager):
     """Custom user manager for email-based authentication"""
@@ -123,17 +125,27 @@ class ProviderProfile(models.Model):
     # Documents
     idNumber = models.CharField(max_length=50)
     licenseNumber = models.CharField(max_length=50)
-    profilePhoto = models.ImageField(upload_to='profiles/', blank=True, null=True)
-    idDocument = models.FileField(upload_to='documents/ids/', blank=True, null=True)
-    licenseDocument = models.FileField(upload_to='documents/licenses/', blank=True, null=True)
+    profilePhoto = models.ImageField(upload_to='profiles/', storage=document_storage, blank=True, null=True)
+    profilePhotoThumb = models.ImageField(upload_to='profiles/thumbs/', blank=True, null=True, editable=False, help_text='Resized copy of profilePhoto for lists')
+    idDocument = models.FileField(upload_to='documents/ids/', storage=document_storage, blank=True, null=True)
+    licenseDocument = models.FileField(upload_to='documents/licenses/', storage=document_storage, blank=True, null=True)
 
     # Additional info
     skills = models.TextField(blank=True, null=True, help_text='Comma-separated skills')
     availability = models.BooleanField(default=True)
     willingToRelocate = models.BooleanField(default=False, help_text='Willing to relocate for work')
     preferredLocations = models.TextField(blank=True, null=True, help_text='Comma-separated preferred working locations')
+    # Average of ratingSum / ratingCount, kept in step with them
     rating = models.DecimalField(max_digits=3, decimal_places=2, default=0.00)
+    ratingSum = models.PositiveIntegerField(default=0, help_text='Sum of all feedback ratings')
+    ratingCount = models.PositiveIntegerField(default=0, help_text='Number of feedback ratings')
     totalInterviews = models.IntegerField(default=0)
+    # Default list ordering, kept up to date by interviews.ranking
+    rankScore = models.FloatField(default=3.0, db_index=True, help_text='Review score weighted by count and recency')
+    # Decayed feedback score sum and weight as of rankTotalsAt, for adding new feedback to rankScore
+    rankWeightedSum = models.FloatField(default=0)
+    rankWeight = models.FloatField(default=0)
+    rankTotalsAt = models.DateTimeField(blank=True, null=True)
 
     # Timestamps
     createdAt = models.DateTimeField(auto_now_add=True)
@@ -239,13 +251,18 @@ class PasswordResetToken(models.Model):
         return f"Reset token for {self.user.email}"
 
 
+def default_working_days():
+    """Monday to Friday, as preselected on the settings page"""
+    return ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+
+
 class UserSettings(models.Model):
     """Model for storing user preferences and settings"""
 
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='settings')
 
     # Availability settings (for providers)
-    workingDays = models.JSONField(default=list, blank=True, help_text='List of working days')
+    workingDays = models.JSONField(default=default_working_days, blank=True, help_text='List of working days')
     workingHours = models.JSONField(default=dict, blank=True, help_text='Start and end times')
     availableWeekends = models.BooleanField(default=False)
     availableHolidays = models.BooleanField(default=False)
@@ -260,6 +277,9 @@ class UserSettings(models.Model):
     preferredRegions = models.JSONField(default=list, blank=True, help_text='List of preferred work regions')
     maxTravelDistance = models.IntegerField(default=50, help_text='Maximum travel distance in km')
 
+    # Secret in the interview calendar feed URL
+    calendarToken = models.CharField(max_length=64, unique=True, null=True, blank=True)
+
     # Timestamps
     createdAt = models.DateTimeField(auto_now_add=True)
     updatedAt = models.DateTimeField(auto_now=True)
@@ -271,3 +291,28 @@ class UserSettings(models.Model):
 
     def __str__(self):
         return f"Settings for {self.user.fullName}"
+
+
+class StoredBlob(models.Model):
+    """Reference count for a file kept in content-addressed document storage"""
+
+    name = models.CharField(max_length=255, unique=True, help_text='Storage name (blobs/<xx>/<sha256><ext>)')
+    digest = models.CharField(max_length=64, db_index=True)
+    size = models.BigIntegerField(default=0, help_text='File size in bytes')
+    originalSize = models.BigIntegerField(blank=True, null=True, help_text='Size of the upload before recompression; set once processed')
+    refCount = models.IntegerField(default=0, help_text='Number of model fields pointing at this blob')
+
+    # Timestamps
+    createdAt = models.DateTimeField(auto_now_add=True)
+    updatedAt = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'stored_blobs'
+        verbose_name = 'Stored Blob'
+        verbose_name_plural = 'Stored Blobs'
+        indexes = [
+            models.Index(fields=['refCount', 'updatedAt']),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.refCount} refs)"
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
+from riderspool_backend.media import ProtectedFileField
 from .models import User, ProviderProfile, EmployerProfile, SavedProvider, UserSettings
 
 
@@ -100,6 +101,8 @@ class LoginSerializer(serializers.Serializer):
 class ProviderProfileSerializer(serializers.ModelSerializer):
     """Serializer for ProviderProfile model"""
     user = UserSerializer(read_only=True)
+    idDocument = ProtectedFileField(read_only=True)
+    licenseDocument = ProtectedFileField(read_only=True)
 
     class Meta:
         model = ProviderProfile
@@ -107,9 +110,11 @@ class ProviderProfileSerializer(serializers.ModelSerializer):
             'id', 'user', 'registeredName', 'category', 'experience',
             'bio', 'idNumber', 'licenseNumber', 'profilePhoto',
             'idDocument', 'licenseDocument', 'skills', 'availability',
-            'rating', 'totalInterviews', 'createdAt', 'updatedAt'
+            'rating', 'ratingCount', 'rankScore', 'totalInterviews', 'createdAt', 'updatedAt'
+        ]
+        read_only_fields = [
+            'id', 'user', 'rating', 'ratingCount', 'rankScore', 'totalInterviews', 'createdAt', 'updatedAt'
         ]
-        read_only_fields = ['id', 'user', 'rating', 'totalInterviews', 'createdAt', 'updatedAt']
 
 
 class ProviderProfileCreateSerializer(serializers.ModelSerializer):
@@ -139,7 +144,8 @@ class ProviderListSerializer(serializers.ModelSerializer):
         model = ProviderProfile
         fields = [
             'id', 'user', 'registeredName', 'category', 'experience',
-            'rating', 'totalInterviews', 'availability', 'profilePhoto'
+            'rating', 'ratingCount', 'rankScore', 'totalInterviews', 'availability', 'profilePhoto',
+            'profilePhotoThumb'
         ]
 
 
@@ -253,3 +259,24 @@ class UserSettingsSerializer(serializers.ModelSerializer):
             'preferredRegions', 'maxTravelDistance', 'createdAt', 'updatedAt'
         ]
         read_only_fields = ['id', 'createdAt', 'updatedAt']
+
+
+class ProviderImportRowSerializer(serializers.Serializer):
+    """Serializer for validating a single row of a bulk provider import"""
+    email = serializers.EmailField(max_length=255)
+    password = serializers.CharField(required=False, allow_blank=True, min_length=6, write_only=True)
+    fullName = serializers.CharField(max_length=255)
+    phone = serializers.CharField(required=False, allow_blank=True, max_length=20)
+    category = serializers.ChoiceField(choices=User.CATEGORY_CHOICES)
+    experience = serializers.IntegerField(min_value=0)
+    registeredName = serializers.CharField(required=False, allow_blank=True, max_length=255)
+    idNumber = serializers.CharField(required=False, allow_blank=True, max_length=50)
+    licenseNumber = serializers.CharField(required=False, allow_blank=True, max_length=50)
+    bio = serializers.CharField(required=False, allow_blank=True)
+    skills = serializers.CharField(required=False, allow_blank=True)
+    availability = serializers.BooleanField(required=False, default=True)
+    willingToRelocate = serializers.BooleanField(required=False, default=False)
+    preferredLocations = serializers.CharField(required=False, allow_blank=True)
+
+    def validate_email(self, value):
+        return User.objects.normalize_email(value)
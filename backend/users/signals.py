@@ -0,0 +1,96 @@
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from riderspool_backend.cache import bump_version
+from riderspool_backend.tasks import run_in_background
+from .blobs import blob_fields, models_with_blob_fields, retain, release
+from .image_pipeline import generate_profile_photo_thumbnails, list_thumbnail_name, process_provider_document
+from .models import ProviderProfile, UserSettings
+from .working_hours import forget_weekly_template
+
+
+def remember_previous_blobs(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Store the blob names a row pointed at before this save"""
+    fields = blob_fields(sender)
+    if not fields or raw:
+        return
+    if update_fields is not None:
+        fields = [field for field in fields if field in update_fields]
+
+    instance._previous_blobs = {}
+    if fields and instance.pk and not instance._state.adding:
+        instance._previous_blobs = sender._base_manager.filter(pk=instance.pk).values(*fields).first() or {}
+
+
+def update_blob_references(sender, instance, raw=False, **kwargs):
+    """Move blob references from the previous file names to the saved ones"""
+    previous = getattr(instance, '_previous_blobs', None)
+    if previous is None or raw:
+        return
+    for field in blob_fields(sender):
+        if field not in previous and not kwargs.get('created'):
+            continue
+        old_name = previous.get(field) or ''
+        new_name = getattr(instance, field).name or ''
+        if old_name != new_name:
+            retain(new_name)
+            release(old_name)
+
+
+def release_deleted_blobs(sender, instance, **kwargs):
+    """Drop the references held by a deleted row"""
+    for field in blob_fields(sender):
+        release(getattr(instance, field).name or '')
+
+
+def connect_blob_receivers():
+    """Track blob references of the models with content-addressed file fields; called from UsersConfig.ready()"""
+    for model, fields in models_with_blob_fields():
+        label = model._meta.label
+        pre_save.connect(remember_previous_blobs, sender=model, dispatch_uid=f'blobs-pre-save-{label}')
+        post_save.connect(update_blob_references, sender=model, dispatch_uid=f'blobs-post-save-{label}')
+        post_delete.connect(release_deleted_blobs, sender=model, dispatch_uid=f'blobs-post-delete-{label}')
+
+
+@receiver(post_save, sender=ProviderProfile)
+def schedule_profile_photo_thumbnails(sender, instance, created=False, raw=False, **kwargs):
+    """Build list thumbnails in the background whenever the profile photo changes"""
+    if raw:
+        return
+    photo_name = instance.profilePhoto.name if instance.profilePhoto else ''
+    thumb_name = instance.profilePhotoThumb.name if instance.profilePhotoThumb else ''
+
+    if not photo_name:
+        if thumb_name:
+            ProviderProfile.objects.filter(pk=instance.pk).update(profilePhotoThumb=None)
+            bump_version(ProviderProfile)
+        return
+
+    # Only when this save wrote a new photo, so one that cannot be decoded is not
+    # retried on every later save (generate_thumbnails backfills the rest)
+    previous = getattr(instance, '_previous_blobs', {})
+    photo_changed = created or ('profilePhoto' in previous and previous['profilePhoto'] != photo_name)
+    if photo_changed and thumb_name != list_thumbnail_name(photo_name):
+        run_in_background(generate_profile_photo_thumbnails, instance.pk)
+
+
+@receiver(post_save, sender=ProviderProfile)
+def schedule_document_processing(sender, instance, created=False, raw=False, **kwargs):
+    """Recompress newly uploaded ID and license scans in the background"""
+    if raw:
+        return
+    # Filled in by remember_previous_blobs for the fields this save wrote
+    previous = getattr(instance, '_previous_blobs', {})
+    for field in ('idDocument', 'licenseDocument'):
+        name = getattr(instance, field).name
+        if name and (created or (field in previous and previous[field] != name)):
+            run_in_background(process_provider_document, instance.pk, field)
+
+
+@receiver(post_save, sender=UserSettings)
+@receiver(post_delete, sender=UserSettings)
+def forget_cached_working_hours(sender, instance, **kwargs):
+    """Rebuild the provider's weekly availability template on next use"""
+    user_id = instance.user_id
+    transaction.on_commit(lambda: forget_weekly_template(user_id))
@@ -0,0 +1,122 @@
+"""
+Content-addressed storage for uploaded documents
+Every upload is stored once under its SHA-256 digest, so re-uploading the
+same file reuses the existing blob instead of writing another copy
+"""
+
+import hashlib
+import os
+import tempfile
+
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.deconstruct import deconstructible
+
+
+BLOB_PREFIX = 'blobs'
+
+
+def is_blob_name(name):
+    """Whether a stored file name was produced by ContentAddressedStorage"""
+    return bool(name) and name.startswith(f'{BLOB_PREFIX}/')
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    FileSystemStorage that names files by the SHA-256 of their content
+
+    Files live at blobs/<first two hex chars>/<digest><ext>. Identical
+    uploads map to the same name and are only written once. Every save
+    registers the blob in StoredBlob (see users.blobs), which keeps its
+    reference count; unreferenced blobs are removed by the collect_blobs
+    command.
+    """
+
+    chunk_size = 64 * 1024
+
+    def digest(self, content):
+        """SHA-256 hex digest of a File, read in chunks"""
+        sha256 = hashlib.sha256()
+        for chunk in content.chunks(chunk_size=self.chunk_size):
+            sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def blob_name(self, digest, original_name):
+        extension = os.path.splitext(original_name)[1].lower()
+        return f'{BLOB_PREFIX}/{digest[:2]}/{digest}{extension}'
+
+    def get_available_name(self, name, max_length=None):
+        # _save() decides the final name from the content, and an existing
+        # file with that name already holds the same bytes
+        return name
+
+    def _stage(self, content):
+        """
+        (temp_path, digest, is_upload_file) of content staged next to the blobs
+
+        In-memory uploads are hashed while they are written to a temp file;
+        uploads Django already spooled to disk are hashed in place and moved
+        later instead of copied.
+        """
+        if hasattr(content, 'temporary_file_path'):
+            return content.temporary_file_path(), self.digest(content), True
+
+        directory = self.path(BLOB_PREFIX)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.upload-')
+        sha256 = hashlib.sha256()
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                for chunk in content.chunks(chunk_size=self.chunk_size):
+                    sha256.update(chunk)
+                    temp_file.write(chunk)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return temp_path, sha256.hexdigest(), False
+
+    def _save(self, name, content):
+        from .models import StoredBlob
+
+        temp_path, digest, is_upload_file = self._stage(content)
+        blob_name = self.blob_name(digest, name)
+        full_path = self.path(blob_name)
+        try:
+            # collect_garbage() deletes a blob's file while holding its row lock, so
+            # checking for the file and touching the row under the same lock keeps
+            # the blob alive through the grace period until the saving row retains it
+            with transaction.atomic():
+                blob = StoredBlob.objects.select_for_update().filter(name=blob_name).first()
+                if blob is not None:
+                    StoredBlob.objects.filter(pk=blob.pk).update(updatedAt=timezone.now())
+                    if os.path.exists(full_path):
+                        return blob_name
+
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                if is_upload_file:
+                    file_move_safe(temp_path, full_path, allow_overwrite=True)
+                else:
+                    # Renamed into place so readers never see a partial blob
+                    os.replace(temp_path, full_path)
+                if self.file_permissions_mode is not None:
+                    os.chmod(full_path, self.file_permissions_mode)
+
+                if blob is None:
+                    try:
+                        with transaction.atomic():
+                            StoredBlob.objects.create(
+                                name=blob_name, digest=digest, size=os.path.getsize(full_path), refCount=0
+                            )
+                    except IntegrityError:
+                        # Registered concurrently by an identical upload
+                        pass
+            return blob_name
+        finally:
+            if not is_upload_file and os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+
+document_storage = ContentAddressedStorage()
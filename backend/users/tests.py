@@ -1,3 +1,35 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
-# Create your tests here.
+from .models import User, UserSettings
+from .working_hours import DEFAULT_WORKING_HOURS, get_weekly_templates, weekly_template
+
+
+@override_settings(WORKING_HOURS_CACHE_TIMEOUT=60)
+class WorkingHoursTests(TestCase):
+    """Weekly templates follow the provider's saved settings"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.provider = User.objects.create_user(
+            email='rider@riderspool.test', password='password123', fullName='Rider',
+            userType='provider', category='motorbike-rider'
+        )
+
+    def test_defaults_without_settings(self):
+        template = weekly_template(None)
+        self.assertEqual(template[0], (8 * 60, 17 * 60))
+        self.assertIsNone(template[5])
+
+    def test_no_working_days_saved(self):
+        user_settings = UserSettings(user=self.provider, workingDays=[], workingHours=DEFAULT_WORKING_HOURS)
+        self.assertEqual(weekly_template(user_settings), [None] * 7)
+
+    def test_saving_settings_drops_the_cached_template(self):
+        user_settings = UserSettings.objects.create(user=self.provider)
+        self.assertIsNotNone(get_weekly_templates([self.provider.id])[self.provider.id][0])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user_settings.workingDays = []
+            user_settings.save()
+
+        self.assertEqual(get_weekly_templates([self.provider.id])[self.provider.id], [None] * 7)
@@ -8,7 +8,10 @@ from .views import (
     EmployerProfileViewSet, SavedProviderViewSet,
     ForgotPasswordView, ResetPasswordView, UserSettingsView
 )
-from .admin_views import admin_dashboard_stats, admin_interview_analytics
+from .admin_views import (
+    admin_dashboard_stats, admin_interview_analytics,
+    admin_import_providers, admin_slow_queries
+)
 
 # Create router for viewsets
 router = DefaultRouter()
@@ -33,7 +36,9 @@ urlpatterns = [
 
     # Admin endpoints
     path('admin/dashboard/stats/', admin_dashboard_stats, name='admin-dashboard-stats'),
+    path('admin/dashboard/slow-queries/', admin_slow_queries, name='admin-slow-queries'),
     path('admin/analytics/interviews/', admin_interview_analytics, name='admin-interview-analytics'),
+    path('admin/providers/import/', admin_import_providers, name='admin-import-providers'),
 
     # Router URLs
     path('', include(router.urls)),
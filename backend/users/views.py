@@ -5,6 +5,8 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
 from django.contrib.auth import get_user_model
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 
@@ -17,7 +19,10 @@ from .serializers import (
     ChangePasswordSerializer, ForgotPasswordSerializer, ResetPasswordSerializer,
     UserSettingsSerializer
 )
+from interviews.availability import parse_date_range, to_minutes
+from interviews.calendar import MAX_BULK_PROVIDERS, is_free, provider_calendars, serialize_day
 from notifications.email_service import EmailService
+from riderspool_backend.cache import CachedResponseMixin
 
 User = get_user_model()
 
@@ -168,15 +173,18 @@ class UserViewSet(viewsets.ModelViewSet):
         }, status=status.HTTP_200_OK)
 
 
-class ProviderProfileViewSet(viewsets.ModelViewSet):
+class ProviderProfileViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """ViewSet for ProviderProfile model"""
+    # Employers and admins share a cache; providers only see their own profile
+    cache_models = (ProviderProfile, User)
+    cache_per_user_roles = ('provider',)
     queryset = ProviderProfile.objects.select_related('user').all()
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['category', 'availability']
     search_fields = ['user__fullName', 'registeredName', 'skills']
-    ordering_fields = ['rating', 'totalInterviews', 'experience']
-    ordering = ['-rating']
+    ordering_fields = ['rankScore', 'rating', 'totalInterviews', 'experience']
+    ordering = ['-rankScore']
     lookup_field = 'user_id'  # Look up by User ID instead of ProviderProfile ID
 
     def get_serializer_class(self):
@@ -272,6 +280,65 @@ class ProviderProfileViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_404_NOT_FOUND
                 )
 
+    @action(detail=False, methods=['get'])
+    def availability(self, request):
+        """
+        Free and busy times of several providers at once
+
+        ?providers= takes comma-separated user ids. With ?at=<datetime> (and
+        optionally ?duration= in minutes) only that day is returned and each
+        provider is marked available or not for that time.
+        """
+        try:
+            user_ids = list(dict.fromkeys(
+                int(value) for value in request.query_params.get('providers', '').split(',') if value.strip()
+            ))
+        except ValueError:
+            return Response({'error': 'providers must be a comma-separated list of ids'}, status=status.HTTP_400_BAD_REQUEST)
+        if not user_ids:
+            return Response({'error': 'providers is required'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(user_ids) > MAX_BULK_PROVIDERS:
+            return Response(
+                {'error': f'At most {MAX_BULK_PROVIDERS} providers can be requested at once'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        at = None
+        if request.query_params.get('at'):
+            try:
+                at = parse_datetime(request.query_params['at'])
+                duration = int(request.query_params.get('duration', 60))
+            except ValueError:
+                at = None
+            if at is None or duration <= 0:
+                return Response(
+                    {'error': 'at must be a date and time such as 2025-01-21T10:00, duration a number of minutes'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if timezone.is_aware(at):
+                at = timezone.localtime(at)
+            start = end = at.date()
+        else:
+            try:
+                start, end = parse_date_range(request.query_params)
+            except ValueError as e:
+                return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Only ids of existing provider profiles, in the order requested
+        known = set(ProviderProfile.objects.filter(user_id__in=user_ids).values_list('user_id', flat=True))
+        user_ids = [user_id for user_id in user_ids if user_id in known]
+        calendars = provider_calendars(user_ids, start, end)
+
+        results = []
+        for user_id in user_ids:
+            entry = {'provider': user_id, 'days': [serialize_day(day) for day in calendars[user_id]]}
+            if at is not None:
+                begin = to_minutes(at)
+                entry['availableAt'] = is_free(calendars[user_id][0], begin, begin + duration)
+            results.append(entry)
+
+        return Response({'from': start.isoformat(), 'to': end.isoformat(), 'results': results})
+
     @action(detail=True, methods=['get'], url_path='has-hired')
     def has_hired(self, request, pk=None):
         """Check if current employer has hired this provider"""
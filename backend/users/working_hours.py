@@ -0,0 +1,100 @@
+"""
+Weekly working-hours templates built from UserSettings
+A provider's workingDays, workingHours and availableWeekends settings are
+expanded into one working window per weekday. Templates are cached per
+provider and dropped whenever their settings are saved. The cache is only
+used when it is shared by every process (WORKING_HOURS_CACHE_TIMEOUT), as a
+worker's private cache would never see another worker drop a template
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import UserSettings, default_working_days
+
+
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+WEEKEND = {5, 6}
+
+# Used for providers who never saved their availability settings (same as the settings page)
+DEFAULT_WORKING_DAYS = default_working_days()
+DEFAULT_WORKING_HOURS = {'start': '08:00', 'end': '17:00'}
+
+
+def template_cache_key(user_id):
+    return f'working-hours:template:{user_id}'
+
+
+def _parse_minutes(value):
+    """Minutes since midnight of an 'HH:MM' string, or None"""
+    try:
+        hours, minutes = str(value).split(':')[:2]
+        hours, minutes = int(hours), int(minutes)
+    except (TypeError, ValueError):
+        return None
+    if 0 <= hours <= 24 and 0 <= minutes < 60:
+        return min(hours * 60 + minutes, 24 * 60)
+    return None
+
+
+def weekly_template(user_settings):
+    """
+    Working window of each weekday
+
+    Saturday and Sunday only count when availableWeekends is set; a provider
+    who allows weekends without ticking either day works both. An empty
+    workingDays list means no working weekdays; the defaults only apply to
+    providers without a settings row.
+
+    Returns:
+        A list of 7 entries indexed by date.weekday(), each either None (not
+        working) or a (start_minute, end_minute) tuple
+    """
+    if user_settings is None:
+        days, hours, weekends = DEFAULT_WORKING_DAYS, DEFAULT_WORKING_HOURS, False
+    else:
+        days = user_settings.workingDays if isinstance(user_settings.workingDays, list) else DEFAULT_WORKING_DAYS
+        hours = user_settings.workingHours or DEFAULT_WORKING_HOURS
+        weekends = user_settings.availableWeekends
+
+    names = {str(day).strip().lower() for day in days}
+    working = {index for index, name in enumerate(WEEKDAYS) if name.lower() in names}
+    if weekends:
+        if not working & WEEKEND:
+            working |= WEEKEND
+    else:
+        working -= WEEKEND
+
+    start = _parse_minutes(hours.get('start')) if isinstance(hours, dict) else None
+    end = _parse_minutes(hours.get('end')) if isinstance(hours, dict) else None
+    if start is None or end is None or end <= start:
+        start = _parse_minutes(DEFAULT_WORKING_HOURS['start'])
+        end = _parse_minutes(DEFAULT_WORKING_HOURS['end'])
+
+    return [(start, end) if weekday in working else None for weekday in range(7)]
+
+
+def get_weekly_templates(user_ids):
+    """Weekly templates of many providers, reading settings only for those not cached"""
+    timeout = settings.WORKING_HOURS_CACHE_TIMEOUT
+    keys = {user_id: template_cache_key(user_id) for user_id in user_ids}
+    cached = cache.get_many(keys.values()) if timeout else {}
+    templates = {user_id: cached[key] for user_id, key in keys.items() if key in cached}
+
+    missing = [user_id for user_id in keys if user_id not in templates]
+    if missing:
+        settings_by_user = {
+            user_settings.user_id: user_settings
+            for user_settings in UserSettings.objects.filter(user_id__in=missing).only(
+                'user_id', 'workingDays', 'workingHours', 'availableWeekends'
+            )
+        }
+        built = {user_id: weekly_template(settings_by_user.get(user_id)) for user_id in missing}
+        if timeout:
+            cache.set_many({keys[user_id]: template for user_id, template in built.items()}, timeout)
+        templates.update(built)
+    return templates
+
+
+def forget_weekly_template(user_id):
+    cache.delete(template_cache_key(user_id))
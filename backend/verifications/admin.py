@@ -1,11 +1,12 @@
 from django.contrib import admin
-from .models import Verification, VerificationDocument
+from django.utils.html import format_html
+from .models import Verification, VerificationDocument, DocumentUploadSession
 
 
 class VerificationDocumentInline(admin.TabularInline):
     model = VerificationDocument
     extra = 0
-    readonly_fields = ['uploadedAt']
+    readonly_fields = ['originalFileSize', 'pageCount', 'preview', 'uploadedAt']
 
 
 @admin.register(Verification)
@@ -19,7 +20,21 @@ class VerificationAdmin(admin.ModelAdmin):
 
 @admin.register(VerificationDocument)
 class VerificationDocumentAdmin(admin.ModelAdmin):
-    list_display = ['verification', 'documentType', 'fileName', 'fileSize', 'uploadedAt']
+    list_display = ['verification', 'documentType', 'fileName', 'fileSize', 'pageCount', 'preview_link', 'uploadedAt']
     list_filter = ['documentType', 'uploadedAt']
-    search_fields = ['verification__provider__fullName', 'fileName']
-    readonly_fields = ['uploadedAt']
+    search_fields = ['verification__provider__fullName', 'fileName', 'extractedText']
+    readonly_fields = ['originalFileSize', 'pageCount', 'preview', 'extractedText', 'uploadedAt']
+
+    @admin.display(description='Preview')
+    def preview_link(self, obj):
+        if not obj.preview:
+            return '-'
+        return format_html('<a href="{}" target="_blank">View</a>', obj.preview.url)
+
+
+@admin.register(DocumentUploadSession)
+class DocumentUploadSessionAdmin(admin.ModelAdmin):
+    list_display = ['uploadId', 'uploadedBy', 'documentType', 'fileName', 'receivedBytes', 'fileSize', 'status', 'updatedAt']
+    list_filter = ['status', 'documentType']
+    search_fields = ['uploadedBy__email', 'fileName']
+    readonly_fields = ['uploadId', 'createdAt', 'updatedAt']
@@ -0,0 +1,16 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from verifications.uploads import purge_stale_sessions
+
+
+class Command(BaseCommand):
+    help = 'Abort idle chunked document uploads and delete their partial files'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--max-age-hours', type=int, default=24, help='Abort uploads idle for at least this long')
+
+    def handle(self, *args, **options):
+        purged = purge_stale_sessions(max_age=timedelta(hours=options['max_age_hours']))
+        self.stdout.write(self.style.SUCCESS(f'{purged} stale upload(s) aborted'))
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.3 on 2026-10-19 18:02
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('verifications', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='verification',
+            name='provider',
+            field=models.ForeignKey(blank=True, limit_choices_to={'userType': 'provider'}, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='provider_verification_requests', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='verificationdocument',
+            name='documentType',
+            field=models.CharField(choices=[('id', 'National ID'), ('license', "Driver's License"), ('profile_photo', 'Profile Photo'), ('certificate', 'Certificate'), ('company_registration', 'Company Registration Certificate'), ('tax_certificate', 'Tax Compliance Certificate'), ('business_permit', 'Business Permit'), ('other', 'Other')], max_length=20),
+        ),
+        migrations.CreateModel(
+            name='DocumentUploadSession',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('uploadId', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('documentType', models.CharField(choices=[('id', 'National ID'), ('license', "Driver's License"), ('profile_photo', 'Profile Photo'), ('certificate', 'Certificate'), ('company_registration', 'Company Registration Certificate'), ('tax_certificate', 'Tax Compliance Certificate'), ('business_permit', 'Business Permit'), ('other', 'Other')], max_length=20)),
+                ('fileName', models.CharField(max_length=255)),
+                ('fileSize', models.IntegerField(help_text='Declared total size in bytes')),
+                ('receivedBytes', models.IntegerField(default=0, help_text='Bytes received contiguously from the start of the file')),
+                ('contentType', models.CharField(blank=True, help_text='Type detected from the magic bytes', max_length=50)),
+                ('status', models.CharField(choices=[('uploading', 'Uploading'), ('completed', 'Completed'), ('aborted', 'Aborted')], default='uploading', max_length=20)),
+                ('createdAt', models.DateTimeField(auto_now_add=True)),
+                ('updatedAt', models.DateTimeField(auto_now=True)),
+                ('document', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='upload_session', to='verifications.verificationdocument')),
+                ('uploadedBy', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='document_uploads', to=settings.AUTH_USER_MODEL)),
+                ('verification', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to='verifications.verification')),
+            ],
+            options={
+                'verbose_name': 'Document Upload Session',
+                'verbose_name_plural': 'Document Upload Sessions',
+                'db_table': 'verification_upload_sessions',
+                'ordering': ['-createdAt'],
+                'indexes': [models.Index(fields=['status', 'updatedAt'], name='verificatio_status_af86d7_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-19 18:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('verifications', '0002_document_upload_sessions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='verificationdocument',
+            name='originalFileSize',
+            field=models.IntegerField(blank=True, help_text='Size of the upload before recompression; set once processed', null=True),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.3 on 2026-10-19 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('verifications', '0003_verificationdocument_originalfilesize'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='verificationdocument',
+            name='extractedText',
+            field=models.TextField(blank=True, default='', help_text='Text from the first pages of a PDF'),
+        ),
+        migrations.AddField(
+            model_name='verificationdocument',
+            name='pageCount',
+            field=models.IntegerField(blank=True, help_text='Number of pages (1 for images, 0 if the PDF could not be read)', null=True),
+        ),
+        migrations.AddField(
+            model_name='verificationdocument',
+            name='preview',
+            field=models.FileField(blank=True, editable=False, help_text='Small JPEG of the first page, or a one-page PDF', null=True, upload_to='verifications/previews/'),
+        ),
+    ]
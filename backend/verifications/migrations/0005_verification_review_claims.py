@@ -0,0 +1,26 @@
+# Generated by Django 5.2.3 on 2026-10-19 18:09
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('verifications', '0004_verificationdocument_preview'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='verification',
+            name='claimedBy',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='claimed_verifications', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='verification',
+            name='claimedUntil',
+            field=models.DateTimeField(blank=True, help_text='Claim expires at this time', null=True),
+        ),
+    ]
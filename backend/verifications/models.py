@@ -1,5 +1,8 @@
+import uuid
+
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 
 class Verification(models.Model):
@@ -44,6 +47,16 @@ class Verification(models.Model):
     rejectionReason = models.TextField(blank=True, null=True)
     adminNotes = models.TextField(blank=True, null=True, help_text='Internal notes for admin use')
 
+    # Review queue lease: the admin currently working on this request
+    claimedBy = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='claimed_verifications'
+    )
+    claimedUntil = models.DateTimeField(blank=True, null=True, help_text='Claim expires at this time')
+
     # Timestamps
     submittedAt = models.DateTimeField(auto_now_add=True)
     reviewedAt = models.DateTimeField(blank=True, null=True)
@@ -62,6 +75,14 @@ class Verification(models.Model):
     def __str__(self):
         return f"Verification for {self.provider.fullName} - {self.get_status_display()}"
 
+    def is_claimed_by_other(self, user, now=None):
+        """Whether another admin holds an unexpired review claim"""
+        now = now or timezone.now()
+        return bool(
+            self.claimedBy_id and self.claimedBy_id != user.id
+            and self.claimedUntil and self.claimedUntil > now
+        )
+
 
 class VerificationDocument(models.Model):
     """Model to store verification documents"""
@@ -82,6 +103,12 @@ class VerificationDocument(models.Model):
     document = models.FileField(upload_to='verifications/')
     fileName = models.CharField(max_length=255)
     fileSize = models.IntegerField(help_text='File size in bytes')
+    originalFileSize = models.IntegerField(blank=True, null=True, help_text='Size of the upload before recompression; set once processed')
+
+    # Review metadata, filled in by verifications.processing after upload
+    preview = models.FileField(upload_to='verifications/previews/', blank=True, null=True, editable=False, help_text='Small JPEG of the first page, or a one-page PDF')
+    pageCount = models.IntegerField(blank=True, null=True, help_text='Number of pages (1 for images, 0 if the PDF could not be read)')
+    extractedText = models.TextField(blank=True, default='', help_text='Text from the first pages of a PDF')
     uploadedAt = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -92,3 +119,46 @@ class VerificationDocument(models.Model):
 
     def __str__(self):
         return f"{self.get_documentType_display()} for {self.verification.provider.fullName}"
+
+
+class DocumentUploadSession(models.Model):
+    """Resumable chunked upload of a verification document"""
+
+    STATUS_CHOICES = [
+        ('uploading', 'Uploading'),
+        ('completed', 'Completed'),
+        ('aborted', 'Aborted'),
+    ]
+
+    uploadId = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    verification = models.ForeignKey(Verification, on_delete=models.CASCADE, related_name='upload_sessions')
+    uploadedBy = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='document_uploads')
+    documentType = models.CharField(max_length=20, choices=VerificationDocument.DOCUMENT_TYPE_CHOICES)
+    fileName = models.CharField(max_length=255)
+    fileSize = models.IntegerField(help_text='Declared total size in bytes')
+    receivedBytes = models.IntegerField(default=0, help_text='Bytes received contiguously from the start of the file')
+    contentType = models.CharField(max_length=50, blank=True, help_text='Type detected from the magic bytes')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='uploading')
+    document = models.OneToOneField(
+        VerificationDocument,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='upload_session'
+    )
+
+    # Timestamps
+    createdAt = models.DateTimeField(auto_now_add=True)
+    updatedAt = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'verification_upload_sessions'
+        verbose_name = 'Document Upload Session'
+        verbose_name_plural = 'Document Upload Sessions'
+        ordering = ['-createdAt']
+        indexes = [
+            models.Index(fields=['status', 'updatedAt']),
+        ]
+
+    def __str__(self):
+        return f"Upload {self.uploadId} ({self.receivedBytes}/{self.fileSize} bytes)"
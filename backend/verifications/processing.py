@@ -0,0 +1,146 @@
+"""
+Background processing of uploaded verification documents
+Image documents are recompressed, then every document gets a small
+first-page preview, a page count and (for PDFs) its extracted text so
+admins can review it without downloading the original
+"""
+
+import io
+import logging
+import os
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+from PyPDF2 import PdfReader, PdfWriter
+
+from users.image_pipeline import recompress_document
+from .models import VerificationDocument
+
+
+logger = logging.getLogger('riderspool.documents')
+
+# Longest edge of the preview image in pixels
+PREVIEW_SIZE = 480
+# Only the first pages are read for text; enough to identify a certificate
+MAX_TEXT_PAGES = 5
+MAX_TEXT_LENGTH = 5000
+
+
+def process_verification_document(document_id):
+    """Background task: run every processing stage for a new document"""
+    recompress_verification_document(document_id)
+    extract_document_metadata(document_id)
+
+
+def recompress_verification_document(document_id):
+    """Recompress an image document and record its original size"""
+    document = VerificationDocument.objects.filter(pk=document_id).first()
+    if document is None or document.originalFileSize is not None:
+        return
+
+    name = document.document.name
+    storage = document.document.storage
+    original_size = storage.size(name)
+    with storage.open(name, 'rb') as original:
+        result = recompress_document(original, original_size)
+
+    if result is None:
+        VerificationDocument.objects.filter(pk=document_id, document=name).update(originalFileSize=original_size)
+        return
+
+    data, extension = result
+    new_name = storage.save(os.path.splitext(name)[0] + extension, ContentFile(data))
+    updated = VerificationDocument.objects.filter(pk=document_id, document=name).update(
+        document=new_name,
+        fileName=os.path.splitext(document.fileName)[0] + extension,
+        fileSize=len(data),
+        originalFileSize=original_size
+    )
+    # Keep whichever file the row ends up pointing at
+    storage.delete(name if updated else new_name)
+
+
+def _preview_image(image):
+    image = ImageOps.exif_transpose(image)
+    image.thumbnail((PREVIEW_SIZE, PREVIEW_SIZE), Image.Resampling.LANCZOS)
+    buffer = io.BytesIO()
+    image.convert('RGB').save(buffer, 'JPEG', quality=75, optimize=True)
+    return buffer.getvalue()
+
+
+def _pdf_metadata(file):
+    """
+    Read page count, text and a preview from a PDF
+
+    Scanned PDFs get a JPEG of the largest image on the first page; other
+    PDFs get their first page copied into a one-page PDF, since PyPDF2
+    cannot rasterize pages.
+
+    Returns:
+        (page_count, text, preview_bytes, preview_extension)
+    """
+    reader = PdfReader(file)
+    page_count = len(reader.pages)
+    if not page_count:
+        return 0, '', None, None
+
+    text_parts = []
+    for page in reader.pages[:MAX_TEXT_PAGES]:
+        text_parts.append(page.extract_text() or '')
+        if sum(len(part) for part in text_parts) >= MAX_TEXT_LENGTH:
+            break
+    text = '\n'.join(part.strip() for part in text_parts if part.strip())[:MAX_TEXT_LENGTH]
+
+    first_page = reader.pages[0]
+    try:
+        images = first_page.images
+    except Exception:
+        images = []
+    for embedded in sorted(images, key=lambda item: len(item.data), reverse=True):
+        try:
+            with Image.open(io.BytesIO(embedded.data)) as image:
+                return page_count, text, _preview_image(image), '.jpg'
+        except (OSError, UnidentifiedImageError):
+            continue
+
+    writer = PdfWriter()
+    writer.add_page(first_page)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return page_count, text, buffer.getvalue(), '.pdf'
+
+
+def extract_document_metadata(document_id):
+    """Store the page count, extracted text and first-page preview of a document"""
+    document = VerificationDocument.objects.filter(pk=document_id).first()
+    if document is None or document.pageCount is not None:
+        return
+
+    name = document.document.name
+    preview = extension = None
+    text = ''
+    with document.document.storage.open(name, 'rb') as file:
+        if file.read(5) == b'%PDF-':
+            file.seek(0)
+            try:
+                page_count, text, preview, extension = _pdf_metadata(file)
+            except Exception as e:
+                # Damaged or encrypted PDFs still go to review, just without a preview
+                logger.warning('Could not read PDF %s: %s', name, e)
+                page_count = 0
+        else:
+            file.seek(0)
+            page_count = 1
+            try:
+                with Image.open(file) as image:
+                    preview, extension = _preview_image(image), '.jpg'
+            except (OSError, UnidentifiedImageError) as e:
+                logger.warning('Could not create preview for %s: %s', name, e)
+
+    updates = {'pageCount': page_count, 'extractedText': text}
+    if preview:
+        document.preview.save(f'{document.pk}{extension}', ContentFile(preview), save=False)
+        updates['preview'] = document.preview.name
+
+    if not VerificationDocument.objects.filter(pk=document_id, document=name).update(**updates) and preview:
+        document.preview.storage.delete(document.preview.name)
@@ -1,23 +1,37 @@
+import os
+
+from django.db import models
 from rest_framework import serializers
-from .models import Verification, VerificationDocument
+from riderspool_backend.media import ProtectedFileField
+from .models import Verification, VerificationDocument, DocumentUploadSession
+from .uploads import ALLOWED_EXTENSIONS, MAX_DOCUMENT_SIZE, RECOMMENDED_CHUNK_SIZE
 from users.serializers import UserSerializer
 
 
 class VerificationDocumentSerializer(serializers.ModelSerializer):
     """Serializer for VerificationDocument model"""
+    document = ProtectedFileField(read_only=True)
+    preview = ProtectedFileField(read_only=True)
 
     class Meta:
         model = VerificationDocument
         fields = [
             'id', 'documentType', 'document', 'fileName',
-            'fileSize', 'uploadedAt'
+            'fileSize', 'originalFileSize', 'preview', 'pageCount', 'uploadedAt'
         ]
-        read_only_fields = ['id', 'uploadedAt']
+        read_only_fields = ['id', 'originalFileSize', 'preview', 'pageCount', 'uploadedAt']
+
+
+class VerificationDocumentDetailSerializer(VerificationDocumentSerializer):
+    """Document serializer including the text extracted from PDFs"""
+
+    class Meta(VerificationDocumentSerializer.Meta):
+        fields = VerificationDocumentSerializer.Meta.fields + ['extractedText']
+        read_only_fields = VerificationDocumentSerializer.Meta.read_only_fields + ['extractedText']
 
 
 class VerificationSerializer(serializers.ModelSerializer):
     """Serializer for Verification model"""
-    user = UserSerializer(read_only=True)
     provider = UserSerializer(read_only=True)
     reviewedBy = UserSerializer(read_only=True)
     documents = VerificationDocumentSerializer(many=True, read_only=True)
@@ -25,12 +39,14 @@ class VerificationSerializer(serializers.ModelSerializer):
     class Meta:
         model = Verification
         fields = [
-            'id', 'user', 'provider', 'status', 'reviewedBy',
+            'id', 'provider', 'status', 'reviewedBy',
             'rejectionReason', 'adminNotes', 'documents',
+            'claimedBy', 'claimedUntil',
             'submittedAt', 'reviewedAt', 'updatedAt'
         ]
         read_only_fields = [
-            'id', 'user', 'provider', 'status', 'reviewedBy',
+            'id', 'provider', 'status', 'reviewedBy',
+            'claimedBy', 'claimedUntil',
             'submittedAt', 'reviewedAt', 'updatedAt'
         ]
 
@@ -46,8 +62,7 @@ class VerificationCreateSerializer(serializers.ModelSerializer):
         """Create verification request"""
         user = self.context['request'].user
         verification = Verification.objects.create(
-            user=user,
-            provider=user if user.is_provider else None,  # Backward compatibility
+            provider=user,
             status='pending'
         )
         return verification
@@ -60,6 +75,9 @@ class VerificationListSerializer(serializers.ModelSerializer):
     user_category = serializers.SerializerMethodField()
     document_count = serializers.SerializerMethodField()
 
+    # Columns read by this serializer; use with the queryset from list_queryset()
+    USER_FIELDS = ['provider__id', 'provider__fullName', 'provider__userType', 'provider__category', 'provider__companyName']
+
     class Meta:
         model = Verification
         fields = [
@@ -67,16 +85,21 @@ class VerificationListSerializer(serializers.ModelSerializer):
             'status', 'document_count', 'submittedAt'
         ]
 
+    @classmethod
+    def list_queryset(cls, queryset):
+        """Restrict a verification queryset to one query with the columns this serializer needs"""
+        return queryset.select_related(None).prefetch_related(None).select_related('provider').only(
+            'id', 'status', 'submittedAt', *cls.USER_FIELDS
+        ).annotate(document_count=models.Count('documents'))
+
     def get_user_name(self, obj):
-        user = obj.user if obj.user else obj.provider
-        return user.fullName if user else None
+        return obj.provider.fullName if obj.provider else None
 
     def get_user_type(self, obj):
-        user = obj.user if obj.user else obj.provider
-        return user.get_userType_display() if user else None
+        return obj.provider.get_userType_display() if obj.provider else None
 
     def get_user_category(self, obj):
-        user = obj.user if obj.user else obj.provider
+        user = obj.provider
         if user and user.is_provider and user.category:
             return user.get_category_display()
         elif user and user.is_employer:
@@ -84,6 +107,8 @@ class VerificationListSerializer(serializers.ModelSerializer):
         return None
 
     def get_document_count(self, obj):
+        if hasattr(obj, 'document_count'):
+            return obj.document_count
         return obj.documents.count()
 
 
@@ -92,6 +117,16 @@ class VerificationApproveSerializer(serializers.Serializer):
     adminNotes = serializers.CharField(required=False, allow_blank=True)
 
 
+class VerificationClaimSerializer(serializers.Serializer):
+    """Serializer for claiming verifications from the review queue"""
+    count = serializers.IntegerField(required=False, default=10, min_value=1, max_value=50)
+
+
+class VerificationBulkApproveSerializer(VerificationApproveSerializer):
+    """Serializer for approving many verifications at once"""
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=1000)
+
+
 class VerificationRejectSerializer(serializers.Serializer):
     """Serializer for rejecting verification"""
     rejectionReason = serializers.CharField(required=True)
@@ -103,6 +138,11 @@ class VerificationRejectSerializer(serializers.Serializer):
         return value
 
 
+class VerificationBulkRejectSerializer(VerificationRejectSerializer):
+    """Serializer for rejecting many verifications at once"""
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=1000)
+
+
 class VerificationDocumentUploadSerializer(serializers.ModelSerializer):
     """Serializer for uploading verification documents"""
 
@@ -140,3 +180,54 @@ class VerificationDocumentUploadSerializer(serializers.ModelSerializer):
             )
 
         return attrs
+
+
+class DocumentUploadInitSerializer(serializers.ModelSerializer):
+    """Serializer for starting a chunked document upload"""
+
+    class Meta:
+        model = DocumentUploadSession
+        fields = ['verification', 'documentType', 'fileName', 'fileSize']
+
+    def validate_verification(self, value):
+        user = self.context['request'].user
+        if value.provider_id != user.id:
+            raise serializers.ValidationError("Only the owner can upload documents")
+        if value.status != 'pending':
+            raise serializers.ValidationError("Documents can only be uploaded for pending verifications")
+        return value
+
+    def validate_fileName(self, value):
+        if os.path.splitext(value)[1].lower() not in ALLOWED_EXTENSIONS:
+            raise serializers.ValidationError("Only JPEG, PNG, and PDF files are allowed")
+        return os.path.basename(value)
+
+    def validate_fileSize(self, value):
+        if value <= 0:
+            raise serializers.ValidationError("File is empty")
+        if value > MAX_DOCUMENT_SIZE:
+            raise serializers.ValidationError("File size must be less than 5MB")
+        return value
+
+    def create(self, validated_data):
+        return DocumentUploadSession.objects.create(
+            uploadedBy=self.context['request'].user,
+            **validated_data
+        )
+
+
+class DocumentUploadSessionSerializer(serializers.ModelSerializer):
+    """Serializer for chunked upload progress"""
+    chunkSize = serializers.SerializerMethodField()
+
+    class Meta:
+        model = DocumentUploadSession
+        fields = [
+            'uploadId', 'verification', 'documentType', 'fileName', 'fileSize',
+            'receivedBytes', 'contentType', 'status', 'chunkSize', 'document',
+            'createdAt', 'updatedAt'
+        ]
+        read_only_fields = fields
+
+    def get_chunkSize(self, obj):
+        return RECOMMENDED_CHUNK_SIZE
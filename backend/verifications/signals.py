@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from riderspool_backend.tasks import run_in_background
+from .models import VerificationDocument
+from .processing import process_verification_document
+
+
+@receiver(post_save, sender=VerificationDocument)
+def schedule_document_processing(sender, instance, created=False, raw=False, **kwargs):
+    """Recompress uploaded document images in the background"""
+    if created and not raw:
+        run_in_background(process_verification_document, instance.pk)
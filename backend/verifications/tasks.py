@@ -0,0 +1,16 @@
+"""
+Background tasks for verifications
+"""
+
+from django.contrib.auth import get_user_model
+
+from notifications.email_service import EmailService
+
+
+def send_review_emails(user_ids, approved, rejection_reason=None):
+    """Notify the owners of reviewed verifications, batching the emails"""
+    users = get_user_model().objects.filter(id__in=user_ids)
+    if approved:
+        EmailService.send_verification_approved_emails(users)
+    else:
+        EmailService.send_verification_rejected_emails(users, rejection_reason)
@@ -1,3 +1,160 @@
-from django.test import TestCase
+import tempfile
 
-# Create your tests here.
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from users.models import User
+from . import uploads
+from .models import DocumentUploadSession, Verification, VerificationDocument
+
+
+class VerificationListQueryTests(TestCase):
+    """The verification list must not issue queries per row"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email='admin@riderspool.test', password='password123', fullName='Admin', userType='admin'
+        )
+        cls.provider = User.objects.create_user(
+            email='rider@riderspool.test', password='password123', fullName='Rider',
+            userType='provider', category='motorbike-rider'
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def create_verifications(self, owner, count, documents_each=2):
+        verifications = Verification.objects.bulk_create([
+            Verification(provider=owner, status='rejected') for _ in range(count)
+        ])
+        # bulk_create skips the post_save document processing signal
+        VerificationDocument.objects.bulk_create([
+            VerificationDocument(
+                verification=verification,
+                documentType='id',
+                document=f'verifications/id-{verification.pk}-{index}.pdf',
+                fileName=f'id-{index}.pdf',
+                fileSize=1024
+            )
+            for verification in verifications
+            for index in range(documents_each)
+        ])
+        return verifications
+
+    def list_query_count(self, user):
+        self.client.force_authenticate(user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/verifications/')
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_provider_list_is_one_query_per_page(self):
+        self.create_verifications(self.provider, 1)
+        _, single_row_queries = self.list_query_count(self.provider)
+
+        self.create_verifications(self.provider, 15)
+        response, many_row_queries = self.list_query_count(self.provider)
+
+        self.assertEqual(response.data['count'], 16)
+        self.assertEqual(many_row_queries, single_row_queries)
+        # Pagination COUNT plus the page itself
+        self.assertEqual(many_row_queries, 2)
+
+    def test_provider_list_fields(self):
+        self.create_verifications(self.provider, 1, documents_each=3)
+        response, _ = self.list_query_count(self.provider)
+
+        row = response.data['results'][0]
+        self.assertEqual(row['document_count'], 3)
+        self.assertEqual(row['user_name'], 'Rider')
+        self.assertEqual(row['user_type'], 'Service Provider')
+        self.assertEqual(row['user_category'], self.provider.get_category_display())
+
+    def test_admin_list_is_one_query_per_page(self):
+        others = User.objects.bulk_create([
+            User(email=f'rider{index}@riderspool.test', fullName=f'Rider {index}', userType='provider')
+            for index in range(15)
+        ])
+        for owner in [self.provider, *others]:
+            self.create_verifications(owner, 1)
+
+        self.client.force_authenticate(self.admin)
+        # Pagination COUNT plus the page itself
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/verifications/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 16)
+        self.assertEqual(response.data['results'][0]['document_count'], 2)
+        self.assertNotIn('documents', response.data['results'][0])
+
+    def test_list_reads_only_the_listed_user_columns(self):
+        self.create_verifications(self.provider, 1)
+        self.client.force_authenticate(self.admin)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/verifications/')
+
+        page_query = queries.captured_queries[-1]['sql']
+        self.assertIn('COUNT(', page_query)
+        self.assertNotIn('"password"', page_query)
+        self.assertNotIn('extractedText', page_query)
+
+
+class ChunkedUploadTypeTests(TestCase):
+    """A document's header must be checked whenever it is written, not only the first time"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.provider = User.objects.create_user(
+            email='rider@riderspool.test', password='password123', fullName='Rider',
+            userType='provider', category='motorbike-rider'
+        )
+        cls.verification = Verification.objects.create(provider=cls.provider)
+
+    def setUp(self):
+        upload_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(upload_dir.cleanup)
+        settings_override = override_settings(CHUNKED_UPLOAD_DIR=upload_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.client = APIClient()
+        self.client.force_authenticate(self.provider)
+        self.content = b'\xff\xd8\xff\xe0' + b'0' * 60
+        response = self.client.post('/api/document-uploads/', {
+            'verification': self.verification.pk,
+            'documentType': 'id',
+            'fileName': 'id.jpg',
+            'fileSize': len(self.content),
+        })
+        self.assertEqual(response.status_code, 201)
+        self.url = f"/api/document-uploads/{response.data['uploadId']}/"
+
+    def put_chunk(self, offset, data):
+        return self.client.put(
+            f'{self.url}chunk/', data, content_type='application/octet-stream', HTTP_UPLOAD_OFFSET=str(offset)
+        )
+
+    def test_rewritten_header_is_checked_again(self):
+        self.assertEqual(self.put_chunk(0, self.content[:32]).status_code, 200)
+
+        response = self.put_chunk(0, b'<html><script>alert(1)</script>')
+
+        self.assertEqual(response.status_code, 415)
+        self.assertEqual(DocumentUploadSession.objects.get().status, 'aborted')
+        self.assertEqual(self.client.post(f'{self.url}finalize/').status_code, 400)
+        self.assertFalse(VerificationDocument.objects.exists())
+
+    def test_finalize_checks_the_file_on_disk(self):
+        self.assertEqual(self.put_chunk(0, self.content).status_code, 200)
+        session = DocumentUploadSession.objects.get()
+        with open(uploads.part_path(session), 'r+b') as part:
+            part.write(b'<html>')
+
+        response = self.client.post(f'{self.url}finalize/')
+
+        self.assertEqual(response.status_code, 415)
+        self.assertFalse(VerificationDocument.objects.exists())
@@ -0,0 +1,165 @@
+"""
+Resumable chunked uploads for verification documents
+Chunks are written straight into a per-session part file at their offset,
+and size and file type are checked as each chunk arrives rather than after
+the whole document has been received
+"""
+
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.utils import timezone
+
+
+# Same limit as VerificationDocumentUploadSerializer
+MAX_DOCUMENT_SIZE = 5 * 1024 * 1024
+# Largest chunk accepted by a single PUT
+MAX_CHUNK_SIZE = 1024 * 1024
+# Size the client is told to use
+RECOMMENDED_CHUNK_SIZE = 256 * 1024
+READ_BUFFER_SIZE = 64 * 1024
+
+ALLOWED_EXTENSIONS = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.pdf': 'application/pdf',
+}
+
+# Leading bytes of each allowed type
+MAGIC_NUMBERS = [
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'%PDF-', 'application/pdf'),
+]
+MAGIC_LENGTH = max(len(magic) for magic, _ in MAGIC_NUMBERS)
+
+
+class UploadError(Exception):
+    """Chunk rejected; status is the HTTP status to answer with"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+def upload_dir():
+    return getattr(settings, 'CHUNKED_UPLOAD_DIR', None) or os.path.join(settings.MEDIA_ROOT, 'uploads', 'partial')
+
+
+def part_path(session):
+    return os.path.join(upload_dir(), f'{session.uploadId}.part')
+
+
+def detect_content_type(header):
+    """Content type matching the first bytes of a file, or None"""
+    for magic, content_type in MAGIC_NUMBERS:
+        if header.startswith(magic):
+            return content_type
+    return None
+
+
+def create_part_file(session):
+    os.makedirs(upload_dir(), exist_ok=True)
+    fd = os.open(part_path(session), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.close(fd)
+
+
+def delete_part_file(session):
+    try:
+        os.unlink(part_path(session))
+    except FileNotFoundError:
+        pass
+
+
+def read_chunk(stream, length):
+    """
+    Read a chunk body of length bytes into memory
+
+    Called before the session row is locked, so a slow client does not hold
+    the lock while its chunk arrives.
+    """
+    if length > MAX_CHUNK_SIZE:
+        raise UploadError(f'Chunks must be at most {MAX_CHUNK_SIZE} bytes', status=413)
+
+    data = bytearray()
+    while len(data) < length:
+        piece = stream.read(min(READ_BUFFER_SIZE, length - len(data)))
+        if not piece:
+            raise UploadError('Chunk body is shorter than its Content-Length')
+        data += piece
+    return bytes(data)
+
+
+def write_chunk(session, offset, data):
+    """
+    Write a chunk into the part file at offset
+
+    The caller must hold a row lock on the session. Bytes may overlap what
+    was already received (a retried chunk) but may not leave a gap.
+
+    Returns:
+        The number of contiguous bytes received after this chunk
+    """
+    if offset < 0 or offset > session.receivedBytes:
+        raise UploadError(f'Expected offset {session.receivedBytes}', status=409)
+    if offset + len(data) > session.fileSize:
+        raise UploadError('Chunk extends past the declared file size')
+
+    received = max(session.receivedBytes, offset + len(data))
+    header_length = min(MAGIC_LENGTH, session.fileSize)
+    fd = os.open(part_path(session), os.O_RDWR)
+    try:
+        os.pwrite(fd, data, offset)
+
+        # Check the type once the header has arrived, and again whenever a
+        # retried chunk rewrites it, so a header that passed cannot be swapped
+        if offset < header_length and received >= header_length:
+            session.contentType = _check_header(session, os.pread(fd, MAGIC_LENGTH, 0))
+    finally:
+        os.close(fd)
+    return received
+
+
+def _check_header(session, header):
+    content_type = detect_content_type(header)
+    if content_type is None:
+        raise UploadError('Only JPEG, PNG, and PDF files are allowed', status=415)
+    expected = ALLOWED_EXTENSIONS[os.path.splitext(session.fileName)[1].lower()]
+    # .jpg and .jpeg both map to image/jpeg
+    if content_type != expected:
+        raise UploadError('File content does not match its extension', status=415)
+    return content_type
+
+
+def check_part_file(session):
+    """Check the magic bytes of the completed part file on disk before it is stored"""
+    with open(part_path(session), 'rb') as part:
+        return _check_header(session, part.read(MAGIC_LENGTH))
+
+
+def assembled_file(session):
+    """Open the completed part file as a Django File named after the upload"""
+    return File(open(part_path(session), 'rb'), name=session.fileName)
+
+
+def purge_stale_sessions(max_age=timedelta(hours=24)):
+    """Abort unfinished uploads idle for longer than max_age and delete their part files"""
+    from .models import DocumentUploadSession
+
+    cutoff = timezone.now() - max_age
+    stale_ids = list(
+        DocumentUploadSession.objects.filter(status='uploading', updatedAt__lt=cutoff).values_list('pk', flat=True)
+    )
+    # Re-check the idle time in the UPDATE so a session resumed since the query is kept
+    DocumentUploadSession.objects.filter(
+        pk__in=stale_ids, status='uploading', updatedAt__lt=cutoff
+    ).update(status='aborted', updatedAt=timezone.now())
+
+    aborted = DocumentUploadSession.objects.filter(pk__in=stale_ids, status='aborted').only('id', 'uploadId')
+    for session in aborted:
+        delete_part_file(session)
+    return len(aborted)
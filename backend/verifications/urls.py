@@ -1,12 +1,13 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
-from .views import VerificationViewSet, VerificationDocumentViewSet
+from .views import VerificationViewSet, VerificationDocumentViewSet, DocumentUploadViewSet
 
 # Create router for viewsets
 router = DefaultRouter()
 router.register(r'verifications', VerificationViewSet, basename='verification')
 router.register(r'documents', VerificationDocumentViewSet, basename='verification-document')
+router.register(r'document-uploads', DocumentUploadViewSet, basename='document-upload')
 
 urlpatterns = [
     path('', include(router.urls)),
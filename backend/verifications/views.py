@@ -4,22 +4,32 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
+from datetime import timedelta
+
+from django.conf import settings
 from django.utils import timezone
-from django.db import models
+from django.db import models, transaction
 
-from .models import Verification, VerificationDocument
+from .models import Verification, VerificationDocument, DocumentUploadSession
 from .serializers import (
     VerificationSerializer, VerificationCreateSerializer,
     VerificationListSerializer, VerificationApproveSerializer,
-    VerificationRejectSerializer, VerificationDocumentSerializer,
-    VerificationDocumentUploadSerializer
+    VerificationRejectSerializer, VerificationClaimSerializer,
+    VerificationBulkApproveSerializer, VerificationBulkRejectSerializer, VerificationDocumentSerializer,
+    VerificationDocumentDetailSerializer, VerificationDocumentUploadSerializer, DocumentUploadInitSerializer,
+    DocumentUploadSessionSerializer
 )
+from . import uploads
+from .tasks import send_review_emails
 from notifications.email_service import EmailService
+from riderspool_backend.cache import bump_version
+from riderspool_backend.tasks import run_in_background
+from users.models import User
 
 
 class VerificationViewSet(viewsets.ModelViewSet):
     """ViewSet for Verification model"""
-    queryset = Verification.objects.select_related('user', 'provider', 'reviewedBy').prefetch_related('documents').all()
+    queryset = Verification.objects.select_related('provider', 'reviewedBy').prefetch_related('documents').all()
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['status']
@@ -30,9 +40,7 @@ class VerificationViewSet(viewsets.ModelViewSet):
         if self.action == 'create':
             return VerificationCreateSerializer
         if self.action == 'list':
-            # Return full serializer for admin, simplified for providers
-            if self.request.user.is_admin or self.request.user.is_staff:
-                return VerificationSerializer
+            # Documents and review details come from the detail endpoint
             return VerificationListSerializer
         return VerificationSerializer
 
@@ -41,6 +49,9 @@ class VerificationViewSet(viewsets.ModelViewSet):
         user = self.request.user
         queryset = super().get_queryset()
 
+        if self.get_serializer_class() is VerificationListSerializer:
+            queryset = VerificationListSerializer.list_queryset(queryset)
+
         if user.is_provider or user.is_employer:
             # Return verifications where provider matches
             return queryset.filter(provider=user)
@@ -92,6 +103,12 @@ class VerificationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        if verification.is_claimed_by_other(request.user):
+            return Response(
+                {'error': 'This verification is being reviewed by another administrator'},
+                status=status.HTTP_409_CONFLICT
+            )
+
         serializer = VerificationApproveSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
@@ -100,10 +117,12 @@ class VerificationViewSet(viewsets.ModelViewSet):
         verification.reviewedBy = request.user
         verification.reviewedAt = timezone.now()
         verification.adminNotes = serializer.validated_data.get('adminNotes', '')
+        verification.claimedBy = None
+        verification.claimedUntil = None
         verification.save()
 
-        # Mark user as verified (use 'user' field if available, otherwise 'provider')
-        verified_user = verification.user if verification.user else verification.provider
+        # Mark user as verified
+        verified_user = verification.provider
         verified_user.isVerified = True
         verified_user.save()
 
@@ -135,6 +154,12 @@ class VerificationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        if verification.is_claimed_by_other(request.user):
+            return Response(
+                {'error': 'This verification is being reviewed by another administrator'},
+                status=status.HTTP_409_CONFLICT
+            )
+
         serializer = VerificationRejectSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
@@ -144,10 +169,12 @@ class VerificationViewSet(viewsets.ModelViewSet):
         verification.reviewedAt = timezone.now()
         verification.rejectionReason = serializer.validated_data['rejectionReason']
         verification.adminNotes = serializer.validated_data.get('adminNotes', '')
+        verification.claimedBy = None
+        verification.claimedUntil = None
         verification.save()
 
-        # Send email notification (use 'user' field if available, otherwise 'provider')
-        verified_user = verification.user if verification.user else verification.provider
+        # Send email notification
+        verified_user = verification.provider
         try:
             EmailService.send_verification_rejected_email(
                 verified_user,
@@ -161,14 +188,144 @@ class VerificationViewSet(viewsets.ModelViewSet):
             status=status.HTTP_200_OK
         )
 
+    def _bulk_review(self, request, serializer_class, new_status):
+        """Approve or reject many pending verifications with set-based updates"""
+        if not (request.user.is_admin or request.user.is_staff):
+            return Response(
+                {'error': f'Only administrators can {"approve" if new_status == "approved" else "reject"} verifications'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        requested_ids = set(serializer.validated_data['ids'])
+        now = timezone.now()
+
+        updates = {
+            'status': new_status,
+            'reviewedBy': request.user,
+            'reviewedAt': now,
+            'adminNotes': serializer.validated_data.get('adminNotes', ''),
+            'claimedBy': None,
+            'claimedUntil': None,
+            'updatedAt': now,
+        }
+        if new_status == 'rejected':
+            updates['rejectionReason'] = serializer.validated_data['rejectionReason']
+
+        with transaction.atomic():
+            rows = list(
+                Verification.objects.select_for_update().filter(id__in=requested_ids).values_list(
+                    'id', 'status', 'provider_id', 'claimedBy_id', 'claimedUntil'
+                )
+            )
+
+            reviewed_ids = []
+            owner_ids = set()
+            skipped = []
+            for verification_id, current_status, owner_id, claimed_by_id, claimed_until in rows:
+                if current_status != 'pending':
+                    skipped.append({'id': verification_id, 'reason': f'Verification is {current_status}'})
+                elif claimed_by_id and claimed_by_id != request.user.id and claimed_until and claimed_until > now:
+                    skipped.append({'id': verification_id, 'reason': 'Being reviewed by another administrator'})
+                else:
+                    reviewed_ids.append(verification_id)
+                    if owner_id:
+                        owner_ids.add(owner_id)
+
+            found_ids = {row[0] for row in rows}
+            skipped.extend({'id': missing_id, 'reason': 'Not found'} for missing_id in sorted(requested_ids - found_ids))
+
+            Verification.objects.filter(id__in=reviewed_ids).update(**updates)
+            if new_status == 'approved':
+                User.objects.filter(id__in=owner_ids).update(isVerified=True)
+                transaction.on_commit(lambda: bump_version(User))
+
+            # Queued for after the commit, so no email goes out for a rolled-back review
+            if owner_ids:
+                run_in_background(
+                    send_review_emails, sorted(owner_ids), new_status == 'approved', updates.get('rejectionReason')
+                )
+
+        return Response({
+            'updated': len(reviewed_ids),
+            'ids': reviewed_ids,
+            'skipped': skipped,
+        }, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['post'], url_path='bulk-approve')
+    def bulk_approve(self, request):
+        """Approve many verifications in one transaction (admin only)"""
+        return self._bulk_review(request, VerificationBulkApproveSerializer, 'approved')
+
+    @action(detail=False, methods=['post'], url_path='bulk-reject')
+    def bulk_reject(self, request):
+        """Reject many verifications in one transaction (admin only)"""
+        return self._bulk_review(request, VerificationBulkRejectSerializer, 'rejected')
+
+    @action(detail=False, methods=['post'], url_path='queue/claim')
+    def claim(self, request):
+        """Claim the oldest pending verifications for review (admin only)"""
+        if not (request.user.is_admin or request.user.is_staff):
+            return Response(
+                {'error': 'Only administrators can review verifications'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = VerificationClaimSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        count = serializer.validated_data['count']
+
+        now = timezone.now()
+        lease = timedelta(minutes=settings.VERIFICATION_CLAIM_LEASE_MINUTES)
+        with transaction.atomic():
+            # Rows another admin is claiming right now are skipped rather than waited on;
+            # filter + order_by match the (status, submittedAt) index
+            claimable = Verification.objects.select_for_update(skip_locked=True).filter(
+                models.Q(claimedUntil__isnull=True) | models.Q(claimedUntil__lte=now) | models.Q(claimedBy=request.user),
+                status='pending'
+            ).order_by('submittedAt')
+            claimed_ids = list(claimable.values_list('id', flat=True)[:count])
+            Verification.objects.filter(id__in=claimed_ids).update(
+                claimedBy=request.user, claimedUntil=now + lease
+            )
+
+        claimed = Verification.objects.filter(id__in=claimed_ids).select_related(
+            'provider', 'reviewedBy'
+        ).prefetch_related('documents').order_by('submittedAt')
+
+        return Response({
+            'count': len(claimed_ids),
+            'claimedUntil': now + lease,
+            'results': VerificationSerializer(claimed, many=True, context={'request': request}).data
+        }, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=['post'])
+    def release(self, request, pk=None):
+        """Give a claimed verification back to the review queue (admin only)"""
+        if not (request.user.is_admin or request.user.is_staff):
+            return Response(
+                {'error': 'Only administrators can review verifications'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        released = Verification.objects.filter(pk=pk, claimedBy=request.user).update(
+            claimedBy=None, claimedUntil=None
+        )
+        if not released:
+            return Response(
+                {'error': 'You have not claimed this verification'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response({'message': 'Verification released'}, status=status.HTTP_200_OK)
+
     @action(detail=True, methods=['post'])
     def upload_document(self, request, pk=None):
         """Upload document for verification"""
         verification = self.get_object()
 
         # Check if user owns this verification
-        verified_user = verification.user if verification.user else verification.provider
-        if request.user != verified_user:
+        if request.user != verification.provider:
             return Response(
                 {'error': 'Only the owner can upload documents'},
                 status=status.HTTP_403_FORBIDDEN
@@ -232,15 +389,175 @@ class VerificationDocumentViewSet(viewsets.ReadOnlyModelViewSet):
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['documentType', 'verification']
 
+    def get_serializer_class(self):
+        """Include extracted text only when a single document is requested"""
+        if self.action == 'retrieve':
+            return VerificationDocumentDetailSerializer
+        return VerificationDocumentSerializer
+
     def get_queryset(self):
         """Filter documents based on user"""
         user = self.request.user
         queryset = super().get_queryset()
 
         if user.is_provider or user.is_employer:
-            return queryset.filter(
-                models.Q(verification__user=user) | models.Q(verification__provider=user)
-            )
+            return queryset.filter(verification__provider=user)
         elif user.is_admin or user.is_staff:
             return queryset
         return queryset.none()
+
+
+class DocumentUploadViewSet(viewsets.GenericViewSet):
+    """
+    Resumable chunked upload of verification documents
+
+    POST creates a session, PUT chunk/ writes bytes at the Upload-Offset
+    header, GET reports how far the upload got so the client can resume,
+    and POST finalize/ turns the completed upload into a VerificationDocument.
+    """
+    queryset = DocumentUploadSession.objects.all()
+    serializer_class = DocumentUploadSessionSerializer
+    permission_classes = [IsAuthenticated]
+    lookup_field = 'uploadId'
+
+    def get_queryset(self):
+        """Users only see their own uploads"""
+        return super().get_queryset().filter(uploadedBy=self.request.user)
+
+    def create(self, request):
+        """Start a chunked upload"""
+        serializer = DocumentUploadInitSerializer(data=request.data, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        session = serializer.save()
+        uploads.create_part_file(session)
+
+        return Response(
+            DocumentUploadSessionSerializer(session).data,
+            status=status.HTTP_201_CREATED
+        )
+
+    def retrieve(self, request, uploadId=None):
+        """Get upload progress"""
+        return Response(DocumentUploadSessionSerializer(self.get_object()).data)
+
+    def destroy(self, request, uploadId=None):
+        """Abort an upload and discard the received bytes"""
+        session = self.get_object()
+        if session.status != 'uploading':
+            return Response(
+                {'error': 'Only unfinished uploads can be aborted'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        DocumentUploadSession.objects.filter(pk=session.pk, status='uploading').update(
+            status='aborted', updatedAt=timezone.now()
+        )
+        uploads.delete_part_file(session)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(detail=True, methods=['put'])
+    def chunk(self, request, uploadId=None):
+        """Write a chunk (raw request body) at the offset in the Upload-Offset header"""
+        try:
+            offset = int(request.headers.get('Upload-Offset', request.query_params.get('offset', '')))
+            length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            return Response(
+                {'error': 'Upload-Offset and Content-Length headers are required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            data = uploads.read_chunk(request.stream, length) if length else b''
+        except uploads.UploadError as e:
+            return Response({'error': e.message}, status=e.status)
+
+        with transaction.atomic():
+            # Serialize chunks of the same upload so receivedBytes stays contiguous
+            session = self.get_queryset().select_for_update().filter(uploadId=uploadId).first()
+            if session is None:
+                return Response({'error': 'Upload not found'}, status=status.HTTP_404_NOT_FOUND)
+            if session.status != 'uploading':
+                return Response(
+                    {'error': f'Upload is {session.status}'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            try:
+                received = uploads.write_chunk(session, offset, data)
+            except uploads.UploadError as e:
+                if e.status == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE:
+                    # A file of the wrong type can never complete
+                    session.status = 'aborted'
+                    session.save(update_fields=['status', 'updatedAt'])
+                    transaction.on_commit(lambda: uploads.delete_part_file(session))
+                return Response(
+                    {'error': e.message, 'receivedBytes': session.receivedBytes},
+                    status=e.status
+                )
+
+            session.receivedBytes = received
+            session.save(update_fields=['receivedBytes', 'contentType', 'updatedAt'])
+
+        return Response(
+            {'receivedBytes': session.receivedBytes, 'fileSize': session.fileSize},
+            status=status.HTTP_200_OK
+        )
+
+    @action(detail=True, methods=['post'])
+    def finalize(self, request, uploadId=None):
+        """Assemble the completed upload into a verification document"""
+        with transaction.atomic():
+            session = self.get_queryset().select_for_update().select_related('verification').filter(
+                uploadId=uploadId
+            ).first()
+            if session is None:
+                return Response({'error': 'Upload not found'}, status=status.HTTP_404_NOT_FOUND)
+            if session.status == 'completed':
+                # Retried finalize: return the document created the first time
+                return Response(
+                    VerificationDocumentSerializer(session.document).data,
+                    status=status.HTTP_200_OK
+                )
+            if session.status != 'uploading':
+                return Response(
+                    {'error': f'Upload is {session.status}'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if session.receivedBytes != session.fileSize or not session.contentType:
+                return Response(
+                    {'error': 'Upload is incomplete', 'receivedBytes': session.receivedBytes},
+                    status=status.HTTP_409_CONFLICT
+                )
+            if session.verification.status != 'pending':
+                return Response(
+                    {'error': 'Documents can only be uploaded for pending verifications'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            try:
+                uploads.check_part_file(session)
+            except uploads.UploadError as e:
+                session.status = 'aborted'
+                session.save(update_fields=['status', 'updatedAt'])
+                transaction.on_commit(lambda: uploads.delete_part_file(session))
+                return Response({'error': e.message}, status=e.status)
+
+            with uploads.assembled_file(session) as assembled:
+                document = VerificationDocument.objects.create(
+                    verification=session.verification,
+                    documentType=session.documentType,
+                    document=assembled,
+                    fileName=session.fileName,
+                    fileSize=session.fileSize
+                )
+
+            session.status = 'completed'
+            session.document = document
+            session.save(update_fields=['status', 'document', 'updatedAt'])
+            transaction.on_commit(lambda: uploads.delete_part_file(session))
+
+        return Response(
+            VerificationDocumentSerializer(document).data,
+            status=status.HTTP_201_CREATED
+        )
@@ -229,11 +229,11 @@ function AdminDashboard() {
                   pendingVerifications.map(item => (
                     <div key={item.id} className="verification-row">
                       <div className="ver-avatar">
-                        {(item.provider?.fullName || 'P').charAt(0).toUpperCase()}
+                        {(item.user_name || 'P').charAt(0).toUpperCase()}
                       </div>
                       <div className="ver-info">
-                        <div className="ver-name">{item.provider?.fullName || 'Provider'}</div>
-                        <div className="ver-category">{item.provider?.category || 'N/A'}</div>
+                        <div className="ver-name">{item.user_name || 'Provider'}</div>
+                        <div className="ver-category">{item.user_category || 'N/A'}</div>
                       </div>
                       <Link to="/admin/verifications">
                         <button className="btn-review">Review</button>
@@ -9,6 +9,8 @@ function VerificationManagement() {
   const [verifications, setVerifications] = useState([]);
   const [loading, setLoading] = useState(true);
   const [activeTab, setActiveTab] = useState('pending');
+  // Full verifications (documents, notes) loaded when a card is opened
+  const [details, setDetails] = useState({});
 
   useEffect(() => {
     fetchVerifications();
@@ -20,6 +22,7 @@ function VerificationManagement() {
       const response = await api.get('verifications/');
       const verificationsData = response.data.results || response.data || [];
       setVerifications(verificationsData);
+      setDetails({});
     } catch (error) {
       console.error('Error fetching verifications:', error);
     } finally {
@@ -27,6 +30,15 @@ function VerificationManagement() {
     }
   };
 
+  const loadDetails = async (id) => {
+    try {
+      const response = await api.get(`verifications/${id}/`);
+      setDetails(current => ({ ...current, [id]: response.data }));
+    } catch (error) {
+      console.error('Error fetching verification details:', error);
+    }
+  };
+
   const getTabCounts = () => ({
     all: verifications.length,
     pending: verifications.filter(v => v.status === 'pending').length,
@@ -135,11 +147,13 @@ function VerificationManagement() {
 
         <div className="verification-cards">
           {filteredVerifications.length > 0 ? (
-            filteredVerifications.map(verification => {
+            filteredVerifications.map(summary => {
+              const verification = { ...summary, ...details[summary.id] };
+              const loaded = Boolean(details[summary.id]);
               const provider = verification.provider || {};
-              const providerName = provider.fullName || 'N/A';
-              const providerEmail = provider.email || 'N/A';
-              const providerCategory = provider.category || 'N/A';
+              const providerName = provider.fullName || summary.user_name || 'N/A';
+              const providerEmail = provider.email;
+              const providerCategory = summary.user_category || summary.user_type || 'N/A';
 
               return (
                 <Card key={verification.id} className="verification-card">
@@ -151,7 +165,7 @@ function VerificationManagement() {
                       <div>
                         <h3>{providerName}</h3>
                         <p>{providerCategory}</p>
-                        <p className="provider-email">{providerEmail}</p>
+                        {providerEmail && <p className="provider-email">{providerEmail}</p>}
                       </div>
                     </div>
                     <div className="verification-meta">
@@ -164,7 +178,11 @@ function VerificationManagement() {
 
                   <div className="documents-section">
                     <h4>Submitted Documents:</h4>
-                    {verification.documents && verification.documents.length > 0 ? (
+                    {!loaded ? (
+                      <Button variant="outline" onClick={() => loadDetails(summary.id)}>
+                        View {summary.document_count} document{summary.document_count === 1 ? '' : 's'}
+                      </Button>
+                    ) : verification.documents && verification.documents.length > 0 ? (
                       <div className="documents-grid">
                         {verification.documents.map(doc => (
                           <div key={doc.id} className="document-item">